@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Micro benchmarks, run with ``python -m benchmarks.<name>``."""
+from __future__ import absolute_import, print_function
+
+from timeit import default_timer
+
+
+def best_of(func, repeat=3):
+    """Best wall time, in seconds, of ``repeat`` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = default_timer()
+        func()
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def report(title, rows, headers):
+    """Print benchmark rows as an aligned table."""
+    print(title)
+    print('=' * len(title))
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    for row in [headers] + list(rows):
+        print('  '.join(str(cell).rjust(width) for cell, width in zip(row, widths)))
+    print()
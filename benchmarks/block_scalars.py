@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Literal and folded block scalars, per line cost should stay flat as blocks grow."""
+from __future__ import absolute_import, print_function
+
+import pureyaml
+from benchmarks import best_of, report
+
+SIZES = 1000, 4000, 16000, 64000
+
+
+def block_text(indicator, size):
+    lines = ''.join('  line %d of a long embedded block\n' % i for i in range(size))
+    return 'block: %s\n%safter: value\n' % (indicator, lines)
+
+
+def main():
+    rows = []
+    for size in SIZES:
+        for name, indicator in (('literal', '|'), ('folded', '>')):
+            text = block_text(indicator, size)
+            seconds = best_of(lambda: pureyaml.loads(text))
+            rows.append((name, size, '%.3f' % seconds, '%.2f' % (seconds / size * 1e6)))
+
+    report('block scalars', rows, ('style', 'lines', 'seconds', 'us/line'))
+
+
+if __name__ == '__main__':
+    main()
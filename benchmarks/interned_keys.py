@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Retained memory of decoded record lists, with and without ``intern_keys`` and ``intern_values``."""
+from __future__ import absolute_import, print_function
+
+import pureyaml
+from benchmarks import best_of, report
+from benchmarks.shared_subtrees import retained, tracemalloc
+
+SIZES = 1000, 4000, 16000
+
+RECORD = """\
+- name: service%d
+  image: nginx
+  port: %d
+  protocol: tcp
+  restart: always
+"""
+
+OPTIONS = (  # :off
+    ('plain', {}),
+    ('keys', {'intern_keys': True}),
+    ('keys+values', {'intern_keys': True, 'intern_values': True}),
+)  # :on
+
+
+def document(size):
+    return ''.join(RECORD % (i, 8000 + i % 100) for i in range(size))
+
+
+def main():
+    # Guard, no tracemalloc
+    if tracemalloc is None:
+        print('interned keys: skipped, needs tracemalloc (Python 3.4+)')
+        return
+
+    pureyaml.loads('a: 1\n')
+
+    rows = []
+    for size in SIZES:
+        text = document(size)
+        for name, options in OPTIONS:
+            bytes_ = retained(lambda: pureyaml.loads(text, **options))
+            seconds = best_of(lambda: pureyaml.loads(text, **options))
+            rows.append((size, name, '%.0f' % (bytes_ / 1e3), '%.3f' % seconds))
+
+    report('interned keys', rows, ('records', 'interned', 'retained KB', 'seconds'))
+
+
+if __name__ == '__main__':
+    main()
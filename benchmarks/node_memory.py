@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Node tree memory, peak and retained, per MB of yaml input."""
+from __future__ import absolute_import, print_function
+
+import gc
+
+from benchmarks import report
+from pureyaml.parser import YAMLParser, YAMLPythonParser
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None  # Python < 3.4
+
+SIZES = 1000, 4000, 16000
+
+
+def document(size):
+    return ''.join('- name: item%d\n  port: %d\n  ratio: %d.5\n' % (i, i, i) for i in range(size))
+
+
+def measure(func):
+    """Peak and retained bytes allocated by ``func``."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, current
+
+
+def main():
+    # Guard, no tracemalloc
+    if tracemalloc is None:
+        print('node memory: skipped, needs tracemalloc (Python 3.4+)')
+        return
+
+    # Build parser tables first, they aren't part of the tree.
+    YAMLParser().parse('a: 1\n')
+    YAMLPythonParser().parse('a: 1\n')
+
+    rows = []
+    for size in SIZES:
+        text = document(size)
+        megabytes = len(text.encode('utf-8')) / 1e6
+        for name, parser in (('nodes', YAMLParser()), ('python', YAMLPythonParser())):
+            peak, retained = measure(lambda: parser.parse(text))
+            rows.append((name, size * 3, '%.0f' % (peak / megabytes / 1e6), '%.0f' % (retained / megabytes / 1e6)))
+
+    report('node memory', rows, ('build', 'scalars', 'peak MB/MB', 'retained MB/MB'))
+
+
+if __name__ == '__main__':
+    main()
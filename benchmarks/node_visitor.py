@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""NodeVisitor dispatch and trampoline cost, per node, over a one million node tree."""
+from __future__ import absolute_import, print_function
+
+from benchmarks import best_of, report
+from pureyaml.decoder import FastDecoder, YAMLDecoder
+from pureyaml.nodes import Float, Int, Map, NodeVisitor, Null, Sequence, Str
+
+ITEMS = 111111
+
+
+class NodeCounter(NodeVisitor):
+    def visit_Sequence(self, node):
+        count = 1
+        for item in node.value:
+            count += (yield item)
+        yield count
+
+    def visit_Map(self, node):
+        count = 1
+        for key, value in node.value:
+            count += (yield key) + (yield value)
+        yield count
+
+    def visit_Scalar(self, node):
+        return 1
+
+
+def tree(size):
+    """One sequence of ``size`` maps, 9 nodes each."""
+    return Sequence(*[  # :off
+        Map((Str('name'), Str('item%d' % i)), (Str('port'), Int(i)), (Str('ratio'), Float('%d.5' % i)),
+            (Str('note'), Null(None)))
+        for i in range(size)
+    ])  # :on
+
+
+def main():
+    node = tree(ITEMS)
+    nodes = NodeCounter().visit(node)
+
+    rows = []
+    for name, visitor in (('count', NodeCounter()), ('decode', YAMLDecoder()), ('fast', FastDecoder())):
+        seconds = best_of(lambda: visitor.visit(node))
+        rows.append((name, nodes, '%.3f' % seconds, '%.2f' % (seconds / nodes * 1e6)))
+
+    report('node visitor', rows, ('visitor', 'nodes', 'seconds', 'us/node'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Plain scalar resolution on key heavy configs, most scalars are keys and short strings."""
+from __future__ import absolute_import, print_function
+
+import pureyaml
+from benchmarks import best_of, report
+from pureyaml.nodes import ScalarDispatch
+
+SIZES = 1000, 4000, 16000
+
+
+def config(size):
+    """Service definitions, 8 keys each, with the usual mix of names, flags, counts and nulls."""
+    return ''.join(  # :off
+        'service%d:\n'
+        '  image: nginx\n'
+        '  enabled: true\n'
+        '  replicas: %d\n'
+        '  restart: always\n'
+        '  memory: 0.5\n'
+        '  offset: -1\n'
+        '  healthcheck: null\n'
+        '  port: 80\n' % (i, i % 3)
+        for i in range(size)
+    )  # :on
+
+
+def plain_scalars(size):
+    """Plain scalar texts, as the parser hands them to ``ScalarDispatch``."""
+    scalars = []
+    for line in config(size).splitlines():
+        key, _, value = line.strip().partition(':')
+        scalars.append(key)
+        if value:
+            scalars.append(value)
+    return scalars
+
+
+def main():
+    rows = []
+    for size in SIZES:
+        scalars = plain_scalars(size)
+        seconds = best_of(lambda: [ScalarDispatch(scalar) for scalar in scalars])
+        rows.append(('dispatch', len(scalars), '%.3f' % seconds, '%.2f' % (seconds / len(scalars) * 1e6)))
+
+        text = config(size)
+        seconds = best_of(lambda: pureyaml.loads(text))
+        rows.append(('loads', len(scalars), '%.3f' % seconds, '%.2f' % (seconds / len(scalars) * 1e6)))
+
+    report('scalar dispatch', rows, ('step', 'scalars', 'seconds', 'us/scalar'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Retained memory of decoded per-host configs, with and without ``share_identical``."""
+from __future__ import absolute_import, print_function
+
+import gc
+
+import pureyaml
+from benchmarks import best_of, report
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None  # Python < 3.4
+
+SIZES = 250, 1000, 4000
+
+HOST = """\
+host%d:
+  address: 10.0.%d.%d
+  logging:
+    level: info
+    targets: [syslog, file]
+  limits:
+    cpu: 2
+    memory: 4096
+  checks:
+    - name: http
+      interval: 30
+    - name: disk
+      interval: 300
+"""
+
+
+def document(size):
+    return ''.join(HOST % (i, i // 256, i % 256) for i in range(size))
+
+
+def retained(func):
+    """Bytes still allocated by the result of ``func``."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    # Guard, no tracemalloc
+    if tracemalloc is None:
+        print('shared subtrees: skipped, needs tracemalloc (Python 3.4+)')
+        return
+
+    pureyaml.loads('a: 1\n')
+
+    rows = []
+    for size in SIZES:
+        text = document(size)
+        for shared in (False, True):
+            bytes_ = retained(lambda: pureyaml.loads(text, share_identical=shared))
+            seconds = best_of(lambda: pureyaml.loads(text, share_identical=shared))
+            rows.append((size, shared, '%.0f' % (bytes_ / 1e3), '%.3f' % seconds))
+
+    report('shared subtrees', rows, ('hosts', 'shared', 'retained KB', 'seconds'))
+
+
+if __name__ == '__main__':
+    main()
@@ -10,13 +10,20 @@ Yet another yaml parser, in pure python.
 """
 from __future__ import absolute_import
 
+import io
 import logging
 
 from future.utils import string_types
 
 from ._compat import NullHandler
-from .decoder import YAMLDecoder
+# note: ``# noqa`` imports are re-exported, part of the public api.
+from .cache import ParseCache, PathCache  # noqa
+from .decoder import FastDecoder, YAMLDecoder  # noqa
+from .decoder import LazyMap, LazySequence  # noqa
 from .encoder import YAMLEncoder
+from .parser import MappedFile, YAMLEventParser, iter_document_texts
+from .pool import imap_documents, map_documents
+from .query import iter_selected
 
 logging.getLogger(__name__).addHandler(NullHandler())
 
@@ -49,18 +56,168 @@ def dumps(obj, indent=None, default=None, sort_keys=False, **kw):
     return YAMLEncoder(indent=indent, default=default, sort_keys=sort_keys, **kw).encode(obj)
 
 
-def load(s, **kwargs):
-    """Load yaml file"""
-    try:
-        return loads(s, **kwargs)
-    except TypeError:
-        return loads(s.read(), **kwargs)
+def load(s, cls=None, cache=None, **kwargs):
+    """
+    Load yaml file
+
+    File like objects are lexed in chunks, they aren't read into memory all at once.
+
+    :param s: Open file like object, or yaml text.
+    :param cls: Decoder class, default ``YAMLDecoder``.
+    :param ParseCache cache: Reuse results for text already loaded with the same options, the
+        file is read whole.
+    :return: Python object.
+    """
+    if isinstance(s, string_types):
+        return loads(s, cls=cls, cache=cache, **kwargs)
+
+    # Guard, cache keys need the whole text
+    if cache is not None:
+        return loads(s.read(), cls=cls, cache=cache, **kwargs)
+
+    cls = cls or YAMLDecoder
+    return cls(**kwargs).decode(s)
 
 
-def loads(s, cls=None, **kwargs):
-    """Load string"""
+def loads(s, cls=None, cache=None, **kwargs):
+    """
+    Load string
+
+    :param str s: Yaml text.
+    :param cls: Decoder class, default ``YAMLDecoder``, ``FastDecoder`` walks the node tree without generators.
+    :param str build: ``'nodes'`` (default) decodes a node tree, ``'python'`` builds python objects while parsing.
+    :param bool lazy: Return read only mapping and sequence proxies, decoding values on first access.
+    :param bool share_identical: Decode equal subtrees, in the same order, to one shared, read only, object.
+    :param bool intern_keys: Decode equal mapping keys to one shared string.
+    :param bool intern_values: Decode equal short string values to one shared string.
+    :param object_hook: Called with each decoded ``dict``, its result is used instead.
+    :param object_pairs_hook: Called with each mapping's list of ``(key, value)`` pairs, in document
+        order, its result is used instead.  Takes precedence over ``object_hook``.
+    :param sequence_hook: Called with each decoded ``list``, its result is used instead.
+    :param ParseCache cache: Reuse results for text already loaded with the same options.
+    :return: Python object.
+    """
     if not isinstance(s, string_types):
         raise TypeError('the YAML object must be str, not {0!r}'.format(s.__class__.__name__))
 
     cls = cls or YAMLDecoder
+    if cache is not None:
+        return cache.decode(s, cls, **kwargs)
     return cls(**kwargs).decode(s)
+
+
+def loads_many(iterable, workers=None, chunksize=1, cls=None, **kwargs):
+    """
+    Load many strings, like ``loads``, in a pool of warm worker processes.
+
+    Small batches are loaded in process.  Pools are kept for the next batch with the same options.
+
+    :param iterable: Yaml texts.
+    :param int workers: Number of worker processes, default loads in process.
+    :param int chunksize: Texts sent to a worker per task.
+    :param cls: Decoder class, default ``YAMLDecoder``.
+    :return: List of python objects, or the exception raised loading that text, in order.
+    """
+    return map_documents(iterable, workers, chunksize, cls, **kwargs)
+
+
+def load_path(path, mmap=False, cache_dir=None, cls=None, **kwargs):
+    """
+    Load yaml file, by path.
+
+    :param str path: Path to a utf-8 yaml file.
+    :param bool mmap: Memory map the file instead of reading it, for very large files.
+    :param str cache_dir: Keep decoded results in this directory, unchanged files aren't parsed again.  Can't be
+        used with ``lazy``.
+    :param cls: Decoder class, default ``YAMLDecoder``.
+    :return: Python object.
+    """
+    if cache_dir is not None:
+        return PathCache(cache_dir).decode_path(path, cls or YAMLDecoder, **kwargs)
+
+    fp = MappedFile(path) if mmap else io.open(path, encoding='utf-8')
+    with fp:
+        return load(fp, cls=cls, **kwargs)
+
+
+def load_all(fp, workers=None, **kwargs):
+    """
+    Load every document from a yaml file, one at a time.
+
+    Lines are read lazily, only the document being parsed is held in memory.
+
+    :param fp: Open file like object, or any iterable of lines.
+    :param int workers: Decode documents in this many processes, in parallel.  Order is kept.
+    :return: Iterator of python objects, one per document.
+    """
+    # Parallel, documents are independent
+    if workers:
+        for doc in imap_documents(iter_document_texts(fp), workers, **kwargs):
+            yield doc
+        return
+
+    for text in iter_document_texts(fp):
+        for doc in loads_all(text, **kwargs):
+            yield doc
+
+
+def loads_all(s, cls=None, **kwargs):
+    """
+    Load every document from a string.
+
+    :param str s: Yaml text.
+    :param cls: Decoder class, default ``YAMLDecoder``.
+    :return: Iterator of python objects, one per document.
+    """
+    if not isinstance(s, string_types):
+        raise TypeError('the YAML object must be str, not {0!r}'.format(s.__class__.__name__))
+
+    cls = cls or YAMLDecoder
+    return cls(**kwargs).iterdecode(s)
+
+
+def events(stream):
+    """
+    Parse incrementally, yield ``pureyaml.event`` objects as the grammar reduces them.
+
+    Documents, and the items of a collection at the root of a document, are emitted as soon as
+    they are parsed.  Stop iterating to stop parsing.
+
+    :param stream: Yaml string or file like object.
+    :return: Iterator of events.
+    """
+    return YAMLEventParser().iterparse(stream)
+
+
+def select(stream, path):
+    """
+    Get one value by path, only that value is built into python objects.
+
+    Events stream one item of the document's root collection at a time, each root item is still
+    parsed whole, and held as events, before it's matched.  For ``'spec.containers[0].image'``
+    all of ``spec`` is parsed, other root keys after it are not.
+
+    :param stream: Yaml string or file like object.
+    :param str path: Keys and indexes, like ``'spec.containers[0].image'``.
+    :return: Python object.
+    :raises KeyError: Path not found in the first document.
+    """
+    for _, value in iter_selected(events(stream), [path]):
+        return value
+
+    raise KeyError(path)
+
+
+def select_many(stream, paths):
+    """
+    Get values by path, only those values are built into python objects.  Parsing stops once every
+    path is found.
+
+    Events stream one item of the document's root collection at a time, each root item is still
+    parsed whole, and held as events, before it's matched, see ``select``.
+
+    :param stream: Yaml string or file like object.
+    :param paths: Paths, like ``'spec.containers[0].image'``.
+    :return: Dict of path to python object, paths not found in the first document are left out.
+    """
+    return dict(iter_selected(events(stream), paths))
@@ -36,6 +36,12 @@ except ImportError:
         Sequence = collections.Sequence
         MutableSequence = collections.MutableSequence
 
+try:
+    from collections import OrderedDict
+except ImportError:  # pragma: no cover
+    # Python 2.6
+    from future.backports.misc import OrderedDict
+
 try:
     from functools import total_ordering
 except ImportError:
@@ -46,4 +52,4 @@ try:
 except ImportError:
     from .singledispatch import singledispatch
 
-__all__ = ['NullHandler', 'collections_abc', 'total_ordering', 'singledispatch']
+__all__ = ['NullHandler', 'collections_abc', 'OrderedDict', 'total_ordering', 'singledispatch']
@@ -0,0 +1,240 @@
+# coding=utf-8
+"""Content addressed cache of decoded yaml."""
+from __future__ import absolute_import
+
+import inspect
+import io
+import os
+import pickle
+import threading
+from copy import deepcopy
+from hashlib import sha1
+from tempfile import NamedTemporaryFile
+
+from ._compat import OrderedDict
+
+
+# Decoder options that build containers freeze can't see into.
+hooks = 'object_hook', 'object_pairs_hook', 'sequence_hook'
+
+
+def immutable(*_, **__):
+    raise TypeError('cached yaml is immutable, copy it first')
+
+
+class FrozenDict(dict):
+    """Read only dict, copies are plain dicts again, pickles stay read only."""
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = immutable
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return dict((deepcopy(key, memo), deepcopy(value, memo)) for key, value in self.items())
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """Read only list, copies are plain lists again, pickles stay read only."""
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = immutable
+    __setslice__ = __delslice__ = immutable  # Python 2
+    append = extend = insert = pop = remove = reverse = sort = immutable
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [deepcopy(item, memo) for item in self]
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def freeze(obj):
+    """Read only copy of decoded yaml."""
+    if isinstance(obj, dict):
+        return FrozenDict((key, freeze(value)) for key, value in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(item) for item in obj)
+    return obj
+
+
+def read_text(data):
+    """Utf-8 text with universal newlines, the way ``io.open`` reads it."""
+    return io.IncrementalNewlineDecoder(None, translate=True).decode(data.decode('utf-8'), final=True)
+
+
+def callable_name(obj):
+    """``module:qualified.name`` of a module level function or class, ``None`` for lambdas, locals and others."""
+    if not (inspect.isfunction(obj) or inspect.isclass(obj)):
+        return None
+
+    name = getattr(obj, '__qualname__', obj.__name__)
+    if '<' in name:
+        return None
+    return '%s:%s' % (obj.__module__, name)
+
+
+class ParseCache(object):
+    """
+    LRU cache of decoded yaml, keyed by a digest of the text and the decoder options.
+
+    Cached objects are never handed out directly.  In ``'deepcopy'`` mode every caller gets its
+    own copy, in ``'immutable'`` mode every caller shares one read only copy.
+
+    :param int max_entries: Evict least recently used entries past this many, ``None`` for no limit.
+    :param int max_bytes: Evict least recently used entries past this much yaml text, ``None`` for no
+        limit.
+    :param str mode: ``'deepcopy'`` (default) or ``'immutable'``.  ``'immutable'`` can't be used with
+        ``object_hook``, ``object_pairs_hook`` or ``sequence_hook``.
+    """
+    modes = 'deepcopy', 'immutable'
+
+    def __init__(self, max_entries=128, max_bytes=None, mode='deepcopy'):
+        if mode not in self.modes:
+            raise ValueError('Unknown mode %r, expected one of %r' % (mode, self.modes))
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.mode = mode
+
+        # note: one lock for entries, size and counters, decoding runs under it too.
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        """Drop every entry, counters are kept."""
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def key(self, s, cls, kwargs):
+        data = s if isinstance(s, bytes) else s.encode('utf-8')
+        return sha1(data).digest(), len(data), cls, tuple(sorted(kwargs.items()))
+
+    def decode(self, s, cls, **kwargs):
+        """Decode with ``cls(**kwargs)``, or reuse the cached result of the same text and options."""
+        # Guard, hook containers would be shared and stay mutable
+        if self.mode == 'immutable' and any(kwargs.get(name) is not None for name in hooks):
+            raise ValueError('Decoder hooks can not be used with an immutable cache, use mode="deepcopy"')
+
+        key = self.key(s, cls, kwargs)
+        with self.lock:
+            try:
+                obj = self.entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                obj = cls(**kwargs).decode(s)
+                if self.mode == 'immutable':
+                    obj = freeze(obj)
+                self.size += key[1]
+            else:
+                self.hits += 1
+
+            # Most recently used, last
+            self.entries[key] = obj
+            self.evict()
+
+        if self.mode == 'deepcopy':
+            return deepcopy(obj)
+        return obj
+
+    def evict(self):
+        """Drop least recently used entries past the limits, the caller holds ``lock``."""
+        entries = self.entries
+        while entries and (  # :off
+            self.max_entries is not None and len(entries) > self.max_entries or
+            self.max_bytes is not None and self.size > self.max_bytes
+        ):  # :on
+            key, _ = entries.popitem(last=False)
+            self.size -= key[1]
+
+    def __repr__(self):
+        return '<%s entries=%d bytes=%d hits=%d misses=%d>' % (  # :off
+            self.__class__.__name__, len(self.entries), self.size, self.hits, self.misses
+        )  # :on
+
+
+class PathCache(object):
+    """
+    Decoded yaml files, pickled to a directory.
+
+    Entries are named by the file's absolute path and the decoder options, and record the
+    file's size, mtime and content digest.  A file that no longer matches, or an unreadable
+    entry, is decoded again and the entry rewritten.  Hooks are named by module and qualified
+    name, files loaded with a lambda, a local decoder class or other unnamed callable are decoded
+    without an entry.
+
+    :param str cache_dir: Directory for cache entries, created if missing.
+    """
+    version = 1
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def entry_path(self, path, cls, kwargs):
+        """Entry for the file, decoder and options, ``None`` if the decoder or an option has no stable name."""
+        cls_name = callable_name(cls)
+        if cls_name is None:
+            return None
+
+        options = []
+        for name, value in sorted(kwargs.items()):
+            # note: a callable's repr holds its address, new in every process.
+            if callable(value):
+                value = callable_name(value)
+                if value is None:
+                    return None
+            options.append((name, value))
+
+        key = repr((self.version, os.path.abspath(path), cls_name, options))
+        return os.path.join(self.cache_dir, sha1(key.encode('utf-8')).hexdigest() + '.pickle')
+
+    def decode_path(self, path, cls, **kwargs):
+        """Decode the file with ``cls(**kwargs)``, or load the cached result if the file is unchanged."""
+        # Guard, lazy proxies pickle the decoder and node tree along with them
+        if kwargs.get('lazy'):
+            raise ValueError('Lazy results can not be cached, load them without cache_dir')
+
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+
+        # Guard, local decoders and hooks like lambdas can't be told apart across processes, decode without an entry
+        entry_path = self.entry_path(path, cls, kwargs)
+        if entry_path is None:
+            return cls(**kwargs).decode(read_text(data))
+
+        header = self.version, stat.st_size, stat.st_mtime, sha1(data).hexdigest()
+
+        try:
+            with open(entry_path, 'rb') as f:
+                # Guard, stale entry
+                if pickle.load(f) == header:
+                    return pickle.load(f)
+        # note: any entry that doesn't load, like one naming a class that no longer imports, is rebuilt.
+        except Exception:
+            pass
+
+        obj = cls(**kwargs).decode(read_text(data))
+        self.write(entry_path, header, obj)
+        return obj
+
+    def write(self, entry_path, header, obj):
+        """Write an entry atomically, readers never see half of one."""
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+        with NamedTemporaryFile('wb', dir=self.cache_dir, delete=False) as f:
+            pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
+
+        getattr(os, 'replace', os.rename)(f.name, entry_path)
@@ -3,35 +3,216 @@
 
 from __future__ import absolute_import
 
-from .nodes import NodeVisitor
-from .parser import YAMLParser
+from future.utils import string_types
+
+from ._compat import collections_abc as abc
+from .cache import FrozenDict, FrozenList
+from .nodes import Doc, Docs, Map, NodeVisitor, Sequence
+from .parser import YAMLParser, YAMLPythonParser, YAMLPythonStreamParser, YAMLStreamParser
+
+undecoded = object()
+nothing = object()
+
+
+class LazyMap(abc.Mapping):
+    """
+    Read only mapping over a ``Map`` node, values are decoded on first access.
+
+    Keys are decoded up front, they're needed to look anything up.
+    """
+
+    def __init__(self, node, decoder):
+        self.decoder = decoder
+        self.nodes = {}
+        for key, value in node.value:
+            key = decoder.visit(key)
+            if decoder.intern_keys:
+                key = decoder.intern(key)
+            self.nodes[key] = value
+        self.values = {}
+
+    def __getitem__(self, key):
+        try:
+            return self.values[key]
+        except KeyError:
+            value = self.values[key] = self.decoder.visit(self.nodes[key])
+            return value
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __contains__(self, key):
+        return key in self.nodes
+
+    def __repr__(self):
+        return '<%s keys=%r>' % (self.__class__.__name__, list(self.nodes))
+
+
+class LazySequence(abc.Sequence):
+    """Read only sequence over a ``Sequence`` node, items are decoded on first access."""
+
+    def __init__(self, node, decoder):
+        self.decoder = decoder
+        self.nodes = node.value
+        self.items = [undecoded] * len(self.nodes)
+
+    def __getitem__(self, index):
+        # Guard, slice
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        item = self.items[index]
+        if item is undecoded:
+            item = self.items[index] = self.decoder.visit(self.nodes[index])
+        return item
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, LazySequence)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):
+        return '<%s len=%d>' % (self.__class__.__name__, len(self))
 
 
 # noinspection PyMethodMayBeStatic
 class YAMLDecoder(NodeVisitor):
     """Convert node tree into python object."""
+    builds = 'nodes', 'python'
+
+    # Longest string value interned with ``intern_values``, longer ones are rarely repeated.
+    intern_max_length = 32
+
+    def __init__(self, build='nodes', lazy=False, share_identical=False, intern_keys=False, intern_values=False,
+                 object_hook=None, object_pairs_hook=None, sequence_hook=None, **kwargs):
+        super(YAMLDecoder, self).__init__(**kwargs)
+        hooks = object_hook or object_pairs_hook or sequence_hook
+        if build not in self.builds:
+            raise ValueError('Unknown build %r, expected one of %r' % (build, self.builds))
+        if (lazy or share_identical or intern_keys or intern_values or hooks) and build != 'nodes':
+            raise ValueError('Lazy, shared, interned and hooked decoding need the node tree, use build=%r' % 'nodes')
+        if lazy and share_identical:
+            raise ValueError('Lazy decoding can not share identical subtrees')
+        if hooks and (lazy or share_identical):
+            raise ValueError('Lazy and shared decoding build their own containers, they can not take hooks')
+        self.build = build
+        self.lazy = lazy
+
+        # Called with each decoded container, like ``json``, their result takes its place.
+        self.object_hook = object_hook
+        self.object_pairs_hook = object_pairs_hook
+        self.sequence_hook = sequence_hook
+
+        # Scalar node, or collection type and item identities, to its one shared decoded object.
+        self.shared = {} if share_identical else None
+
+        # String to its first decoded copy, equal keys (and short values) decode to one string.
+        self.interned = {} if intern_keys or intern_values else None
+        self.intern_keys = intern_keys
+        self.intern_values = intern_values
 
     def decode(self, s):
+        # Fast path, python objects built by the parser, ``visit_*`` methods are skipped.
+        if self.build == 'python':
+            return YAMLPythonParser().parse(s)
+
         return self.visit(YAMLParser().parse(s))
 
+    def iterdecode(self, s):
+        """Decode every document, yield each one as soon as it is parsed."""
+        # Fast path, python objects built by the parser, ``visit_*`` methods are skipped.
+        if self.build == 'python':
+            for doc in YAMLPythonStreamParser().iterparse(s):
+                yield doc
+            return
+
+        for doc in YAMLStreamParser().iterparse(s):
+            yield self.visit(doc)
+
     def visit_Docs(self, node):
         for doc in node.value:
             yield (yield doc)
 
     def visit_Sequence(self, node):
+        # Guard, decode items on access
+        if self.lazy:
+            return LazySequence(node, self)
+        if self.shared is not None:
+            return self.share(self.decode_sequence(node), FrozenList)
+        return self.decode_sequence(node)
+
+    def decode_sequence(self, node):
         sequence = []
         for item in node.value:
             sequence.append((yield item))
-        yield sequence
+        yield sequence if self.sequence_hook is None else self.sequence_hook(sequence)
 
     def visit_Map(self, node):
+        # Guard, decode values on access
+        if self.lazy:
+            return LazyMap(node, self)
+        if self.shared is not None:
+            return self.share(self.decode_map(node), FrozenDict)
+        # Guard, pairs hook, takes precedence over the object hook
+        if self.object_pairs_hook is not None:
+            return self.decode_pairs(node)
+        return self.decode_map(node)
+
+    def decode_map(self, node):
         _map = {}
         for key, value in node.value:
-            _map[(yield key)] = (yield value)
-        yield _map
+            key = yield key
+            if self.intern_keys:
+                key = self.intern(key)
+            _map[key] = yield value
+        yield _map if self.object_hook is None else self.object_hook(_map)
+
+    def decode_pairs(self, node):
+        pairs = []
+        for key, value in node.value:
+            key = yield key
+            if self.intern_keys:
+                key = self.intern(key)
+            pairs.append((key, (yield value)))
+        yield self.object_pairs_hook(pairs)
+
+    def intern(self, value):
+        """First decoded copy of an equal string, anything else as is."""
+        if not isinstance(value, string_types):
+            return value
+        return self.interned.setdefault(value, value)
+
+    def share(self, decoded, frozen):
+        """Equal subtrees, in the same document order, get one shared, read only, object."""
+        value = yield decoded
+
+        # note: items are already shared, their identities stand for their structure and order.
+        if isinstance(value, dict):
+            key = frozen, tuple((id(item_key), id(item)) for item_key, item in value.items())
+        else:
+            key = frozen, tuple(id(item) for item in value)
+
+        shared = self.shared.get(key)
+        if shared is None:
+            shared = self.shared[key] = frozen(value)
+        yield shared
 
     def visit_Scalar(self, node):
-        return node.type(node.value)
+        value = node.type(node.value)
+        if self.intern_values and isinstance(value, string_types) and len(value) <= self.intern_max_length:
+            value = self.interned.setdefault(value, value)
+        if self.shared is not None:
+            return self.shared.setdefault(node, value)
+        return value
 
     def visit_Null(self, _):
         return None
@@ -44,3 +225,127 @@ class YAMLDecoder(NodeVisitor):
 
     def visit_Binary(self, node):
         return node.value
+
+
+class FastDecoder(YAMLDecoder):
+    """
+    Convert node tree into python object, walking collections with an explicit work stack.
+
+    Each open collection is one frame on a list, instead of a generator resumed through the
+    ``NodeVisitor`` trampoline once per child.  Nesting depth is bound by memory, not the recursion
+    limit.  Scalars still go through ``visit_*`` methods.  Lazy and shared decoding fall back to
+    ``YAMLDecoder``.
+    """
+    SEQUENCE, MAP, PAIRS, LAST = 'sequence', 'map', 'pairs', 'last'
+    frames = (Map, MAP), (Sequence, SEQUENCE), (Doc, LAST), (Docs, LAST)
+
+    @classmethod
+    def frame_table(cls):
+        """Frame kind and visit method per node type, resolved once per decoder class."""
+        # Guard, a subclass must not share its parent's table
+        table = cls.__dict__.get('_frames')
+        if table is None:
+            table = {}
+            setattr(cls, '_frames', table)
+        return table
+
+    @classmethod
+    def resolve_frame(cls, node_type):
+        """
+        ``(kind, None)`` for collections walked here, ``(None, method)`` for anything else.
+
+        A collection whose ``visit_*`` method is overridden is handed to the ``NodeVisitor`` trampoline.
+        """
+        method = cls.resolve(node_type)
+        entry = None, method
+        for node_class, kind in cls.frames:
+            if issubclass(node_type, node_class):
+                default = getattr(YAMLDecoder, 'visit_%s' % node_class.__name__)
+                entry = (kind, None) if function_of(method) is function_of(default) else (None, NodeVisitor.visit)
+                break
+
+        cls.frame_table()[node_type] = entry
+        return entry
+
+    def visit(self, node):
+        # Guard, lazy and shared decoding build their own containers
+        if self.lazy or self.shared is not None:
+            return super(FastDecoder, self).visit(node)
+
+        table = self.frame_table()
+
+        # Hooks run as their frame closes, maps collect a list of pairs for ``object_pairs_hook``.
+        hooks = {self.SEQUENCE: self.sequence_hook, self.MAP: self.object_hook, self.PAIRS: self.object_pairs_hook}
+
+        # Frames are [kind, container, children, key], the root frame keeps the last value handed in.
+        stack = [[self.LAST, None, iter((node,)), None]]
+        value = nothing
+        while stack:
+            frame = stack[-1]
+            if value is not nothing:
+                self.fold(frame, value)
+
+            child = self.next_child(frame)
+            if child is nothing:
+                value = self.close(stack.pop(), hooks)
+                continue
+
+            child_kind, method = table.get(type(child)) or self.resolve_frame(type(child))
+
+            # Guard, scalar, decode in place
+            if child_kind is None:
+                value = method(self, child)
+                continue
+
+            stack.append(self.open_frame(child_kind, child))
+            value = nothing
+        return value
+
+    def fold(self, frame, value):
+        """Add a decoded child to its frame's container, the root frame just keeps it."""
+        kind = frame[0]
+        if kind is self.SEQUENCE:
+            frame[1].append(value)
+        elif kind is self.MAP:
+            frame[1][frame[3]] = value
+        elif kind is self.PAIRS:
+            frame[1].append((frame[3], value))
+        else:
+            frame[1] = value
+
+    def next_child(self, frame):
+        """Next child node of a frame, ``nothing`` once done.  A map child's key is decoded onto the frame."""
+        child = next(frame[2], nothing)
+        if child is not nothing and frame[0] in (self.MAP, self.PAIRS):
+            key, child = child
+            frame[3] = self.visit_key(key)
+        return child
+
+    def open_frame(self, kind, node):
+        """New frame for a collection node, with an empty container of its kind."""
+        if kind is self.MAP and self.object_pairs_hook is not None:
+            kind = self.PAIRS
+        container = {} if kind is self.MAP else None if kind is self.LAST else []
+        return [kind, container, iter(node.value), None]
+
+    def close(self, frame, hooks):
+        """Finished container of a frame, passed through its kind's hook."""
+        hook = hooks.get(frame[0])
+        return frame[1] if hook is None else hook(frame[1])
+
+    def visit_key(self, node):
+        """Map keys are scalars in practice, anything else goes through ``visit``."""
+        try:
+            kind, method = self.frame_table()[type(node)]
+        except KeyError:
+            kind, method = self.resolve_frame(type(node))
+
+        key = method(self, node) if kind is None else self.visit(node)
+        if self.intern_keys:
+            key = self.intern(key)
+        return key
+
+
+def function_of(method):
+    """Plain function behind a method, Python 2 unbound methods differ per class."""
+    return getattr(method, '__func__', method)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""Event definitions for incremental, SAX style parsing."""
+from __future__ import absolute_import
+
+
+class Event(object):
+    def __eq__(self, other):
+        return type(self) == type(other) and vars(self) == vars(other)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):
+        return '<%s>' % self.__class__.__name__
+
+
+class DocumentStart(Event):
+    pass
+
+
+class DocumentEnd(Event):
+    pass
+
+
+class MappingStart(Event):
+    pass
+
+
+class MappingEnd(Event):
+    pass
+
+
+class SequenceStart(Event):
+    pass
+
+
+class SequenceEnd(Event):
+    pass
+
+
+class Scalar(Event):
+    def __init__(self, value, tag):
+        self.value = value
+        self.tag = tag
+
+    def __repr__(self):
+        return '<%s:%r !!%s>' % (self.__class__.__name__, self.value, self.tag)
+
+
+__all__ = ['Event', 'DocumentStart', 'DocumentEnd', 'MappingStart', 'MappingEnd', 'SequenceStart', 'SequenceEnd',
+           'Scalar']
@@ -2,9 +2,18 @@
 # coding=utf-8
 from __future__ import absolute_import
 
+from copy import copy
 from textwrap import dedent
 
 
+def restore(cls, state):
+    """Unpickle an exception, without calling ``__init__`` again."""
+    error = cls.__new__(cls)
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
+
+
 class YAMLException(Exception):
     """Base exception for package"""
     def __init__(self, message):
@@ -14,6 +23,9 @@ class YAMLException(Exception):
         if self.message:
             return str(self.message)
 
+    def __reduce__(self):
+        return restore, (self.__class__, vars(self))
+
 
 class YAMLUnknownSyntaxError(SyntaxError, YAMLException):
     """Unexpected syntax error"""
@@ -30,6 +42,12 @@ class YAMLSyntaxError(SyntaxError, YAMLException):
         self.offset = len(repr(p.lexer.lexdata[:p.lexpos])[1:-1])
         self.input = repr(p.lexer.lexdata)[1:-1]
 
+    def __reduce__(self):
+        # Tokens keep their lexer, which can't be pickled, the message doesn't need it.
+        state = dict(vars(self), offset=self.offset, token=copy(self.token))
+        vars(state['token']).pop('lexer', None)
+        return restore, (self.__class__, state)
+
     def msg_lines(self):
         yield 'unexpected: %r\n' % self.token
 
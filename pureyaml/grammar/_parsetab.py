@@ -5,9 +5,9 @@ _tabversion = '3.8'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'E219AC676344FBC844DD1803824C8948'
+_lr_signature = '179F288828597273472E6F6AA88A4D2C'
     
-_lr_action_items = {'B_FOLD_END':([41,42,70,],[76,-43,-44,]),'B_MAP_COMPACT_VALUE':([6,12,14,29,32,36,44,48,54,55,59,66,69,76,78,80,87,93,95,96,97,],[39,-18,-38,-36,-18,-38,-17,-35,-37,-18,-9,-34,-41,-40,-39,-33,-29,-18,-38,-19,-42,]),'SINGLEQUOTE_START':([0,1,3,4,5,8,9,11,12,13,14,15,17,18,19,20,21,22,23,24,25,26,27,28,29,34,38,39,40,43,45,48,50,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,83,84,85,86,88,89,90,91,92,97,99,102,103,104,105,],[2,2,-25,2,2,2,-1,-12,-8,-7,-38,-13,2,2,2,2,2,2,2,2,-10,2,-32,-27,-36,-45,-15,2,2,2,-2,-35,2,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,2,-21,-22,-24,-40,-39,-33,-56,-48,2,2,-46,2,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'F_MAP_END':([14,29,48,52,53,54,59,66,69,76,78,80,81,82,85,97,98,],[-38,-36,-35,-53,84,-37,-9,-34,-41,-40,-39,-33,-55,-57,99,-42,-54,]),'DEDENT':([3,5,11,12,13,14,15,20,25,26,27,28,29,31,33,35,36,37,38,42,43,48,54,56,57,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,88,90,91,92,93,94,95,97,99,100,102,103,104,105,],[-25,34,-12,-8,-7,-38,-13,-11,-10,34,-32,-27,-36,34,67,68,-38,69,-15,-43,34,-35,-37,87,-14,-9,-5,-26,91,-34,-31,-6,-41,-44,92,34,-21,-22,-24,-40,96,-39,97,-33,-48,-46,-4,-28,-30,103,104,-38,-42,-49,105,-47,-23,-20,-16,]),'$end':([3,9,11,12,13,14,15,20,21,25,27,28,29,38,45,48,54,57,58,59,63,64,66,67,68,69,73,74,75,76,78,80,84,88,90,91,92,97,99,102,103,104,105,],[-25,-1,-12,-8,-7,-38,-13,-11,0,-10,-32,-27,-36,-15,-2,-35,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,-21,-22,-24,-40,-39,-33,-48,-46,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'INDENT':([0,1,3,4,5,8,9,11,12,13,14,15,17,18,19,20,21,22,23,24,25,26,27,28,29,32,34,36,38,39,40,43,44,45,48,50,51,54,55,57,58,59,62,63,64,66,67,68,69,72,73,74,75,76,78,80,82,83,84,85,86,88,89,90,91,92,93,95,97,99,100,102,103,104,105,],[5,26,-25,31,5,43,-1,-12,47,-7,-38,-13,31,31,31,31,5,31,31,5,-10,31,-32,47,-36,47,-45,-38,-15,31,72,31,47,-2,-35,31,47,47,47,-14,-3,47,47,-5,-26,-34,-31,-6,-41,31,-21,47,-24,-40,-39,-33,47,-56,-48,31,31,-46,31,-4,-28,-30,47,-38,-42,-49,47,-47,-23,-20,-16,]),'B_SEQUENCE_COMPACT_START':([0,3,4,5,9,11,12,13,14,15,19,20,21,24,25,26,27,28,29,38,39,40,43,45,48,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,84,88,90,91,92,97,99,102,103,104,105,],[4,-25,4,4,-1,-12,-8,-7,-38,-13,4,-11,4,4,4,4,-32,-27,-36,-15,4,4,4,-2,-35,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,4,-21,-22,4,-40,-39,-33,-48,-46,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'F_MAP_KEY':([14,29,48,51,54,59,66,69,76,78,80,97,],[-38,-36,-35,83,-37,-9,-34,-41,-40,-39,-33,-42,]),'F_MAP_START':([0,1,3,4,5,9,11,12,13,14,15,19,20,21,24,25,26,27,28,29,38,39,40,43,45,48,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,84,88,90,91,92,97,99,102,103,104,105,],[17,17,-25,17,17,-1,-12,-8,-7,-38,-13,17,-11,17,17,-10,17,-32,-27,-36,-15,17,17,17,-2,-35,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,17,-21,-22,-24,-40,-39,-33,-48,-46,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'B_SEQUENCE_START':([0,3,4,5,9,11,12,13,14,15,19,20,21,24,25,26,27,28,29,38,39,40,43,45,48,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,84,88,90,91,92,97,99,102,103,104,105,],[1,-25,1,1,-1,-12,-8,-7,-38,-13,1,-11,1,1,1,1,-32,-27,-36,-15,1,1,1,-2,-35,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,1,-21,-22,1,-40,-39,-33,-48,-46,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'B_LITERAL_START':([0,1,3,4,5,8,9,11,12,13,14,15,17,18,19,20,21,22,23,24,25,26,27,28,29,34,38,39,40,43,45,48,50,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,83,84,85,86,88,89,90,91,92,97,99,102,103,104,105,],[10,10,-25,10,10,10,-1,-12,-8,-7,-38,-13,10,10,10,10,10,10,10,10,-10,10,-32,-27,-36,-45,-15,10,10,10,-2,-35,10,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,10,-21,-22,-24,-40,-39,-33,-56,-48,10,10,-46,10,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'DOC_END':([3,9,11,12,13,14,15,20,25,27,28,29,38,48,54,57,59,63,64,66,67,68,69,73,74,75,76,78,80,84,88,90,91,92,97,99,102,103,104,105,],[-25,45,-12,-8,-7,-38,-13,-11,-10,-32,-27,-36,-15,-35,-37,-14,-9,90,-26,-34,-31,-6,-41,-21,-22,-24,-40,-39,-33,-48,-46,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'B_MAP_KEY':([0,3,4,5,9,11,12,13,14,15,19,20,21,24,25,26,27,28,29,38,39,43,45,48,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,84,88,90,91,92,97,99,102,103,104,105,],[8,-25,8,8,-1,-12,-8,-7,-38,-13,8,8,8,8,-10,8,-32,-27,-36,-15,8,8,-2,-35,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,8,-21,-22,-24,-40,-39,-33,-48,-46,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'SCALAR':([0,1,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,31,34,36,37,38,39,40,41,42,43,45,46,47,48,50,54,57,58,59,63,64,66,67,68,69,70,72,73,74,75,76,78,80,83,84,85,86,88,89,90,91,92,95,97,99,102,103,104,105,],[14,14,30,-25,14,36,42,14,-1,42,-12,-8,-7,-38,-13,49,14,14,14,14,14,14,14,14,-10,36,-32,-27,-36,42,-45,-43,70,-15,14,14,70,-43,36,-2,70,79,-35,14,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,-44,95,-21,-22,-24,-40,-39,-33,-56,-48,14,14,-46,14,-4,-28,-30,-43,-42,-49,-47,-23,-20,-16,]),'B_LITERAL_END':([42,46,70,],[-43,78,-44,]),'F_SEQUENCE_END':([14,29,48,54,59,60,61,62,66,69,76,78,80,89,97,101,],[-38,-36,-35,-37,-9,-50,88,-52,-34,-41,-40,-39,-33,102,-42,-51,]),'DOUBLEQUOTE_END':([16,49,],[48,80,]),'DOUBLEQUOTE_START':([0,1,3,4,5,8,9,11,12,13,14,15,17,18,19,20,21,22,23,24,25,26,27,28,29,34,38,39,40,43,45,48,50,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,83,84,85,86,88,89,90,91,92,97,99,102,103,104,105,],[16,16,-25,16,16,16,-1,-12,-8,-7,-38,-13,16,16,16,16,16,16,16,16,-10,16,-32,-27,-36,-45,-15,16,16,16,-2,-35,16,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,16,-21,-22,-24,-40,-39,-33,-56,-48,16,16,-46,16,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'CAST_TYPE':([0,1,3,4,5,8,9,11,12,13,14,15,17,18,19,20,21,22,23,24,25,26,27,28,29,34,38,39,40,43,45,48,50,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,83,84,85,86,88,89,90,91,92,97,99,102,103,104,105,],[18,18,-25,18,18,18,-1,-12,-8,-7,-38,-13,18,18,18,18,18,18,18,18,-10,18,-32,-27,-36,-45,-15,18,18,18,-2,-35,18,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,18,-21,-22,-24,-40,-39,-33,-56,-48,18,18,-46,18,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'B_MAP_COMPACT_KEY':([0,3,4,5,9,11,12,13,14,15,19,20,21,24,25,26,27,28,29,38,39,43,45,48,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,84,88,90,91,92,97,99,102,103,104,105,],[19,-25,19,19,-1,-12,-8,-7,-38,-13,19,19,19,19,-10,19,-32,-27,-36,-15,19,19,-2,-35,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,19,-21,-22,-24,-40,-39,-33,-48,-46,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'B_MAP_VALUE':([6,12,14,29,32,36,44,48,54,55,59,66,69,76,78,80,87,93,95,96,97,],[40,-18,-38,-36,-18,-38,-17,-35,-37,86,-9,-34,-41,-40,-39,-33,-29,-18,-38,-19,-42,]),'B_FOLD_START':([0,1,3,4,5,8,9,11,12,13,14,15,17,18,19,20,21,22,23,24,25,26,27,28,29,34,38,39,40,43,45,48,50,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,83,84,85,86,88,89,90,91,92,97,99,102,103,104,105,],[7,7,-25,7,7,7,-1,-12,-8,-7,-38,-13,7,7,7,7,7,7,7,7,-10,7,-32,-27,-36,-45,-15,7,7,7,-2,-35,7,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,7,-21,-22,-24,-40,-39,-33,-56,-48,7,7,-46,7,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'F_SEQUENCE_START':([0,1,3,4,5,9,11,12,13,14,15,19,20,21,24,25,26,27,28,29,38,39,40,43,45,48,54,57,58,59,63,64,66,67,68,69,72,73,74,75,76,78,80,84,88,90,91,92,97,99,102,103,104,105,],[23,23,-25,23,23,-1,-12,-8,-7,-38,-13,23,-11,23,23,-10,23,-32,-27,-36,-15,23,23,23,-2,-35,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,23,-21,-22,-24,-40,-39,-33,-48,-46,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'DOC_START':([0,3,5,9,11,12,13,14,15,20,21,24,25,27,28,29,38,45,48,54,57,58,59,63,64,66,67,68,69,73,74,75,76,78,80,84,88,90,91,92,97,99,102,103,104,105,],[24,-25,24,-1,-12,-8,-7,-38,-13,-11,24,24,-10,-32,-27,-36,-15,-2,-35,-37,-14,-3,-9,-5,-26,-34,-31,-6,-41,-21,-22,-24,-40,-39,-33,-48,-46,-4,-28,-30,-42,-49,-47,-23,-20,-16,]),'F_SEP':([14,29,48,52,53,54,59,60,61,62,66,69,76,78,80,81,82,97,98,101,],[-38,-36,-35,-53,85,-37,-9,-50,89,-52,-34,-41,-40,-39,-33,-55,-57,-42,-54,-51,]),'SINGLEQUOTE_END':([2,30,],[29,66,]),}
+_lr_action_items = {'DOC_START':([0,2,3,4,5,6,7,8,9,10,11,18,19,27,28,30,35,36,40,41,45,47,57,58,59,67,68,69,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[6,6,-10,-4,-5,6,6,-1,-2,-3,-39,-52,-25,-9,-11,-7,-51,-24,-45,-41,-46,-57,-54,-55,-26,-6,-8,-43,-40,-42,-44,-47,-12,-14,-32,-35,-36,-38,-48,-13,-15,-53,-31,-28,-37,-29,]),'INDENT':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,34,35,36,37,40,41,45,47,50,53,54,56,57,58,59,60,61,62,64,65,67,68,69,71,72,73,74,75,76,77,78,80,81,82,84,85,86,87,89,92,93,95,97,99,100,101,102,104,105,106,],[7,7,-10,-4,29,7,7,-1,38,-3,-39,38,38,-52,-25,38,38,38,56,38,64,-9,-11,-7,-58,-39,-51,-24,29,-45,29,-46,29,29,38,29,38,-54,29,-26,84,38,29,38,29,-6,-8,-43,-40,-42,-44,-47,-12,38,-14,38,29,-19,-32,38,-35,29,-38,38,-48,-13,-15,-53,29,-39,-31,29,-28,-37,-29,]),'SCALAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,30,32,33,34,35,36,38,40,41,42,43,44,45,47,53,56,57,58,59,60,61,64,67,68,69,70,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,100,101,104,105,106,],[11,11,-10,-4,-5,11,34,-1,11,-3,-39,39,11,43,43,46,11,-52,-25,11,11,11,11,11,11,-9,-11,66,-7,-58,70,-49,-51,-24,43,-45,-41,70,-49,70,-46,-57,11,34,-54,-55,-26,11,11,34,-6,-8,-43,-50,-40,-42,-44,-47,-12,11,-14,11,-19,-32,100,-35,-36,-38,11,-48,-13,-15,-53,-49,-31,-28,-37,-29,]),'DOUBLEQUOTE_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,35,36,40,41,45,47,53,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[12,12,-10,-4,-5,12,12,-1,12,-3,-39,12,12,-52,-25,12,12,12,12,12,12,-9,-11,-7,-58,-51,-24,-45,-41,-46,-57,12,12,-54,-55,-26,12,12,12,-6,-8,-43,-40,-42,-44,-47,-12,12,-14,12,-19,-32,12,-35,-36,-38,12,-48,-13,-15,-53,-31,-28,-37,-29,]),'CAST_TYPE':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,35,36,40,41,45,47,53,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[13,13,-10,-4,-5,13,13,-1,13,-3,-39,13,13,-52,-25,13,13,13,13,13,13,-9,-11,-7,-58,-51,-24,-45,-41,-46,-57,13,13,-54,-55,-26,13,13,13,-6,-8,-43,-40,-42,-44,-47,-12,13,-14,13,-19,-32,13,-35,-36,-38,13,-48,-13,-15,-53,-31,-28,-37,-29,]),'B_FOLD_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,35,36,40,41,45,47,53,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[14,14,-10,-4,-5,14,14,-1,14,-3,-39,14,14,-52,-25,14,14,14,14,14,14,-9,-11,-7,-58,-51,-24,-45,-41,-46,-57,14,14,-54,-55,-26,14,14,14,-6,-8,-43,-40,-42,-44,-47,-12,14,-14,14,-19,-32,14,-35,-36,-38,14,-48,-13,-15,-53,-31,-28,-37,-29,]),'B_LITERAL_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,35,36,40,41,45,47,53,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[15,15,-10,-4,-5,15,15,-1,15,-3,-39,15,15,-52,-25,15,15,15,15,15,15,-9,-11,-7,-58,-51,-24,-45,-41,-46,-57,15,15,-54,-55,-26,15,15,15,-6,-8,-43,-40,-42,-44,-47,-12,15,-14,15,-19,-32,15,-35,-36,-38,15,-48,-13,-15,-53,-31,-28,-37,-29,]),'SINGLEQUOTE_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,35,36,40,41,45,47,53,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[16,16,-10,-4,-5,16,16,-1,16,-3,-39,16,16,-52,-25,16,16,16,16,16,16,-9,-11,-7,-58,-51,-24,-45,-41,-46,-57,16,16,-54,-55,-26,16,16,16,-6,-8,-43,-40,-42,-44,-47,-12,16,-14,16,-19,-32,16,-35,-36,-38,16,-48,-13,-15,-53,-31,-28,-37,-29,]),'F_SEQUENCE_START':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,23,25,27,28,30,35,36,40,41,45,47,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[20,20,-10,-4,-5,20,20,-1,-2,-3,-39,-52,-25,20,20,20,-9,-11,-7,-51,-24,-45,-41,-46,-57,20,-54,-55,-26,20,20,20,-6,-8,-43,-40,-42,-44,-47,-12,-14,-32,20,-35,-36,-38,-48,-13,-15,-53,-31,-28,-37,-29,]),'F_MAP_START':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,23,25,27,28,30,35,36,40,41,45,47,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[21,21,-10,-4,-5,21,21,-1,-2,-3,-39,-52,-25,21,21,21,-9,-11,-7,-51,-24,-45,-41,-46,-57,21,-54,-55,-26,21,21,21,-6,-8,-43,-40,-42,-44,-47,-12,-14,-32,21,-35,-36,-38,-48,-13,-15,-53,-31,-28,-37,-29,]),'B_SEQUENCE_COMPACT_START':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,25,27,28,30,35,36,40,41,45,47,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[22,22,-10,-4,-5,22,22,22,-2,-3,-39,-52,-25,22,22,-9,-11,-7,-51,-24,-45,-41,-46,-57,22,-54,-55,-26,22,22,22,-6,-8,-43,-40,-42,-44,-47,-12,-14,-32,22,-35,-36,22,-48,-13,-15,-53,-31,-28,-37,-29,]),'B_SEQUENCE_START':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,25,27,28,30,35,36,40,41,45,47,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[23,23,-10,-4,-5,23,23,23,-2,-3,-39,-52,-25,23,23,-9,-11,-7,-51,-24,-45,-41,-46,-57,23,-54,-55,-26,23,23,23,-6,-8,-43,-40,-42,-44,-47,-12,-14,-32,23,-35,-36,23,-48,-13,-15,-53,-31,-28,-37,-29,]),'B_MAP_COMPACT_KEY':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,25,27,28,30,35,36,40,41,45,47,56,57,58,59,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[25,25,-10,-4,-5,25,25,-1,25,-3,-39,-52,-25,25,25,-9,-11,-7,-51,-24,-45,-41,-46,-57,25,-54,-55,-26,25,25,-6,-8,-43,-40,-42,-44,-47,-12,-14,-32,25,-35,-36,-38,-48,-13,-15,-53,-31,-28,-37,-29,]),'B_MAP_KEY':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,25,27,28,30,35,36,40,41,45,47,56,57,58,59,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[26,26,-10,-4,-5,26,26,-1,26,-3,-39,-52,-25,26,26,-9,-11,-7,-51,-24,-45,-41,-46,-57,26,-54,-55,-26,26,26,-6,-8,-43,-40,-42,-44,-47,-12,-14,-32,26,-35,-36,-38,-48,-13,-15,-53,-31,-28,-37,-29,]),'$end':([1,2,3,4,5,8,9,10,11,18,19,27,28,30,35,36,40,41,45,47,57,58,59,67,68,69,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[0,-56,-10,-4,-5,-1,-2,-3,-39,-52,-25,-9,-11,-7,-51,-24,-45,-41,-46,-57,-54,-55,-26,-6,-8,-43,-40,-42,-44,-47,-12,-14,-32,-35,-36,-38,-48,-13,-15,-53,-31,-28,-37,-29,]),'DOC_END':([3,4,5,8,9,10,11,18,19,30,35,36,40,41,45,47,57,58,59,67,68,69,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[28,-4,-5,-1,-2,-3,-39,-52,-25,67,-51,-24,-45,-41,-46,-57,-54,-55,-26,-6,-8,-43,-40,-42,-44,-47,-12,-14,-32,-35,-36,-38,-48,-13,-15,-53,-31,-28,-37,-29,]),'DEDENT':([4,5,7,8,9,10,11,18,19,30,31,33,34,35,36,38,40,41,43,45,47,55,56,57,58,59,63,64,66,67,68,69,70,71,72,73,74,75,77,82,83,84,85,86,87,88,91,92,93,95,97,98,99,100,101,102,104,105,106,],[-4,-5,32,-1,-2,-3,-39,-52,-25,-7,68,69,-49,-51,-24,32,-45,-41,-49,-46,-57,82,32,-54,-55,-26,90,32,92,-6,-8,-43,-50,-40,-42,-44,-47,-12,-14,-32,97,32,-35,-36,-38,101,103,-48,-13,-15,-53,104,105,-39,-31,106,-28,-37,-29,]),'B_MAP_VALUE':([5,11,24,34,37,40,41,45,47,62,65,69,71,72,73,74,90,92,99,100,103,],[-33,-39,60,-39,-33,-45,-41,-46,-57,89,-34,-43,-40,-42,-44,-47,-30,-48,-33,-39,-27,]),'B_MAP_COMPACT_VALUE':([5,11,24,34,37,40,41,45,47,62,65,69,71,72,73,74,90,92,99,100,103,],[-33,-39,61,-39,-33,-45,-41,-46,-57,-33,-34,-43,-40,-42,-44,-47,-30,-48,-33,-39,-27,]),'F_SEQUENCE_END':([11,40,41,45,47,48,49,50,69,71,72,73,74,76,92,94,],[-39,-45,-41,-46,-57,75,-22,-23,-43,-40,-42,-44,-47,93,-48,-21,]),'F_SEP':([11,40,41,45,47,48,49,50,51,52,69,71,72,73,74,79,80,92,94,96,],[-39,-45,-41,-46,-57,76,-22,-23,78,-17,-43,-40,-42,-44,-47,-18,-20,-48,-21,-16,]),'F_MAP_KEY':([11,40,41,45,47,54,69,71,72,73,74,92,],[-39,-45,-41,-46,-57,81,-43,-40,-42,-44,-47,-48,]),'F_MAP_END':([11,40,41,45,47,51,52,69,71,72,73,74,78,79,80,92,96,],[-39,-45,-41,-46,-57,77,-17,-43,-40,-42,-44,-47,95,-18,-20,-48,-16,]),'DOUBLEQUOTE_END':([12,39,],[40,71,]),'SINGLEQUOTE_END':([16,46,],[45,74,]),'B_FOLD_END':([42,43,70,],[72,-49,-50,]),'B_LITERAL_END':([43,44,70,],[-49,73,-50,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -16,7 +16,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'flow_sequence_item':([23,89,],[60,101,]),'map_item':([0,4,5,19,20,21,24,26,39,43,72,],[15,15,15,15,57,15,15,15,15,15,15,]),'flow_sequence':([23,],[61,]),'sequence':([0,4,5,19,21,24,26,39,40,43,72,],[25,25,25,25,25,25,25,25,75,25,25,]),'flow_map_item':([17,85,],[52,98,]),'sequence_item':([0,4,5,19,21,24,25,26,39,40,43,72,75,],[3,3,3,3,3,3,64,3,3,3,3,3,64,]),'map_item_key':([0,4,5,19,20,21,24,26,39,43,72,],[6,6,6,6,6,6,6,6,6,6,6,]),'flow_map_item_value':([50,],[81,]),'map_item_value':([6,],[38,]),'scalar_group':([5,7,10,26,31,43,72,],[37,41,46,37,37,37,37,]),'map':([0,4,5,19,21,24,26,39,43,72,],[20,20,20,20,20,20,20,20,20,20,]),'flow_map':([17,],[53,]),'docs':([0,],[21,]),'ignore_indent_dedent':([0,1,4,5,8,17,18,19,20,21,22,23,24,26,39,40,43,50,72,85,86,89,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'doc':([0,5,21,24,],[9,35,58,63,]),'flow_collection':([0,1,4,5,19,21,24,26,39,40,43,72,],[11,27,11,11,11,11,11,11,11,73,11,11,]),'scalar':([0,1,4,5,8,17,18,19,20,21,22,23,24,26,39,40,43,50,72,85,86,89,],[12,28,32,12,44,51,54,55,32,12,59,62,12,32,32,74,32,82,93,51,100,62,]),'flow_map_item_key':([17,85,],[50,50,]),'collection':([0,4,5,19,21,24,26,39,43,72,],[13,33,13,56,13,13,65,71,77,94,]),}
+_lr_goto_items = {'stream':([0,],[1,]),'docs':([0,],[2,]),'doc':([0,2,6,7,],[3,27,30,31,]),'collection':([0,2,6,7,22,25,56,61,64,84,],[4,4,4,4,55,63,83,88,91,98,]),'scalar':([0,2,6,7,9,13,17,20,21,22,23,25,26,53,56,60,61,64,76,78,84,89,],[5,5,5,5,37,41,47,50,54,37,58,62,65,80,37,86,37,37,50,54,99,102,]),'sequence':([0,2,6,7,22,25,56,60,61,64,84,],[8,8,8,8,8,8,8,87,8,8,8,]),'map':([0,2,6,7,22,25,56,61,64,84,],[9,9,9,9,9,9,9,9,9,9,]),'flow_collection':([0,2,6,7,22,23,25,56,60,61,64,84,],[10,10,10,10,10,57,10,10,85,10,10,10,]),'ignore_indent_dedent':([0,2,6,7,9,13,17,20,21,22,23,25,26,53,56,60,61,64,76,78,84,89,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'sequence_item':([0,2,6,7,8,22,25,56,60,61,64,84,87,],[18,18,18,18,35,18,18,18,18,18,18,18,35,]),'map_item':([0,2,6,7,9,22,25,56,61,64,84,],[19,19,19,19,36,19,19,19,19,19,19,]),'map_item_key':([0,2,6,7,9,22,25,56,61,64,84,],[24,24,24,24,24,24,24,24,24,24,24,]),'scalar_group':([7,14,15,38,56,64,84,],[33,42,44,33,33,33,33,]),'flow_sequence':([20,],[48,]),'flow_sequence_item':([20,76,],[49,94,]),'flow_map':([21,],[51,]),'flow_map_item':([21,78,],[52,96,]),'flow_map_item_key':([21,78,],[53,53,]),'map_item_value':([24,],[59,]),'flow_map_item_value':([53,],[79,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -25,62 +25,63 @@ for _k, _v in _lr_goto_items.items():
        _lr_goto[_x][_k] = _y
 del _lr_goto_items
 _lr_productions = [
-  ("S' -> docs","S'",1,None,None,None),
-  ('docs -> doc','docs',1,'p_docs__last','productions.py',19),
-  ('docs -> doc DOC_END','docs',2,'p_docs__last','productions.py',20),
-  ('docs -> docs doc','docs',2,'p_docs__init','productions.py',27),
-  ('doc -> DOC_START doc DOC_END','doc',3,'p_doc__indent','productions.py',34),
-  ('doc -> DOC_START doc','doc',2,'p_doc__indent','productions.py',35),
-  ('doc -> INDENT doc DEDENT','doc',3,'p_doc__indent','productions.py',36),
-  ('doc -> collection','doc',1,'p_doc','productions.py',43),
-  ('doc -> scalar','doc',1,'p_doc','productions.py',44),
-  ('scalar -> ignore_indent_dedent scalar','scalar',2,'p_doc_scalar_collection_ignore','productions.py',51),
-  ('collection -> sequence','collection',1,'p_collection','productions.py',58),
-  ('collection -> map','collection',1,'p_collection','productions.py',59),
-  ('collection -> flow_collection','collection',1,'p_collection','productions.py',60),
-  ('map -> map_item','map',1,'p_map__last','productions.py',67),
-  ('map -> map map_item','map',2,'p_map__init','productions.py',74),
-  ('map_item -> map_item_key map_item_value','map_item',2,'p_map_item','productions.py',81),
-  ('map_item -> B_MAP_COMPACT_KEY scalar B_MAP_VALUE scalar DEDENT','map_item',5,'p_map_item__compact_scalar','productions.py',88),
-  ('map_item_key -> B_MAP_KEY scalar','map_item_key',2,'p_map_item_key__complex_key_scalar','productions.py',95),
-  ('map_item_key -> scalar','map_item_key',1,'p_map_item_key','productions.py',102),
-  ('map_item_key -> B_MAP_KEY INDENT collection DEDENT','map_item_key',4,'p_map_item___key_value__collection','productions.py',109),
-  ('map_item_value -> B_MAP_VALUE INDENT collection DEDENT','map_item_value',4,'p_map_item___key_value__collection','productions.py',110),
-  ('map_item_value -> B_MAP_VALUE flow_collection','map_item_value',2,'p_map_item_value__flow_collection','productions.py',117),
-  ('map_item_value -> B_MAP_VALUE scalar','map_item_value',2,'p_map_item_value__scalar','productions.py',124),
-  ('map_item_value -> B_MAP_VALUE INDENT scalar DEDENT','map_item_value',4,'p_map_item_value__scalar_indented','productions.py',131),
-  ('map_item_value -> B_MAP_VALUE sequence','map_item_value',2,'p_map_item_value__sequence_no_indent','productions.py',138),
-  ('sequence -> sequence_item','sequence',1,'p_sequence__last','productions.py',152),
-  ('sequence -> sequence sequence_item','sequence',2,'p_sequence__init','productions.py',159),
-  ('sequence_item -> B_SEQUENCE_START scalar','sequence_item',2,'p_sequence_item__scalar','productions.py',166),
-  ('sequence_item -> B_SEQUENCE_START INDENT collection DEDENT','sequence_item',4,'p_sequence_item__collection','productions.py',180),
-  ('map_item_key -> B_MAP_COMPACT_KEY collection DEDENT','map_item_key',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',187),
-  ('map_item_value -> B_MAP_COMPACT_VALUE collection DEDENT','map_item_value',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',188),
-  ('sequence_item -> B_SEQUENCE_COMPACT_START collection DEDENT','sequence_item',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',189),
-  ('sequence_item -> B_SEQUENCE_START flow_collection','sequence_item',2,'p_sequence_item__flow_collection','productions.py',196),
-  ('scalar -> DOUBLEQUOTE_START SCALAR DOUBLEQUOTE_END','scalar',3,'p_scalar__doublequote','productions.py',203),
-  ('scalar -> SINGLEQUOTE_START SCALAR SINGLEQUOTE_END','scalar',3,'p_scalar__singlequote','productions.py',213),
-  ('scalar -> DOUBLEQUOTE_START DOUBLEQUOTE_END','scalar',2,'p_scalar__quote_empty','productions.py',220),
-  ('scalar -> SINGLEQUOTE_START SINGLEQUOTE_END','scalar',2,'p_scalar__quote_empty','productions.py',221),
-  ('scalar -> CAST_TYPE scalar','scalar',2,'p_scalar__explicit_cast','productions.py',228),
-  ('scalar -> SCALAR','scalar',1,'p_scalar','productions.py',235),
-  ('scalar -> B_LITERAL_START scalar_group B_LITERAL_END','scalar',3,'p_scalar__literal','productions.py',242),
-  ('scalar -> B_FOLD_START scalar_group B_FOLD_END','scalar',3,'p_scalar__folded','productions.py',250),
-  ('scalar -> INDENT scalar_group DEDENT','scalar',3,'p_scalar__indented_flow','productions.py',259),
-  ('scalar -> scalar INDENT SCALAR DEDENT','scalar',4,'p_scalar__string_indented_multi_line','productions.py',268),
-  ('scalar_group -> SCALAR','scalar_group',1,'p_scalar_group','productions.py',277),
-  ('scalar_group -> scalar_group SCALAR','scalar_group',2,'p_scalar_group','productions.py',278),
-  ('ignore_indent_dedent -> INDENT DEDENT','ignore_indent_dedent',2,'p_ignore_indent_dedent','productions.py',292),
-  ('flow_collection -> F_SEQUENCE_START flow_sequence F_SEQUENCE_END','flow_collection',3,'p_flow_collection','productions.py',297),
-  ('flow_collection -> F_SEQUENCE_START flow_sequence F_SEP F_SEQUENCE_END','flow_collection',4,'p_flow_collection','productions.py',298),
-  ('flow_collection -> F_MAP_START flow_map F_MAP_END','flow_collection',3,'p_flow_collection','productions.py',299),
-  ('flow_collection -> F_MAP_START flow_map F_SEP F_MAP_END','flow_collection',4,'p_flow_collection','productions.py',300),
-  ('flow_sequence -> flow_sequence_item','flow_sequence',1,'p_flow_sequence__last','productions.py',307),
-  ('flow_sequence -> flow_sequence F_SEP flow_sequence_item','flow_sequence',3,'p_flow_sequence__init','productions.py',314),
-  ('flow_sequence_item -> scalar','flow_sequence_item',1,'p_flow_sequence_item','productions.py',321),
-  ('flow_map -> flow_map_item','flow_map',1,'p_flow_map__last','productions.py',328),
-  ('flow_map -> flow_map F_SEP flow_map_item','flow_map',3,'p_flow_map__init','productions.py',335),
-  ('flow_map_item -> flow_map_item_key flow_map_item_value','flow_map_item',2,'p_flow_map_item','productions.py',342),
-  ('flow_map_item_key -> scalar F_MAP_KEY','flow_map_item_key',2,'p_flow_map_item_key','productions.py',349),
-  ('flow_map_item_value -> scalar','flow_map_item_value',1,'p_flow_map_item_value','productions.py',356),
+  ("S' -> stream","S'",1,None,None,None),
+  ('collection -> sequence','collection',1,'p_collection','productions.py',18),
+  ('collection -> map','collection',1,'p_collection','productions.py',19),
+  ('collection -> flow_collection','collection',1,'p_collection__flow','productions.py',18),
+  ('doc -> collection','doc',1,'p_doc','productions.py',18),
+  ('doc -> scalar','doc',1,'p_doc','productions.py',19),
+  ('doc -> DOC_START doc DOC_END','doc',3,'p_doc__indent','productions.py',18),
+  ('doc -> DOC_START doc','doc',2,'p_doc__indent','productions.py',19),
+  ('doc -> INDENT doc DEDENT','doc',3,'p_doc__indent','productions.py',20),
+  ('docs -> docs doc','docs',2,'p_docs__init','productions.py',18),
+  ('docs -> doc','docs',1,'p_docs__last','productions.py',18),
+  ('docs -> doc DOC_END','docs',2,'p_docs__last','productions.py',19),
+  ('flow_collection -> F_SEQUENCE_START flow_sequence F_SEQUENCE_END','flow_collection',3,'p_flow_collection','productions.py',18),
+  ('flow_collection -> F_SEQUENCE_START flow_sequence F_SEP F_SEQUENCE_END','flow_collection',4,'p_flow_collection','productions.py',19),
+  ('flow_collection -> F_MAP_START flow_map F_MAP_END','flow_collection',3,'p_flow_collection','productions.py',20),
+  ('flow_collection -> F_MAP_START flow_map F_SEP F_MAP_END','flow_collection',4,'p_flow_collection','productions.py',21),
+  ('flow_map -> flow_map F_SEP flow_map_item','flow_map',3,'p_flow_map__init','productions.py',18),
+  ('flow_map -> flow_map_item','flow_map',1,'p_flow_map__last','productions.py',18),
+  ('flow_map_item -> flow_map_item_key flow_map_item_value','flow_map_item',2,'p_flow_map_item','productions.py',18),
+  ('flow_map_item_key -> scalar F_MAP_KEY','flow_map_item_key',2,'p_flow_map_item_key','productions.py',18),
+  ('flow_map_item_value -> scalar','flow_map_item_value',1,'p_flow_map_item_value','productions.py',18),
+  ('flow_sequence -> flow_sequence F_SEP flow_sequence_item','flow_sequence',3,'p_flow_sequence__init','productions.py',18),
+  ('flow_sequence -> flow_sequence_item','flow_sequence',1,'p_flow_sequence__last','productions.py',18),
+  ('flow_sequence_item -> scalar','flow_sequence_item',1,'p_flow_sequence_item','productions.py',18),
+  ('map -> map map_item','map',2,'p_map__init','productions.py',18),
+  ('map -> map_item','map',1,'p_map__last','productions.py',18),
+  ('map_item -> map_item_key map_item_value','map_item',2,'p_map_item','productions.py',18),
+  ('map_item_key -> B_MAP_KEY INDENT collection DEDENT','map_item_key',4,'p_map_item___key_value__collection','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE INDENT collection DEDENT','map_item_value',4,'p_map_item___key_value__collection','productions.py',19),
+  ('map_item -> B_MAP_COMPACT_KEY scalar B_MAP_VALUE scalar DEDENT','map_item',5,'p_map_item__compact_scalar','productions.py',18),
+  ('map_item_key -> B_MAP_COMPACT_KEY collection DEDENT','map_item_key',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',18),
+  ('map_item_value -> B_MAP_COMPACT_VALUE collection DEDENT','map_item_value',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',19),
+  ('sequence_item -> B_SEQUENCE_COMPACT_START collection DEDENT','sequence_item',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',20),
+  ('map_item_key -> scalar','map_item_key',1,'p_map_item_key','productions.py',18),
+  ('map_item_key -> B_MAP_KEY scalar','map_item_key',2,'p_map_item_key__complex_key_scalar','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE flow_collection','map_item_value',2,'p_map_item_value__flow_collection','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE scalar','map_item_value',2,'p_map_item_value__scalar','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE INDENT scalar DEDENT','map_item_value',4,'p_map_item_value__scalar_indented','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE sequence','map_item_value',2,'p_map_item_value__sequence_no_indent','productions.py',18),
+  ('scalar -> SCALAR','scalar',1,'p_scalar','productions.py',18),
+  ('scalar -> DOUBLEQUOTE_START SCALAR DOUBLEQUOTE_END','scalar',3,'p_scalar__doublequote','productions.py',18),
+  ('scalar -> CAST_TYPE scalar','scalar',2,'p_scalar__explicit_cast','productions.py',18),
+  ('scalar -> B_FOLD_START scalar_group B_FOLD_END','scalar',3,'p_scalar__folded','productions.py',18),
+  ('scalar -> INDENT scalar_group DEDENT','scalar',3,'p_scalar__indented_flow','productions.py',18),
+  ('scalar -> B_LITERAL_START scalar_group B_LITERAL_END','scalar',3,'p_scalar__literal','productions.py',18),
+  ('scalar -> DOUBLEQUOTE_START DOUBLEQUOTE_END','scalar',2,'p_scalar__quote_empty','productions.py',18),
+  ('scalar -> SINGLEQUOTE_START SINGLEQUOTE_END','scalar',2,'p_scalar__quote_empty','productions.py',19),
+  ('scalar -> SINGLEQUOTE_START SCALAR SINGLEQUOTE_END','scalar',3,'p_scalar__singlequote','productions.py',18),
+  ('scalar -> scalar INDENT SCALAR DEDENT','scalar',4,'p_scalar__string_indented_multi_line','productions.py',18),
+  ('scalar_group -> SCALAR','scalar_group',1,'p_scalar_group','productions.py',18),
+  ('scalar_group -> scalar_group SCALAR','scalar_group',2,'p_scalar_group','productions.py',19),
+  ('sequence -> sequence sequence_item','sequence',2,'p_sequence__init','productions.py',18),
+  ('sequence -> sequence_item','sequence',1,'p_sequence__last','productions.py',18),
+  ('sequence_item -> B_SEQUENCE_START INDENT collection DEDENT','sequence_item',4,'p_sequence_item__collection','productions.py',18),
+  ('sequence_item -> B_SEQUENCE_START flow_collection','sequence_item',2,'p_sequence_item__flow_collection','productions.py',18),
+  ('sequence_item -> B_SEQUENCE_START scalar','sequence_item',2,'p_sequence_item__scalar','productions.py',18),
+  ('stream -> docs','stream',1,'p_stream','productions.py',18),
+  ('scalar -> ignore_indent_dedent scalar','scalar',2,'p_doc_scalar_collection_ignore','productions.py',60),
+  ('ignore_indent_dedent -> INDENT DEDENT','ignore_indent_dedent',2,'p_ignore_indent_dedent','productions.py',304),
 ]
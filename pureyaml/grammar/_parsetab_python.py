@@ -0,0 +1,87 @@
+
+# _parsetab_python.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.8'
+
+_lr_method = 'LALR'
+
+_lr_signature = '0D633E82D743E559AAC716EB9D9A2D8B'
+    
+_lr_action_items = {'DOC_START':([0,2,3,4,5,6,7,8,9,10,11,20,21,27,28,29,35,36,40,41,45,47,57,58,59,66,67,68,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[4,4,-34,4,4,-37,-38,-1,-39,-40,-18,-47,-42,-36,-35,-3,-48,-43,-24,-20,-25,-41,-31,-32,-44,-2,-4,-22,-19,-21,-23,-26,-49,-51,-12,-15,-16,-46,-27,-50,-52,-30,-11,-9,-17,-45,]),'INDENT':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,33,35,36,37,40,41,45,47,50,53,54,56,57,58,59,60,61,62,64,65,66,67,68,71,72,73,74,75,76,77,78,80,81,82,84,85,86,87,89,92,93,95,97,99,100,101,102,104,105,106,],[5,5,-34,5,5,-37,34,-1,-39,38,-18,38,38,38,38,-47,-42,38,56,38,64,-36,-35,-3,-58,-18,-48,-43,34,-24,34,-25,34,34,38,34,38,-31,34,-44,84,38,34,38,34,-2,-4,-22,-19,-21,-23,-26,-49,38,-51,38,34,-5,-12,38,-15,34,-46,38,-27,-50,-52,-30,34,-18,-11,34,-9,-17,-45,]),'SCALAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,31,32,33,34,35,36,38,40,41,42,43,44,45,47,53,56,57,58,59,60,61,64,66,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,100,101,104,105,106,],[11,11,-34,11,33,-37,-38,-1,-39,11,-18,39,11,43,43,46,11,11,11,-47,-42,11,11,11,11,-36,-35,-3,-58,69,-28,70,-48,-43,43,-24,-20,69,-28,69,-25,-41,11,33,-31,-32,-44,11,11,33,-2,-4,-22,-29,-19,-21,-23,-26,-49,11,-51,11,-5,-12,100,-15,-16,-46,11,-27,-50,-52,-30,-28,-11,-9,-17,-45,]),'DOUBLEQUOTE_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,35,36,40,41,45,47,53,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[12,12,-34,12,12,-37,-38,-1,-39,12,-18,12,12,12,12,-47,-42,12,12,12,12,-36,-35,-3,-58,-48,-43,-24,-20,-25,-41,12,12,-31,-32,-44,12,12,12,-2,-4,-22,-19,-21,-23,-26,-49,12,-51,12,-5,-12,12,-15,-16,-46,12,-27,-50,-52,-30,-11,-9,-17,-45,]),'CAST_TYPE':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,35,36,40,41,45,47,53,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[13,13,-34,13,13,-37,-38,-1,-39,13,-18,13,13,13,13,-47,-42,13,13,13,13,-36,-35,-3,-58,-48,-43,-24,-20,-25,-41,13,13,-31,-32,-44,13,13,13,-2,-4,-22,-19,-21,-23,-26,-49,13,-51,13,-5,-12,13,-15,-16,-46,13,-27,-50,-52,-30,-11,-9,-17,-45,]),'B_FOLD_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,35,36,40,41,45,47,53,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[14,14,-34,14,14,-37,-38,-1,-39,14,-18,14,14,14,14,-47,-42,14,14,14,14,-36,-35,-3,-58,-48,-43,-24,-20,-25,-41,14,14,-31,-32,-44,14,14,14,-2,-4,-22,-19,-21,-23,-26,-49,14,-51,14,-5,-12,14,-15,-16,-46,14,-27,-50,-52,-30,-11,-9,-17,-45,]),'B_LITERAL_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,35,36,40,41,45,47,53,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[15,15,-34,15,15,-37,-38,-1,-39,15,-18,15,15,15,15,-47,-42,15,15,15,15,-36,-35,-3,-58,-48,-43,-24,-20,-25,-41,15,15,-31,-32,-44,15,15,15,-2,-4,-22,-19,-21,-23,-26,-49,15,-51,15,-5,-12,15,-15,-16,-46,15,-27,-50,-52,-30,-11,-9,-17,-45,]),'SINGLEQUOTE_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,35,36,40,41,45,47,53,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[16,16,-34,16,16,-37,-38,-1,-39,16,-18,16,16,16,16,-47,-42,16,16,16,16,-36,-35,-3,-58,-48,-43,-24,-20,-25,-41,16,16,-31,-32,-44,16,16,16,-2,-4,-22,-19,-21,-23,-26,-49,16,-51,16,-5,-12,16,-15,-16,-46,16,-27,-50,-52,-30,-11,-9,-17,-45,]),'F_SEQUENCE_START':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,23,25,27,28,29,35,36,40,41,45,47,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[18,18,-34,18,18,-37,-38,-1,-39,-40,-18,-47,-42,18,18,18,-36,-35,-3,-48,-43,-24,-20,-25,-41,18,-31,-32,-44,18,18,18,-2,-4,-22,-19,-21,-23,-26,-49,-51,-12,18,-15,-16,-46,-27,-50,-52,-30,-11,-9,-17,-45,]),'F_MAP_START':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,23,25,27,28,29,35,36,40,41,45,47,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[19,19,-34,19,19,-37,-38,-1,-39,-40,-18,-47,-42,19,19,19,-36,-35,-3,-48,-43,-24,-20,-25,-41,19,-31,-32,-44,19,19,19,-2,-4,-22,-19,-21,-23,-26,-49,-51,-12,19,-15,-16,-46,-27,-50,-52,-30,-11,-9,-17,-45,]),'B_SEQUENCE_COMPACT_START':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,25,27,28,29,35,36,40,41,45,47,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[22,22,-34,22,22,-37,-38,-1,22,-40,-18,-47,-42,22,22,-36,-35,-3,-48,-43,-24,-20,-25,-41,22,-31,-32,-44,22,22,22,-2,-4,-22,-19,-21,-23,-26,-49,-51,-12,22,-15,-16,22,-27,-50,-52,-30,-11,-9,-17,-45,]),'B_SEQUENCE_START':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,25,27,28,29,35,36,40,41,45,47,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[23,23,-34,23,23,-37,-38,-1,23,-40,-18,-47,-42,23,23,-36,-35,-3,-48,-43,-24,-20,-25,-41,23,-31,-32,-44,23,23,23,-2,-4,-22,-19,-21,-23,-26,-49,-51,-12,23,-15,-16,23,-27,-50,-52,-30,-11,-9,-17,-45,]),'B_MAP_COMPACT_KEY':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,25,27,28,29,35,36,40,41,45,47,56,57,58,59,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[25,25,-34,25,25,-37,-38,-1,-39,25,-18,-47,-42,25,25,-36,-35,-3,-48,-43,-24,-20,-25,-41,25,-31,-32,-44,25,25,-2,-4,-22,-19,-21,-23,-26,-49,-51,-12,25,-15,-16,-46,-27,-50,-52,-30,-11,-9,-17,-45,]),'B_MAP_KEY':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,25,27,28,29,35,36,40,41,45,47,56,57,58,59,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[26,26,-34,26,26,-37,-38,-1,-39,26,-18,-47,-42,26,26,-36,-35,-3,-48,-43,-24,-20,-25,-41,26,-31,-32,-44,26,26,-2,-4,-22,-19,-21,-23,-26,-49,-51,-12,26,-15,-16,-46,-27,-50,-52,-30,-11,-9,-17,-45,]),'$end':([1,2,3,6,7,8,9,10,11,20,21,27,28,29,35,36,40,41,45,47,57,58,59,66,67,68,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[0,-33,-34,-37,-38,-1,-39,-40,-18,-47,-42,-36,-35,-3,-48,-43,-24,-20,-25,-41,-31,-32,-44,-2,-4,-22,-19,-21,-23,-26,-49,-51,-12,-15,-16,-46,-27,-50,-52,-30,-11,-9,-17,-45,]),'DOC_END':([3,6,7,8,9,10,11,20,21,29,35,36,40,41,45,47,57,58,59,66,67,68,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[28,-37,-38,-1,-39,-40,-18,-47,-42,66,-48,-43,-24,-20,-25,-41,-31,-32,-44,-2,-4,-22,-19,-21,-23,-26,-49,-51,-12,-15,-16,-46,-27,-50,-52,-30,-11,-9,-17,-45,]),'DEDENT':([5,6,7,8,9,10,11,20,21,29,30,32,33,35,36,38,40,41,43,45,47,55,56,57,58,59,63,64,66,67,68,69,70,71,72,73,74,75,77,82,83,84,85,86,87,88,91,92,93,95,97,98,99,100,101,102,104,105,106,],[31,-37,-38,-1,-39,-40,-18,-47,-42,-3,67,68,-28,-48,-43,31,-24,-20,-28,-25,-41,82,31,-31,-32,-44,90,31,-2,-4,-22,-29,92,-19,-21,-23,-26,-49,-51,-12,97,31,-15,-16,-46,101,103,-27,-50,-52,-30,104,105,-18,-11,106,-9,-17,-45,]),'B_MAP_VALUE':([7,11,24,33,37,40,41,45,47,62,65,68,71,72,73,74,90,92,99,100,103,],[-13,-18,60,-18,-13,-24,-20,-25,-41,89,-14,-22,-19,-21,-23,-26,-10,-27,-13,-18,-8,]),'B_MAP_COMPACT_VALUE':([7,11,24,33,37,40,41,45,47,62,65,68,71,72,73,74,90,92,99,100,103,],[-13,-18,61,-18,-13,-24,-20,-25,-41,-13,-14,-22,-19,-21,-23,-26,-10,-27,-13,-18,-8,]),'F_SEQUENCE_END':([11,40,41,45,47,48,49,50,68,71,72,73,74,76,92,94,],[-18,-24,-20,-25,-41,75,-53,-7,-22,-19,-21,-23,-26,93,-27,-54,]),'F_SEP':([11,40,41,45,47,48,49,50,51,52,68,71,72,73,74,79,80,92,94,96,],[-18,-24,-20,-25,-41,76,-53,-7,78,-55,-22,-19,-21,-23,-26,-57,-6,-27,-54,-56,]),'F_MAP_KEY':([11,40,41,45,47,54,68,71,72,73,74,92,],[-18,-24,-20,-25,-41,81,-22,-19,-21,-23,-26,-27,]),'F_MAP_END':([11,40,41,45,47,51,52,68,71,72,73,74,78,79,80,92,96,],[-18,-24,-20,-25,-41,77,-55,-22,-19,-21,-23,-26,95,-57,-6,-27,-56,]),'DOUBLEQUOTE_END':([12,39,],[40,71,]),'SINGLEQUOTE_END':([16,46,],[45,74,]),'B_FOLD_END':([42,43,69,],[72,-28,-29,]),'B_LITERAL_END':([43,44,69,],[-28,73,-29,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'stream':([0,],[1,]),'docs':([0,],[2,]),'doc':([0,2,4,5,],[3,27,29,30,]),'collection':([0,2,4,5,22,25,56,61,64,84,],[6,6,6,6,55,63,83,88,91,98,]),'scalar':([0,2,4,5,10,13,17,18,19,22,23,25,26,53,56,60,61,64,76,78,84,89,],[7,7,7,7,37,41,47,50,54,37,58,62,65,80,37,86,37,37,50,54,99,102,]),'flow_collection':([0,2,4,5,22,23,25,56,60,61,64,84,],[8,8,8,8,8,57,8,8,85,8,8,8,]),'sequence':([0,2,4,5,22,25,56,60,61,64,84,],[9,9,9,9,9,9,9,87,9,9,9,]),'map':([0,2,4,5,22,25,56,61,64,84,],[10,10,10,10,10,10,10,10,10,10,]),'ignore_indent_dedent':([0,2,4,5,10,13,17,18,19,22,23,25,26,53,56,60,61,64,76,78,84,89,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'sequence_item':([0,2,4,5,9,22,25,56,60,61,64,84,87,],[20,20,20,20,35,20,20,20,20,20,20,20,35,]),'map_item':([0,2,4,5,10,22,25,56,61,64,84,],[21,21,21,21,36,21,21,21,21,21,21,]),'map_item_key':([0,2,4,5,10,22,25,56,61,64,84,],[24,24,24,24,24,24,24,24,24,24,24,]),'scalar_group':([5,14,15,38,56,64,84,],[32,42,44,32,32,32,32,]),'flow_sequence':([18,],[48,]),'flow_sequence_item':([18,76,],[49,94,]),'flow_map':([19,],[51,]),'flow_map_item':([19,78,],[52,96,]),'flow_map_item_key':([19,78,],[53,53,]),'map_item_value':([24,],[59,]),'flow_map_item_value':([53,],[79,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> stream","S'",1,None,None,None),
+  ('collection -> flow_collection','collection',1,'p_collection__flow','productions.py',18),
+  ('doc -> DOC_START doc DOC_END','doc',3,'p_doc__indent','productions.py',18),
+  ('doc -> DOC_START doc','doc',2,'p_doc__indent','productions.py',19),
+  ('doc -> INDENT doc DEDENT','doc',3,'p_doc__indent','productions.py',20),
+  ('flow_map_item_key -> scalar F_MAP_KEY','flow_map_item_key',2,'p_flow_map_item_key','productions.py',18),
+  ('flow_map_item_value -> scalar','flow_map_item_value',1,'p_flow_map_item_value','productions.py',18),
+  ('flow_sequence_item -> scalar','flow_sequence_item',1,'p_flow_sequence_item','productions.py',18),
+  ('map_item_key -> B_MAP_KEY INDENT collection DEDENT','map_item_key',4,'p_map_item___key_value__collection','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE INDENT collection DEDENT','map_item_value',4,'p_map_item___key_value__collection','productions.py',19),
+  ('map_item_key -> B_MAP_COMPACT_KEY collection DEDENT','map_item_key',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',18),
+  ('map_item_value -> B_MAP_COMPACT_VALUE collection DEDENT','map_item_value',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',19),
+  ('sequence_item -> B_SEQUENCE_COMPACT_START collection DEDENT','sequence_item',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',20),
+  ('map_item_key -> scalar','map_item_key',1,'p_map_item_key','productions.py',18),
+  ('map_item_key -> B_MAP_KEY scalar','map_item_key',2,'p_map_item_key__complex_key_scalar','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE flow_collection','map_item_value',2,'p_map_item_value__flow_collection','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE scalar','map_item_value',2,'p_map_item_value__scalar','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE INDENT scalar DEDENT','map_item_value',4,'p_map_item_value__scalar_indented','productions.py',18),
+  ('scalar -> SCALAR','scalar',1,'p_scalar','productions.py',18),
+  ('scalar -> DOUBLEQUOTE_START SCALAR DOUBLEQUOTE_END','scalar',3,'p_scalar__doublequote','productions.py',18),
+  ('scalar -> CAST_TYPE scalar','scalar',2,'p_scalar__explicit_cast','productions.py',18),
+  ('scalar -> B_FOLD_START scalar_group B_FOLD_END','scalar',3,'p_scalar__folded','productions.py',18),
+  ('scalar -> INDENT scalar_group DEDENT','scalar',3,'p_scalar__indented_flow','productions.py',18),
+  ('scalar -> B_LITERAL_START scalar_group B_LITERAL_END','scalar',3,'p_scalar__literal','productions.py',18),
+  ('scalar -> DOUBLEQUOTE_START DOUBLEQUOTE_END','scalar',2,'p_scalar__quote_empty','productions.py',18),
+  ('scalar -> SINGLEQUOTE_START SINGLEQUOTE_END','scalar',2,'p_scalar__quote_empty','productions.py',19),
+  ('scalar -> SINGLEQUOTE_START SCALAR SINGLEQUOTE_END','scalar',3,'p_scalar__singlequote','productions.py',18),
+  ('scalar -> scalar INDENT SCALAR DEDENT','scalar',4,'p_scalar__string_indented_multi_line','productions.py',18),
+  ('scalar_group -> SCALAR','scalar_group',1,'p_scalar_group','productions.py',18),
+  ('scalar_group -> scalar_group SCALAR','scalar_group',2,'p_scalar_group','productions.py',19),
+  ('sequence_item -> B_SEQUENCE_START INDENT collection DEDENT','sequence_item',4,'p_sequence_item__collection','productions.py',18),
+  ('sequence_item -> B_SEQUENCE_START flow_collection','sequence_item',2,'p_sequence_item__flow_collection','productions.py',18),
+  ('sequence_item -> B_SEQUENCE_START scalar','sequence_item',2,'p_sequence_item__scalar','productions.py',18),
+  ('stream -> docs','stream',1,'p_stream','python_productions.py',30),
+  ('docs -> doc','docs',1,'p_docs__last','python_productions.py',36),
+  ('docs -> doc DOC_END','docs',2,'p_docs__last','python_productions.py',37),
+  ('docs -> docs doc','docs',2,'p_docs__init','python_productions.py',43),
+  ('doc -> collection','doc',1,'p_doc','python_productions.py',50),
+  ('doc -> scalar','doc',1,'p_doc','python_productions.py',51),
+  ('collection -> sequence','collection',1,'p_collection','python_productions.py',57),
+  ('collection -> map','collection',1,'p_collection','python_productions.py',58),
+  ('scalar -> ignore_indent_dedent scalar','scalar',2,'p_doc_scalar_collection_ignore','productions.py',60),
+  ('map -> map_item','map',1,'p_map__last','python_productions.py',64),
+  ('map -> map map_item','map',2,'p_map__init','python_productions.py',71),
+  ('map_item -> map_item_key map_item_value','map_item',2,'p_map_item','python_productions.py',79),
+  ('map_item -> B_MAP_COMPACT_KEY scalar B_MAP_VALUE scalar DEDENT','map_item',5,'p_map_item__compact_scalar','python_productions.py',85),
+  ('map_item_value -> B_MAP_VALUE sequence','map_item_value',2,'p_map_item_value__sequence_no_indent','python_productions.py',91),
+  ('sequence -> sequence_item','sequence',1,'p_sequence__last','python_productions.py',97),
+  ('sequence -> sequence sequence_item','sequence',2,'p_sequence__init','python_productions.py',103),
+  ('flow_collection -> F_SEQUENCE_START flow_sequence F_SEQUENCE_END','flow_collection',3,'p_flow_collection','python_productions.py',110),
+  ('flow_collection -> F_SEQUENCE_START flow_sequence F_SEP F_SEQUENCE_END','flow_collection',4,'p_flow_collection','python_productions.py',111),
+  ('flow_collection -> F_MAP_START flow_map F_MAP_END','flow_collection',3,'p_flow_collection','python_productions.py',112),
+  ('flow_collection -> F_MAP_START flow_map F_SEP F_MAP_END','flow_collection',4,'p_flow_collection','python_productions.py',113),
+  ('flow_sequence -> flow_sequence_item','flow_sequence',1,'p_flow_sequence__last','python_productions.py',119),
+  ('flow_sequence -> flow_sequence F_SEP flow_sequence_item','flow_sequence',3,'p_flow_sequence__init','python_productions.py',125),
+  ('flow_map -> flow_map_item','flow_map',1,'p_flow_map__last','python_productions.py',132),
+  ('flow_map -> flow_map F_SEP flow_map_item','flow_map',3,'p_flow_map__init','python_productions.py',139),
+  ('flow_map_item -> flow_map_item_key flow_map_item_value','flow_map_item',2,'p_flow_map_item','python_productions.py',147),
+  ('ignore_indent_dedent -> INDENT DEDENT','ignore_indent_dedent',2,'p_ignore_indent_dedent','productions.py',304),
+]
@@ -0,0 +1,87 @@
+
+# _parsetab_python_stream.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.8'
+
+_lr_method = 'LALR'
+
+_lr_signature = '8DA4E41A881B41ECBB551516C3F6862F'
+    
+_lr_action_items = {'DOC_START':([0,2,3,4,5,6,7,8,9,10,11,20,21,27,28,29,35,36,40,41,45,47,57,58,59,66,67,68,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[4,4,-34,4,4,-37,-38,-2,-39,-40,-19,-47,-42,-36,-35,-4,-48,-43,-25,-21,-26,-41,-32,-33,-44,-3,-5,-23,-20,-22,-24,-27,-49,-51,-13,-16,-17,-46,-28,-50,-52,-31,-12,-10,-18,-45,]),'INDENT':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,33,35,36,37,40,41,45,47,50,53,54,56,57,58,59,60,61,62,64,65,66,67,68,71,72,73,74,75,76,77,78,80,81,82,84,85,86,87,89,92,93,95,97,99,100,101,102,104,105,106,],[5,5,-34,5,5,-37,34,-2,-39,38,-19,38,38,38,38,-47,-42,38,56,38,64,-36,-35,-4,-58,-19,-48,-43,34,-25,34,-26,34,34,38,34,38,-32,34,-44,84,38,34,38,34,-3,-5,-23,-20,-22,-24,-27,-49,38,-51,38,34,-6,-13,38,-16,34,-46,38,-28,-50,-52,-31,34,-19,-12,34,-10,-18,-45,]),'SCALAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,31,32,33,34,35,36,38,40,41,42,43,44,45,47,53,56,57,58,59,60,61,64,66,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,100,101,104,105,106,],[11,11,-34,11,33,-37,-38,-2,-39,11,-19,39,11,43,43,46,11,11,11,-47,-42,11,11,11,11,-36,-35,-4,-58,69,-29,70,-48,-43,43,-25,-21,69,-29,69,-26,-41,11,33,-32,-33,-44,11,11,33,-3,-5,-23,-30,-20,-22,-24,-27,-49,11,-51,11,-6,-13,100,-16,-17,-46,11,-28,-50,-52,-31,-29,-12,-10,-18,-45,]),'DOUBLEQUOTE_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,35,36,40,41,45,47,53,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[12,12,-34,12,12,-37,-38,-2,-39,12,-19,12,12,12,12,-47,-42,12,12,12,12,-36,-35,-4,-58,-48,-43,-25,-21,-26,-41,12,12,-32,-33,-44,12,12,12,-3,-5,-23,-20,-22,-24,-27,-49,12,-51,12,-6,-13,12,-16,-17,-46,12,-28,-50,-52,-31,-12,-10,-18,-45,]),'CAST_TYPE':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,35,36,40,41,45,47,53,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[13,13,-34,13,13,-37,-38,-2,-39,13,-19,13,13,13,13,-47,-42,13,13,13,13,-36,-35,-4,-58,-48,-43,-25,-21,-26,-41,13,13,-32,-33,-44,13,13,13,-3,-5,-23,-20,-22,-24,-27,-49,13,-51,13,-6,-13,13,-16,-17,-46,13,-28,-50,-52,-31,-12,-10,-18,-45,]),'B_FOLD_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,35,36,40,41,45,47,53,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[14,14,-34,14,14,-37,-38,-2,-39,14,-19,14,14,14,14,-47,-42,14,14,14,14,-36,-35,-4,-58,-48,-43,-25,-21,-26,-41,14,14,-32,-33,-44,14,14,14,-3,-5,-23,-20,-22,-24,-27,-49,14,-51,14,-6,-13,14,-16,-17,-46,14,-28,-50,-52,-31,-12,-10,-18,-45,]),'B_LITERAL_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,35,36,40,41,45,47,53,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[15,15,-34,15,15,-37,-38,-2,-39,15,-19,15,15,15,15,-47,-42,15,15,15,15,-36,-35,-4,-58,-48,-43,-25,-21,-26,-41,15,15,-32,-33,-44,15,15,15,-3,-5,-23,-20,-22,-24,-27,-49,15,-51,15,-6,-13,15,-16,-17,-46,15,-28,-50,-52,-31,-12,-10,-18,-45,]),'SINGLEQUOTE_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,29,31,35,36,40,41,45,47,53,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[16,16,-34,16,16,-37,-38,-2,-39,16,-19,16,16,16,16,-47,-42,16,16,16,16,-36,-35,-4,-58,-48,-43,-25,-21,-26,-41,16,16,-32,-33,-44,16,16,16,-3,-5,-23,-20,-22,-24,-27,-49,16,-51,16,-6,-13,16,-16,-17,-46,16,-28,-50,-52,-31,-12,-10,-18,-45,]),'F_SEQUENCE_START':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,23,25,27,28,29,35,36,40,41,45,47,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[18,18,-34,18,18,-37,-38,-2,-39,-40,-19,-47,-42,18,18,18,-36,-35,-4,-48,-43,-25,-21,-26,-41,18,-32,-33,-44,18,18,18,-3,-5,-23,-20,-22,-24,-27,-49,-51,-13,18,-16,-17,-46,-28,-50,-52,-31,-12,-10,-18,-45,]),'F_MAP_START':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,23,25,27,28,29,35,36,40,41,45,47,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[19,19,-34,19,19,-37,-38,-2,-39,-40,-19,-47,-42,19,19,19,-36,-35,-4,-48,-43,-25,-21,-26,-41,19,-32,-33,-44,19,19,19,-3,-5,-23,-20,-22,-24,-27,-49,-51,-13,19,-16,-17,-46,-28,-50,-52,-31,-12,-10,-18,-45,]),'B_SEQUENCE_COMPACT_START':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,25,27,28,29,35,36,40,41,45,47,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[22,22,-34,22,22,-37,-38,-2,22,-40,-19,-47,-42,22,22,-36,-35,-4,-48,-43,-25,-21,-26,-41,22,-32,-33,-44,22,22,22,-3,-5,-23,-20,-22,-24,-27,-49,-51,-13,22,-16,-17,22,-28,-50,-52,-31,-12,-10,-18,-45,]),'B_SEQUENCE_START':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,25,27,28,29,35,36,40,41,45,47,56,57,58,59,60,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[23,23,-34,23,23,-37,-38,-2,23,-40,-19,-47,-42,23,23,-36,-35,-4,-48,-43,-25,-21,-26,-41,23,-32,-33,-44,23,23,23,-3,-5,-23,-20,-22,-24,-27,-49,-51,-13,23,-16,-17,23,-28,-50,-52,-31,-12,-10,-18,-45,]),'B_MAP_COMPACT_KEY':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,25,27,28,29,35,36,40,41,45,47,56,57,58,59,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[25,25,-34,25,25,-37,-38,-2,-39,25,-19,-47,-42,25,25,-36,-35,-4,-48,-43,-25,-21,-26,-41,25,-32,-33,-44,25,25,-3,-5,-23,-20,-22,-24,-27,-49,-51,-13,25,-16,-17,-46,-28,-50,-52,-31,-12,-10,-18,-45,]),'B_MAP_KEY':([0,2,3,4,5,6,7,8,9,10,11,20,21,22,25,27,28,29,35,36,40,41,45,47,56,57,58,59,61,64,66,67,68,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[26,26,-34,26,26,-37,-38,-2,-39,26,-19,-47,-42,26,26,-36,-35,-4,-48,-43,-25,-21,-26,-41,26,-32,-33,-44,26,26,-3,-5,-23,-20,-22,-24,-27,-49,-51,-13,26,-16,-17,-46,-28,-50,-52,-31,-12,-10,-18,-45,]),'$end':([1,2,3,6,7,8,9,10,11,20,21,27,28,29,35,36,40,41,45,47,57,58,59,66,67,68,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[0,-1,-34,-37,-38,-2,-39,-40,-19,-47,-42,-36,-35,-4,-48,-43,-25,-21,-26,-41,-32,-33,-44,-3,-5,-23,-20,-22,-24,-27,-49,-51,-13,-16,-17,-46,-28,-50,-52,-31,-12,-10,-18,-45,]),'DOC_END':([3,6,7,8,9,10,11,20,21,29,35,36,40,41,45,47,57,58,59,66,67,68,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[28,-37,-38,-2,-39,-40,-19,-47,-42,66,-48,-43,-25,-21,-26,-41,-32,-33,-44,-3,-5,-23,-20,-22,-24,-27,-49,-51,-13,-16,-17,-46,-28,-50,-52,-31,-12,-10,-18,-45,]),'DEDENT':([5,6,7,8,9,10,11,20,21,29,30,32,33,35,36,38,40,41,43,45,47,55,56,57,58,59,63,64,66,67,68,69,70,71,72,73,74,75,77,82,83,84,85,86,87,88,91,92,93,95,97,98,99,100,101,102,104,105,106,],[31,-37,-38,-2,-39,-40,-19,-47,-42,-4,67,68,-29,-48,-43,31,-25,-21,-29,-26,-41,82,31,-32,-33,-44,90,31,-3,-5,-23,-30,92,-20,-22,-24,-27,-49,-51,-13,97,31,-16,-17,-46,101,103,-28,-50,-52,-31,104,105,-19,-12,106,-10,-18,-45,]),'B_MAP_VALUE':([7,11,24,33,37,40,41,45,47,62,65,68,71,72,73,74,90,92,99,100,103,],[-14,-19,60,-19,-14,-25,-21,-26,-41,89,-15,-23,-20,-22,-24,-27,-11,-28,-14,-19,-9,]),'B_MAP_COMPACT_VALUE':([7,11,24,33,37,40,41,45,47,62,65,68,71,72,73,74,90,92,99,100,103,],[-14,-19,61,-19,-14,-25,-21,-26,-41,-14,-15,-23,-20,-22,-24,-27,-11,-28,-14,-19,-9,]),'F_SEQUENCE_END':([11,40,41,45,47,48,49,50,68,71,72,73,74,76,92,94,],[-19,-25,-21,-26,-41,75,-53,-8,-23,-20,-22,-24,-27,93,-28,-54,]),'F_SEP':([11,40,41,45,47,48,49,50,51,52,68,71,72,73,74,79,80,92,94,96,],[-19,-25,-21,-26,-41,76,-53,-8,78,-55,-23,-20,-22,-24,-27,-57,-7,-28,-54,-56,]),'F_MAP_KEY':([11,40,41,45,47,54,68,71,72,73,74,92,],[-19,-25,-21,-26,-41,81,-23,-20,-22,-24,-27,-28,]),'F_MAP_END':([11,40,41,45,47,51,52,68,71,72,73,74,78,79,80,92,96,],[-19,-25,-21,-26,-41,77,-55,-23,-20,-22,-24,-27,95,-57,-7,-28,-56,]),'DOUBLEQUOTE_END':([12,39,],[40,71,]),'SINGLEQUOTE_END':([16,46,],[45,74,]),'B_FOLD_END':([42,43,69,],[72,-29,-30,]),'B_LITERAL_END':([43,44,69,],[-29,73,-30,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'stream':([0,],[1,]),'docs':([0,],[2,]),'doc':([0,2,4,5,],[3,27,29,30,]),'collection':([0,2,4,5,22,25,56,61,64,84,],[6,6,6,6,55,63,83,88,91,98,]),'scalar':([0,2,4,5,10,13,17,18,19,22,23,25,26,53,56,60,61,64,76,78,84,89,],[7,7,7,7,37,41,47,50,54,37,58,62,65,80,37,86,37,37,50,54,99,102,]),'flow_collection':([0,2,4,5,22,23,25,56,60,61,64,84,],[8,8,8,8,8,57,8,8,85,8,8,8,]),'sequence':([0,2,4,5,22,25,56,60,61,64,84,],[9,9,9,9,9,9,9,87,9,9,9,]),'map':([0,2,4,5,22,25,56,61,64,84,],[10,10,10,10,10,10,10,10,10,10,]),'ignore_indent_dedent':([0,2,4,5,10,13,17,18,19,22,23,25,26,53,56,60,61,64,76,78,84,89,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'sequence_item':([0,2,4,5,9,22,25,56,60,61,64,84,87,],[20,20,20,20,35,20,20,20,20,20,20,20,35,]),'map_item':([0,2,4,5,10,22,25,56,61,64,84,],[21,21,21,21,36,21,21,21,21,21,21,]),'map_item_key':([0,2,4,5,10,22,25,56,61,64,84,],[24,24,24,24,24,24,24,24,24,24,24,]),'scalar_group':([5,14,15,38,56,64,84,],[32,42,44,32,32,32,32,]),'flow_sequence':([18,],[48,]),'flow_sequence_item':([18,76,],[49,94,]),'flow_map':([19,],[51,]),'flow_map_item':([19,78,],[52,96,]),'flow_map_item_key':([19,78,],[53,53,]),'map_item_value':([24,],[59,]),'flow_map_item_value':([53,],[79,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> stream","S'",1,None,None,None),
+  ('stream -> docs','stream',1,'p_stream','stream_productions.py',16),
+  ('collection -> flow_collection','collection',1,'p_collection__flow','productions.py',18),
+  ('doc -> DOC_START doc DOC_END','doc',3,'p_doc__indent','productions.py',18),
+  ('doc -> DOC_START doc','doc',2,'p_doc__indent','productions.py',19),
+  ('doc -> INDENT doc DEDENT','doc',3,'p_doc__indent','productions.py',20),
+  ('flow_map_item_key -> scalar F_MAP_KEY','flow_map_item_key',2,'p_flow_map_item_key','productions.py',18),
+  ('flow_map_item_value -> scalar','flow_map_item_value',1,'p_flow_map_item_value','productions.py',18),
+  ('flow_sequence_item -> scalar','flow_sequence_item',1,'p_flow_sequence_item','productions.py',18),
+  ('map_item_key -> B_MAP_KEY INDENT collection DEDENT','map_item_key',4,'p_map_item___key_value__collection','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE INDENT collection DEDENT','map_item_value',4,'p_map_item___key_value__collection','productions.py',19),
+  ('map_item_key -> B_MAP_COMPACT_KEY collection DEDENT','map_item_key',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',18),
+  ('map_item_value -> B_MAP_COMPACT_VALUE collection DEDENT','map_item_value',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',19),
+  ('sequence_item -> B_SEQUENCE_COMPACT_START collection DEDENT','sequence_item',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',20),
+  ('map_item_key -> scalar','map_item_key',1,'p_map_item_key','productions.py',18),
+  ('map_item_key -> B_MAP_KEY scalar','map_item_key',2,'p_map_item_key__complex_key_scalar','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE flow_collection','map_item_value',2,'p_map_item_value__flow_collection','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE scalar','map_item_value',2,'p_map_item_value__scalar','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE INDENT scalar DEDENT','map_item_value',4,'p_map_item_value__scalar_indented','productions.py',18),
+  ('scalar -> SCALAR','scalar',1,'p_scalar','productions.py',18),
+  ('scalar -> DOUBLEQUOTE_START SCALAR DOUBLEQUOTE_END','scalar',3,'p_scalar__doublequote','productions.py',18),
+  ('scalar -> CAST_TYPE scalar','scalar',2,'p_scalar__explicit_cast','productions.py',18),
+  ('scalar -> B_FOLD_START scalar_group B_FOLD_END','scalar',3,'p_scalar__folded','productions.py',18),
+  ('scalar -> INDENT scalar_group DEDENT','scalar',3,'p_scalar__indented_flow','productions.py',18),
+  ('scalar -> B_LITERAL_START scalar_group B_LITERAL_END','scalar',3,'p_scalar__literal','productions.py',18),
+  ('scalar -> DOUBLEQUOTE_START DOUBLEQUOTE_END','scalar',2,'p_scalar__quote_empty','productions.py',18),
+  ('scalar -> SINGLEQUOTE_START SINGLEQUOTE_END','scalar',2,'p_scalar__quote_empty','productions.py',19),
+  ('scalar -> SINGLEQUOTE_START SCALAR SINGLEQUOTE_END','scalar',3,'p_scalar__singlequote','productions.py',18),
+  ('scalar -> scalar INDENT SCALAR DEDENT','scalar',4,'p_scalar__string_indented_multi_line','productions.py',18),
+  ('scalar_group -> SCALAR','scalar_group',1,'p_scalar_group','productions.py',18),
+  ('scalar_group -> scalar_group SCALAR','scalar_group',2,'p_scalar_group','productions.py',19),
+  ('sequence_item -> B_SEQUENCE_START INDENT collection DEDENT','sequence_item',4,'p_sequence_item__collection','productions.py',18),
+  ('sequence_item -> B_SEQUENCE_START flow_collection','sequence_item',2,'p_sequence_item__flow_collection','productions.py',18),
+  ('sequence_item -> B_SEQUENCE_START scalar','sequence_item',2,'p_sequence_item__scalar','productions.py',18),
+  ('docs -> doc','docs',1,'p_docs__last','stream_productions.py',22),
+  ('docs -> doc DOC_END','docs',2,'p_docs__last','stream_productions.py',23),
+  ('docs -> docs doc','docs',2,'p_docs__init','stream_productions.py',29),
+  ('doc -> collection','doc',1,'p_doc','python_productions.py',50),
+  ('doc -> scalar','doc',1,'p_doc','python_productions.py',51),
+  ('collection -> sequence','collection',1,'p_collection','python_productions.py',57),
+  ('collection -> map','collection',1,'p_collection','python_productions.py',58),
+  ('scalar -> ignore_indent_dedent scalar','scalar',2,'p_doc_scalar_collection_ignore','productions.py',60),
+  ('map -> map_item','map',1,'p_map__last','python_productions.py',64),
+  ('map -> map map_item','map',2,'p_map__init','python_productions.py',71),
+  ('map_item -> map_item_key map_item_value','map_item',2,'p_map_item','python_productions.py',79),
+  ('map_item -> B_MAP_COMPACT_KEY scalar B_MAP_VALUE scalar DEDENT','map_item',5,'p_map_item__compact_scalar','python_productions.py',85),
+  ('map_item_value -> B_MAP_VALUE sequence','map_item_value',2,'p_map_item_value__sequence_no_indent','python_productions.py',91),
+  ('sequence -> sequence_item','sequence',1,'p_sequence__last','python_productions.py',97),
+  ('sequence -> sequence sequence_item','sequence',2,'p_sequence__init','python_productions.py',103),
+  ('flow_collection -> F_SEQUENCE_START flow_sequence F_SEQUENCE_END','flow_collection',3,'p_flow_collection','python_productions.py',110),
+  ('flow_collection -> F_SEQUENCE_START flow_sequence F_SEP F_SEQUENCE_END','flow_collection',4,'p_flow_collection','python_productions.py',111),
+  ('flow_collection -> F_MAP_START flow_map F_MAP_END','flow_collection',3,'p_flow_collection','python_productions.py',112),
+  ('flow_collection -> F_MAP_START flow_map F_SEP F_MAP_END','flow_collection',4,'p_flow_collection','python_productions.py',113),
+  ('flow_sequence -> flow_sequence_item','flow_sequence',1,'p_flow_sequence__last','python_productions.py',119),
+  ('flow_sequence -> flow_sequence F_SEP flow_sequence_item','flow_sequence',3,'p_flow_sequence__init','python_productions.py',125),
+  ('flow_map -> flow_map_item','flow_map',1,'p_flow_map__last','python_productions.py',132),
+  ('flow_map -> flow_map F_SEP flow_map_item','flow_map',3,'p_flow_map__init','python_productions.py',139),
+  ('flow_map_item -> flow_map_item_key flow_map_item_value','flow_map_item',2,'p_flow_map_item','python_productions.py',147),
+  ('ignore_indent_dedent -> INDENT DEDENT','ignore_indent_dedent',2,'p_ignore_indent_dedent','productions.py',304),
+]
@@ -0,0 +1,87 @@
+
+# _parsetab_stream.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.8'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'BB9E67C64E8EB2140AD6BBA366225E7F'
+    
+_lr_action_items = {'DOC_START':([0,2,3,4,5,6,7,8,9,10,11,18,19,27,28,30,35,36,40,41,45,47,57,58,59,67,68,69,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[6,6,-54,-5,-6,6,6,-2,-3,-4,-37,-50,-23,-56,-55,-8,-49,-22,-43,-39,-44,-57,-52,-53,-24,-7,-9,-41,-38,-40,-42,-45,-10,-12,-30,-33,-34,-36,-46,-11,-13,-51,-29,-26,-35,-27,]),'INDENT':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,34,35,36,37,40,41,45,47,50,53,54,56,57,58,59,60,61,62,64,65,67,68,69,71,72,73,74,75,76,77,78,80,81,82,84,85,86,87,89,92,93,95,97,99,100,101,102,104,105,106,],[7,7,-54,-5,29,7,7,-2,38,-4,-37,38,38,-50,-23,38,38,38,56,38,64,-56,-55,-8,-58,-37,-49,-22,29,-43,29,-44,29,29,38,29,38,-52,29,-24,84,38,29,38,29,-7,-9,-41,-38,-40,-42,-45,-10,38,-12,38,29,-17,-30,38,-33,29,-36,38,-46,-11,-13,-51,29,-37,-29,29,-26,-35,-27,]),'SCALAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,30,32,33,34,35,36,38,40,41,42,43,44,45,47,53,56,57,58,59,60,61,64,67,68,69,70,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,100,101,104,105,106,],[11,11,-54,-5,-6,11,34,-2,11,-4,-37,39,11,43,43,46,11,-50,-23,11,11,11,11,11,11,-56,-55,66,-8,-58,70,-47,-49,-22,43,-43,-39,70,-47,70,-44,-57,11,34,-52,-53,-24,11,11,34,-7,-9,-41,-48,-38,-40,-42,-45,-10,11,-12,11,-17,-30,100,-33,-34,-36,11,-46,-11,-13,-51,-47,-29,-26,-35,-27,]),'DOUBLEQUOTE_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,35,36,40,41,45,47,53,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[12,12,-54,-5,-6,12,12,-2,12,-4,-37,12,12,-50,-23,12,12,12,12,12,12,-56,-55,-8,-58,-49,-22,-43,-39,-44,-57,12,12,-52,-53,-24,12,12,12,-7,-9,-41,-38,-40,-42,-45,-10,12,-12,12,-17,-30,12,-33,-34,-36,12,-46,-11,-13,-51,-29,-26,-35,-27,]),'CAST_TYPE':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,35,36,40,41,45,47,53,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[13,13,-54,-5,-6,13,13,-2,13,-4,-37,13,13,-50,-23,13,13,13,13,13,13,-56,-55,-8,-58,-49,-22,-43,-39,-44,-57,13,13,-52,-53,-24,13,13,13,-7,-9,-41,-38,-40,-42,-45,-10,13,-12,13,-17,-30,13,-33,-34,-36,13,-46,-11,-13,-51,-29,-26,-35,-27,]),'B_FOLD_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,35,36,40,41,45,47,53,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[14,14,-54,-5,-6,14,14,-2,14,-4,-37,14,14,-50,-23,14,14,14,14,14,14,-56,-55,-8,-58,-49,-22,-43,-39,-44,-57,14,14,-52,-53,-24,14,14,14,-7,-9,-41,-38,-40,-42,-45,-10,14,-12,14,-17,-30,14,-33,-34,-36,14,-46,-11,-13,-51,-29,-26,-35,-27,]),'B_LITERAL_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,35,36,40,41,45,47,53,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[15,15,-54,-5,-6,15,15,-2,15,-4,-37,15,15,-50,-23,15,15,15,15,15,15,-56,-55,-8,-58,-49,-22,-43,-39,-44,-57,15,15,-52,-53,-24,15,15,15,-7,-9,-41,-38,-40,-42,-45,-10,15,-12,15,-17,-30,15,-33,-34,-36,15,-46,-11,-13,-51,-29,-26,-35,-27,]),'SINGLEQUOTE_START':([0,2,3,4,5,6,7,8,9,10,11,13,17,18,19,20,21,22,23,25,26,27,28,30,32,35,36,40,41,45,47,53,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,76,77,78,81,82,84,85,86,87,89,92,93,95,97,101,104,105,106,],[16,16,-54,-5,-6,16,16,-2,16,-4,-37,16,16,-50,-23,16,16,16,16,16,16,-56,-55,-8,-58,-49,-22,-43,-39,-44,-57,16,16,-52,-53,-24,16,16,16,-7,-9,-41,-38,-40,-42,-45,-10,16,-12,16,-17,-30,16,-33,-34,-36,16,-46,-11,-13,-51,-29,-26,-35,-27,]),'F_SEQUENCE_START':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,23,25,27,28,30,35,36,40,41,45,47,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[20,20,-54,-5,-6,20,20,-2,-3,-4,-37,-50,-23,20,20,20,-56,-55,-8,-49,-22,-43,-39,-44,-57,20,-52,-53,-24,20,20,20,-7,-9,-41,-38,-40,-42,-45,-10,-12,-30,20,-33,-34,-36,-46,-11,-13,-51,-29,-26,-35,-27,]),'F_MAP_START':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,23,25,27,28,30,35,36,40,41,45,47,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[21,21,-54,-5,-6,21,21,-2,-3,-4,-37,-50,-23,21,21,21,-56,-55,-8,-49,-22,-43,-39,-44,-57,21,-52,-53,-24,21,21,21,-7,-9,-41,-38,-40,-42,-45,-10,-12,-30,21,-33,-34,-36,-46,-11,-13,-51,-29,-26,-35,-27,]),'B_SEQUENCE_COMPACT_START':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,25,27,28,30,35,36,40,41,45,47,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[22,22,-54,-5,-6,22,22,22,-3,-4,-37,-50,-23,22,22,-56,-55,-8,-49,-22,-43,-39,-44,-57,22,-52,-53,-24,22,22,22,-7,-9,-41,-38,-40,-42,-45,-10,-12,-30,22,-33,-34,22,-46,-11,-13,-51,-29,-26,-35,-27,]),'B_SEQUENCE_START':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,25,27,28,30,35,36,40,41,45,47,56,57,58,59,60,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[23,23,-54,-5,-6,23,23,23,-3,-4,-37,-50,-23,23,23,-56,-55,-8,-49,-22,-43,-39,-44,-57,23,-52,-53,-24,23,23,23,-7,-9,-41,-38,-40,-42,-45,-10,-12,-30,23,-33,-34,23,-46,-11,-13,-51,-29,-26,-35,-27,]),'B_MAP_COMPACT_KEY':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,25,27,28,30,35,36,40,41,45,47,56,57,58,59,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[25,25,-54,-5,-6,25,25,-2,25,-4,-37,-50,-23,25,25,-56,-55,-8,-49,-22,-43,-39,-44,-57,25,-52,-53,-24,25,25,-7,-9,-41,-38,-40,-42,-45,-10,-12,-30,25,-33,-34,-36,-46,-11,-13,-51,-29,-26,-35,-27,]),'B_MAP_KEY':([0,2,3,4,5,6,7,8,9,10,11,18,19,22,25,27,28,30,35,36,40,41,45,47,56,57,58,59,61,64,67,68,69,71,72,73,74,75,77,82,84,85,86,87,92,93,95,97,101,104,105,106,],[26,26,-54,-5,-6,26,26,-2,26,-4,-37,-50,-23,26,26,-56,-55,-8,-49,-22,-43,-39,-44,-57,26,-52,-53,-24,26,26,-7,-9,-41,-38,-40,-42,-45,-10,-12,-30,26,-33,-34,-36,-46,-11,-13,-51,-29,-26,-35,-27,]),'$end':([1,2,3,4,5,8,9,10,11,18,19,27,28,30,35,36,40,41,45,47,57,58,59,67,68,69,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[0,-1,-54,-5,-6,-2,-3,-4,-37,-50,-23,-56,-55,-8,-49,-22,-43,-39,-44,-57,-52,-53,-24,-7,-9,-41,-38,-40,-42,-45,-10,-12,-30,-33,-34,-36,-46,-11,-13,-51,-29,-26,-35,-27,]),'DOC_END':([3,4,5,8,9,10,11,18,19,30,35,36,40,41,45,47,57,58,59,67,68,69,71,72,73,74,75,77,82,85,86,87,92,93,95,97,101,104,105,106,],[28,-5,-6,-2,-3,-4,-37,-50,-23,67,-49,-22,-43,-39,-44,-57,-52,-53,-24,-7,-9,-41,-38,-40,-42,-45,-10,-12,-30,-33,-34,-36,-46,-11,-13,-51,-29,-26,-35,-27,]),'DEDENT':([4,5,7,8,9,10,11,18,19,30,31,33,34,35,36,38,40,41,43,45,47,55,56,57,58,59,63,64,66,67,68,69,70,71,72,73,74,75,77,82,83,84,85,86,87,88,91,92,93,95,97,98,99,100,101,102,104,105,106,],[-5,-6,32,-2,-3,-4,-37,-50,-23,-8,68,69,-47,-49,-22,32,-43,-39,-47,-44,-57,82,32,-52,-53,-24,90,32,92,-7,-9,-41,-48,-38,-40,-42,-45,-10,-12,-30,97,32,-33,-34,-36,101,103,-46,-11,-13,-51,104,105,-37,-29,106,-26,-35,-27,]),'B_MAP_VALUE':([5,11,24,34,37,40,41,45,47,62,65,69,71,72,73,74,90,92,99,100,103,],[-31,-37,60,-37,-31,-43,-39,-44,-57,89,-32,-41,-38,-40,-42,-45,-28,-46,-31,-37,-25,]),'B_MAP_COMPACT_VALUE':([5,11,24,34,37,40,41,45,47,62,65,69,71,72,73,74,90,92,99,100,103,],[-31,-37,61,-37,-31,-43,-39,-44,-57,-31,-32,-41,-38,-40,-42,-45,-28,-46,-31,-37,-25,]),'F_SEQUENCE_END':([11,40,41,45,47,48,49,50,69,71,72,73,74,76,92,94,],[-37,-43,-39,-44,-57,75,-20,-21,-41,-38,-40,-42,-45,93,-46,-19,]),'F_SEP':([11,40,41,45,47,48,49,50,51,52,69,71,72,73,74,79,80,92,94,96,],[-37,-43,-39,-44,-57,76,-20,-21,78,-15,-41,-38,-40,-42,-45,-16,-18,-46,-19,-14,]),'F_MAP_KEY':([11,40,41,45,47,54,69,71,72,73,74,92,],[-37,-43,-39,-44,-57,81,-41,-38,-40,-42,-45,-46,]),'F_MAP_END':([11,40,41,45,47,51,52,69,71,72,73,74,78,79,80,92,96,],[-37,-43,-39,-44,-57,77,-15,-41,-38,-40,-42,-45,95,-16,-18,-46,-14,]),'DOUBLEQUOTE_END':([12,39,],[40,71,]),'SINGLEQUOTE_END':([16,46,],[45,74,]),'B_FOLD_END':([42,43,70,],[72,-47,-48,]),'B_LITERAL_END':([43,44,70,],[-47,73,-48,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'stream':([0,],[1,]),'docs':([0,],[2,]),'doc':([0,2,6,7,],[3,27,30,31,]),'collection':([0,2,6,7,22,25,56,61,64,84,],[4,4,4,4,55,63,83,88,91,98,]),'scalar':([0,2,6,7,9,13,17,20,21,22,23,25,26,53,56,60,61,64,76,78,84,89,],[5,5,5,5,37,41,47,50,54,37,58,62,65,80,37,86,37,37,50,54,99,102,]),'sequence':([0,2,6,7,22,25,56,60,61,64,84,],[8,8,8,8,8,8,8,87,8,8,8,]),'map':([0,2,6,7,22,25,56,61,64,84,],[9,9,9,9,9,9,9,9,9,9,]),'flow_collection':([0,2,6,7,22,23,25,56,60,61,64,84,],[10,10,10,10,10,57,10,10,85,10,10,10,]),'ignore_indent_dedent':([0,2,6,7,9,13,17,20,21,22,23,25,26,53,56,60,61,64,76,78,84,89,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'sequence_item':([0,2,6,7,8,22,25,56,60,61,64,84,87,],[18,18,18,18,35,18,18,18,18,18,18,18,35,]),'map_item':([0,2,6,7,9,22,25,56,61,64,84,],[19,19,19,19,36,19,19,19,19,19,19,]),'map_item_key':([0,2,6,7,9,22,25,56,61,64,84,],[24,24,24,24,24,24,24,24,24,24,24,]),'scalar_group':([7,14,15,38,56,64,84,],[33,42,44,33,33,33,33,]),'flow_sequence':([20,],[48,]),'flow_sequence_item':([20,76,],[49,94,]),'flow_map':([21,],[51,]),'flow_map_item':([21,78,],[52,96,]),'flow_map_item_key':([21,78,],[53,53,]),'map_item_value':([24,],[59,]),'flow_map_item_value':([53,],[79,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> stream","S'",1,None,None,None),
+  ('stream -> docs','stream',1,'p_stream','stream_productions.py',16),
+  ('collection -> sequence','collection',1,'p_collection','productions.py',18),
+  ('collection -> map','collection',1,'p_collection','productions.py',19),
+  ('collection -> flow_collection','collection',1,'p_collection__flow','productions.py',18),
+  ('doc -> collection','doc',1,'p_doc','productions.py',18),
+  ('doc -> scalar','doc',1,'p_doc','productions.py',19),
+  ('doc -> DOC_START doc DOC_END','doc',3,'p_doc__indent','productions.py',18),
+  ('doc -> DOC_START doc','doc',2,'p_doc__indent','productions.py',19),
+  ('doc -> INDENT doc DEDENT','doc',3,'p_doc__indent','productions.py',20),
+  ('flow_collection -> F_SEQUENCE_START flow_sequence F_SEQUENCE_END','flow_collection',3,'p_flow_collection','productions.py',18),
+  ('flow_collection -> F_SEQUENCE_START flow_sequence F_SEP F_SEQUENCE_END','flow_collection',4,'p_flow_collection','productions.py',19),
+  ('flow_collection -> F_MAP_START flow_map F_MAP_END','flow_collection',3,'p_flow_collection','productions.py',20),
+  ('flow_collection -> F_MAP_START flow_map F_SEP F_MAP_END','flow_collection',4,'p_flow_collection','productions.py',21),
+  ('flow_map -> flow_map F_SEP flow_map_item','flow_map',3,'p_flow_map__init','productions.py',18),
+  ('flow_map -> flow_map_item','flow_map',1,'p_flow_map__last','productions.py',18),
+  ('flow_map_item -> flow_map_item_key flow_map_item_value','flow_map_item',2,'p_flow_map_item','productions.py',18),
+  ('flow_map_item_key -> scalar F_MAP_KEY','flow_map_item_key',2,'p_flow_map_item_key','productions.py',18),
+  ('flow_map_item_value -> scalar','flow_map_item_value',1,'p_flow_map_item_value','productions.py',18),
+  ('flow_sequence -> flow_sequence F_SEP flow_sequence_item','flow_sequence',3,'p_flow_sequence__init','productions.py',18),
+  ('flow_sequence -> flow_sequence_item','flow_sequence',1,'p_flow_sequence__last','productions.py',18),
+  ('flow_sequence_item -> scalar','flow_sequence_item',1,'p_flow_sequence_item','productions.py',18),
+  ('map -> map map_item','map',2,'p_map__init','productions.py',18),
+  ('map -> map_item','map',1,'p_map__last','productions.py',18),
+  ('map_item -> map_item_key map_item_value','map_item',2,'p_map_item','productions.py',18),
+  ('map_item_key -> B_MAP_KEY INDENT collection DEDENT','map_item_key',4,'p_map_item___key_value__collection','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE INDENT collection DEDENT','map_item_value',4,'p_map_item___key_value__collection','productions.py',19),
+  ('map_item -> B_MAP_COMPACT_KEY scalar B_MAP_VALUE scalar DEDENT','map_item',5,'p_map_item__compact_scalar','productions.py',18),
+  ('map_item_key -> B_MAP_COMPACT_KEY collection DEDENT','map_item_key',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',18),
+  ('map_item_value -> B_MAP_COMPACT_VALUE collection DEDENT','map_item_value',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',19),
+  ('sequence_item -> B_SEQUENCE_COMPACT_START collection DEDENT','sequence_item',3,'p_map_item__key__map_item_value__sequence_item__compact_collection','productions.py',20),
+  ('map_item_key -> scalar','map_item_key',1,'p_map_item_key','productions.py',18),
+  ('map_item_key -> B_MAP_KEY scalar','map_item_key',2,'p_map_item_key__complex_key_scalar','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE flow_collection','map_item_value',2,'p_map_item_value__flow_collection','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE scalar','map_item_value',2,'p_map_item_value__scalar','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE INDENT scalar DEDENT','map_item_value',4,'p_map_item_value__scalar_indented','productions.py',18),
+  ('map_item_value -> B_MAP_VALUE sequence','map_item_value',2,'p_map_item_value__sequence_no_indent','productions.py',18),
+  ('scalar -> SCALAR','scalar',1,'p_scalar','productions.py',18),
+  ('scalar -> DOUBLEQUOTE_START SCALAR DOUBLEQUOTE_END','scalar',3,'p_scalar__doublequote','productions.py',18),
+  ('scalar -> CAST_TYPE scalar','scalar',2,'p_scalar__explicit_cast','productions.py',18),
+  ('scalar -> B_FOLD_START scalar_group B_FOLD_END','scalar',3,'p_scalar__folded','productions.py',18),
+  ('scalar -> INDENT scalar_group DEDENT','scalar',3,'p_scalar__indented_flow','productions.py',18),
+  ('scalar -> B_LITERAL_START scalar_group B_LITERAL_END','scalar',3,'p_scalar__literal','productions.py',18),
+  ('scalar -> DOUBLEQUOTE_START DOUBLEQUOTE_END','scalar',2,'p_scalar__quote_empty','productions.py',18),
+  ('scalar -> SINGLEQUOTE_START SINGLEQUOTE_END','scalar',2,'p_scalar__quote_empty','productions.py',19),
+  ('scalar -> SINGLEQUOTE_START SCALAR SINGLEQUOTE_END','scalar',3,'p_scalar__singlequote','productions.py',18),
+  ('scalar -> scalar INDENT SCALAR DEDENT','scalar',4,'p_scalar__string_indented_multi_line','productions.py',18),
+  ('scalar_group -> SCALAR','scalar_group',1,'p_scalar_group','productions.py',18),
+  ('scalar_group -> scalar_group SCALAR','scalar_group',2,'p_scalar_group','productions.py',19),
+  ('sequence -> sequence sequence_item','sequence',2,'p_sequence__init','productions.py',18),
+  ('sequence -> sequence_item','sequence',1,'p_sequence__last','productions.py',18),
+  ('sequence_item -> B_SEQUENCE_START INDENT collection DEDENT','sequence_item',4,'p_sequence_item__collection','productions.py',18),
+  ('sequence_item -> B_SEQUENCE_START flow_collection','sequence_item',2,'p_sequence_item__flow_collection','productions.py',18),
+  ('sequence_item -> B_SEQUENCE_START scalar','sequence_item',2,'p_sequence_item__scalar','productions.py',18),
+  ('docs -> doc','docs',1,'p_docs__last','stream_productions.py',22),
+  ('docs -> doc DOC_END','docs',2,'p_docs__last','stream_productions.py',23),
+  ('docs -> docs doc','docs',2,'p_docs__init','stream_productions.py',29),
+  ('scalar -> ignore_indent_dedent scalar','scalar',2,'p_doc_scalar_collection_ignore','productions.py',60),
+  ('ignore_indent_dedent -> INDENT DEDENT','ignore_indent_dedent',2,'p_ignore_indent_dedent','productions.py',304),
+]
@@ -0,0 +1,202 @@
+# coding=utf-8
+"""Yaml grammar production rules, emitting parse events."""
+from __future__ import absolute_import
+
+from .productions import YAMLProductions
+from .. import event
+from ..nodes import Scalar
+
+DOCUMENT_LEVEL = frozenset(['$end', 'docs', 'DOC_START', 'INDENT'])
+
+
+def is_document_root(p):
+    """True if the symbols under this production can only lead to a document."""
+    for symbol in reversed(p.stack):
+        if symbol.type not in DOCUMENT_LEVEL:
+            return False
+    return True
+
+
+def scalar_event(node):
+    return event.Scalar(node.value, node.__class__.__name__.lower())
+
+
+def events_of(value):
+    """Scalars are still nodes, everything else is already a list of events."""
+    if isinstance(value, Scalar):
+        return [scalar_event(value)]
+    return value
+
+
+class OpenCollection(object):
+    """
+    Events of a block collection, still taking items.
+
+    A collection at the root of a document can't be anything else, its events are emitted as
+    each item is reduced, instead of buffered until the document is done.
+    """
+
+    def __init__(self, p, start, end, item):
+        self.end = end
+        self.streaming = is_document_root(p)
+
+        if self.streaming:
+            self.events = None
+            p.emit(event.DocumentStart())
+            p.emit(start)
+            self.append(p, item)
+        else:
+            self.events = [start]
+            self.events.extend(events_of(item))
+
+    def append(self, p, item):
+        if self.streaming:
+            for item_event in events_of(item):
+                p.emit(item_event)
+        else:
+            self.events.extend(events_of(item))
+        return self
+
+    def close(self, p):
+        if self.streaming:
+            p.emit(self.end)
+            return self
+
+        self.events.append(self.end)
+        return self.events
+
+
+# noinspection PyIncorrectDocstring,PyMethodMayBeStatic
+class EventProductions(YAMLProductions):
+    """
+    Emit events during reductions, instead of building a node tree.
+
+    Collections are lists of events, scalars are still nodes until a collection takes them in.
+    Actions here don't return nodes, so ``strict`` type checks don't apply.
+    """
+
+    # PARSER
+    # ===================================================================
+    def p_stream(self, p):
+        """
+        stream  : docs
+        """
+        p[0] = None
+
+    def p_docs__last(self, p):
+        """
+        docs    : doc
+                | doc DOC_END
+        """
+        p[0] = None
+
+    def p_docs__init(self, p):
+        """
+        docs    : docs doc
+        """
+        p[0] = None
+
+    def p_doc(self, p):
+        """
+        doc : collection
+            | scalar
+        """
+        # Guard, already streamed
+        if isinstance(p[1], OpenCollection):
+            p.emit(event.DocumentEnd())
+            return
+
+        p.emit(event.DocumentStart())
+        for doc_event in events_of(p[1]):
+            p.emit(doc_event)
+        p.emit(event.DocumentEnd())
+
+    def p_collection(self, p):
+        """
+        collection  : sequence
+                    | map
+        """
+        p[0] = p[1].close(p)
+
+    def p_map__last(self, p):
+        """
+        map : map_item
+        """
+        p[0] = OpenCollection(p, event.MappingStart(), event.MappingEnd(), p[1])
+
+    def p_map__init(self, p):
+        """
+        map : map map_item
+        """
+        p[0] = p[1].append(p, p[2])
+
+    def p_map_item(self, p):
+        """
+        map_item    : map_item_key map_item_value
+        """
+        p[0] = events_of(p[1]) + events_of(p[2])
+
+    def p_map_item__compact_scalar(self, p):
+        """
+        map_item    : B_MAP_COMPACT_KEY scalar B_MAP_VALUE scalar DEDENT
+        """
+        p[0] = [scalar_event(p[2]), scalar_event(p[4])]
+
+    def p_map_item_value__sequence_no_indent(self, p):
+        """
+        map_item_value  : B_MAP_VALUE sequence
+        """
+        p[0] = p[2].close(p)
+
+    def p_sequence__last(self, p):
+        """
+        sequence    : sequence_item
+        """
+        p[0] = OpenCollection(p, event.SequenceStart(), event.SequenceEnd(), p[1])
+
+    def p_sequence__init(self, p):
+        """
+        sequence    : sequence sequence_item
+        """
+        p[0] = p[1].append(p, p[2])
+
+    def p_flow_collection(self, p):
+        """
+        flow_collection : F_SEQUENCE_START flow_sequence F_SEQUENCE_END
+                        | F_SEQUENCE_START flow_sequence F_SEP F_SEQUENCE_END
+                        | F_MAP_START flow_map F_MAP_END
+                        | F_MAP_START flow_map F_SEP F_MAP_END
+        """
+        p[0] = p[2]
+
+    def p_flow_sequence__last(self, p):
+        """
+        flow_sequence   : flow_sequence_item
+        """
+        p[0] = [event.SequenceStart(), scalar_event(p[1]), event.SequenceEnd()]
+
+    def p_flow_sequence__init(self, p):
+        """
+        flow_sequence   : flow_sequence F_SEP flow_sequence_item
+        """
+        p[1].insert(-1, scalar_event(p[3]))
+        p[0] = p[1]
+
+    def p_flow_map__last(self, p):
+        """
+        flow_map   : flow_map_item
+        """
+        p[0] = [event.MappingStart()] + p[1] + [event.MappingEnd()]
+
+    def p_flow_map__init(self, p):
+        """
+        flow_map   : flow_map F_SEP flow_map_item
+        """
+        p[1][-1:-1] = p[3]
+        p[0] = p[1]
+
+    def p_flow_map_item(self, p):
+        """
+        flow_map_item  : flow_map_item_key flow_map_item_value
+        """
+        p[0] = [scalar_event(p[1]), scalar_event(p[2])]
@@ -6,28 +6,37 @@ import re
 from textwrap import dedent
 
 from .tokens import YAMLTokens
-from .utils import strict, fold
+from .utils import strict, fold, CollectionBuilder
 from ..nodes import *  # noqa
 
 
 # noinspection PyIncorrectDocstring,PyMethodMayBeStatic
 class YAMLProductions(YAMLTokens):
+    start = 'stream'
+
     # PARSER
     # ===================================================================
     @strict(Docs)
+    def p_stream(self, p):
+        """
+        stream  : docs
+        """
+        p[0] = p[1].build()
+
+    @strict(CollectionBuilder)
     def p_docs__last(self, p):
         """
         docs    : doc
                 | doc DOC_END
         """
-        p[0] = Docs(p[1])
+        p[0] = CollectionBuilder(Docs, p[1])
 
-    @strict(Docs)
+    @strict(CollectionBuilder)
     def p_docs__init(self, p):
         """
         docs    : docs doc
         """
-        p[0] = p[1] + Docs(p[2])
+        p[0] = p[1].append(p[2])
 
     @strict(Doc)
     def p_doc__indent(self, p):
@@ -58,23 +67,29 @@ class YAMLProductions(YAMLTokens):
         """
         collection  : sequence
                     | map
-                    | flow_collection
+        """
+        p[0] = p[1].build()
+
+    @strict(Sequence, Map)
+    def p_collection__flow(self, p):
+        """
+        collection  : flow_collection
         """
         p[0] = p[1]
 
-    @strict(Map)
+    @strict(CollectionBuilder)
     def p_map__last(self, p):
         """
         map : map_item
         """
-        p[0] = Map(p[1])
+        p[0] = CollectionBuilder(Map, p[1])
 
-    @strict(Map)
+    @strict(CollectionBuilder)
     def p_map__init(self, p):
         """
         map : map map_item
         """
-        p[0] = p[1] + Map(p[2])
+        p[0] = p[1].append(p[2])
 
     @strict(tuple)
     def p_map_item(self, p):
@@ -138,7 +153,7 @@ class YAMLProductions(YAMLTokens):
         """
         map_item_value  : B_MAP_VALUE sequence
         """
-        p[0] = p[2]
+        p[0] = p[2].build()
 
     # @strict(Null)
     # def p_map_item_value_empty(self, p):
@@ -147,19 +162,19 @@ class YAMLProductions(YAMLTokens):
     #     """
     #     p[0] = Null(None)
 
-    @strict(Sequence)
+    @strict(CollectionBuilder)
     def p_sequence__last(self, p):
         """
         sequence    : sequence_item
         """
-        p[0] = Sequence(p[1])
+        p[0] = CollectionBuilder(Sequence, p[1])
 
-    @strict(Sequence)
+    @strict(CollectionBuilder)
     def p_sequence__init(self, p):
         """
         sequence    : sequence sequence_item
         """
-        p[0] = p[1] + Sequence(p[2])
+        p[0] = p[1].append(p[2])
 
     @strict(Scalar)
     def p_sequence_item__scalar(self, p):
@@ -271,20 +286,18 @@ class YAMLProductions(YAMLTokens):
 
         p[0] = ScalarDispatch(fold(scalar), cast='str')
 
-    @strict(tuple)
+    @strict(list)
     def p_scalar_group(self, p):
         """
         scalar_group    : SCALAR
                         | scalar_group SCALAR
         """
         if len(p) == 2:
-            p[0] = (str(p[1]),)
+            p[0] = [str(p[1])]
 
         if len(p) == 3:
-            p[0] = p[1] + (str(p[2]),)
-
-        if len(p) == 4:
-            p[0] = p[1] + (str(p[3]),)
+            p[1].append(str(p[2]))
+            p[0] = p[1]
 
     def p_ignore_indent_dedent(self, p):
         """
@@ -299,21 +312,21 @@ class YAMLProductions(YAMLTokens):
                         | F_MAP_START flow_map F_MAP_END
                         | F_MAP_START flow_map F_SEP F_MAP_END
         """
-        p[0] = p[2]
+        p[0] = p[2].build()
 
-    @strict(Sequence)
+    @strict(CollectionBuilder)
     def p_flow_sequence__last(self, p):
         """
         flow_sequence   : flow_sequence_item
         """
-        p[0] = Sequence(p[1])
+        p[0] = CollectionBuilder(Sequence, p[1])
 
-    @strict(Sequence)
+    @strict(CollectionBuilder)
     def p_flow_sequence__init(self, p):
         """
         flow_sequence   : flow_sequence F_SEP flow_sequence_item
         """
-        p[0] = p[1] + Sequence(p[3])
+        p[0] = p[1].append(p[3])
 
     @strict(Scalar)
     def p_flow_sequence_item(self, p):
@@ -322,19 +335,19 @@ class YAMLProductions(YAMLTokens):
         """
         p[0] = p[1]
 
-    @strict(Map)
+    @strict(CollectionBuilder)
     def p_flow_map__last(self, p):
         """
         flow_map   : flow_map_item
         """
-        p[0] = Map(p[1])
+        p[0] = CollectionBuilder(Map, p[1])
 
-    @strict(Map)
+    @strict(CollectionBuilder)
     def p_flow_map__init(self, p):
         """
         flow_map   : flow_map F_SEP flow_map_item
         """
-        p[0] = p[1] + Map(p[3])
+        p[0] = p[1].append(p[3])
 
     @strict(tuple)
     def p_flow_map_item(self, p):
@@ -0,0 +1,149 @@
+# coding=utf-8
+"""Yaml grammar production rules, building python objects directly."""
+from __future__ import absolute_import
+
+from .productions import YAMLProductions
+from ..nodes import Scalar
+
+
+def python_value(value):
+    """Unwrap scalar nodes, collections are already python objects."""
+    if isinstance(value, Scalar):
+        return value.value
+    return value
+
+
+# noinspection PyIncorrectDocstring,PyMethodMayBeStatic
+class PythonProductions(YAMLProductions):
+    """
+    Build python objects during reductions, instead of a node tree.
+
+    Scalars are still parsed into nodes, explicit casts need their raw value.  Collections
+    unwrap scalars as they take them in.  Actions here return python objects, so ``strict``
+    type checks don't apply.
+    """
+
+    # PARSER
+    # ===================================================================
+    def p_stream(self, p):
+        """
+        stream  : docs
+        """
+        p[0] = p[1]
+
+    def p_docs__last(self, p):
+        """
+        docs    : doc
+                | doc DOC_END
+        """
+        p[0] = p[1]
+
+    def p_docs__init(self, p):
+        """
+        docs    : docs doc
+        """
+        # Same as ``YAMLDecoder``, the last document wins.
+        p[0] = p[2]
+
+    def p_doc(self, p):
+        """
+        doc : collection
+            | scalar
+        """
+        p[0] = python_value(p[1])
+
+    def p_collection(self, p):
+        """
+        collection  : sequence
+                    | map
+        """
+        p[0] = p[1]
+
+    def p_map__last(self, p):
+        """
+        map : map_item
+        """
+        key, value = p[1]
+        p[0] = {key: value}
+
+    def p_map__init(self, p):
+        """
+        map : map map_item
+        """
+        key, value = p[2]
+        p[1][key] = value
+        p[0] = p[1]
+
+    def p_map_item(self, p):
+        """
+        map_item    : map_item_key map_item_value
+        """
+        p[0] = python_value(p[1]), python_value(p[2])
+
+    def p_map_item__compact_scalar(self, p):
+        """
+        map_item    : B_MAP_COMPACT_KEY scalar B_MAP_VALUE scalar DEDENT
+        """
+        p[0] = p[2].value, p[4].value
+
+    def p_map_item_value__sequence_no_indent(self, p):
+        """
+        map_item_value  : B_MAP_VALUE sequence
+        """
+        p[0] = p[2]
+
+    def p_sequence__last(self, p):
+        """
+        sequence    : sequence_item
+        """
+        p[0] = [python_value(p[1])]
+
+    def p_sequence__init(self, p):
+        """
+        sequence    : sequence sequence_item
+        """
+        p[1].append(python_value(p[2]))
+        p[0] = p[1]
+
+    def p_flow_collection(self, p):
+        """
+        flow_collection : F_SEQUENCE_START flow_sequence F_SEQUENCE_END
+                        | F_SEQUENCE_START flow_sequence F_SEP F_SEQUENCE_END
+                        | F_MAP_START flow_map F_MAP_END
+                        | F_MAP_START flow_map F_SEP F_MAP_END
+        """
+        p[0] = p[2]
+
+    def p_flow_sequence__last(self, p):
+        """
+        flow_sequence   : flow_sequence_item
+        """
+        p[0] = [p[1].value]
+
+    def p_flow_sequence__init(self, p):
+        """
+        flow_sequence   : flow_sequence F_SEP flow_sequence_item
+        """
+        p[1].append(p[3].value)
+        p[0] = p[1]
+
+    def p_flow_map__last(self, p):
+        """
+        flow_map   : flow_map_item
+        """
+        key, value = p[1]
+        p[0] = {key: value}
+
+    def p_flow_map__init(self, p):
+        """
+        flow_map   : flow_map F_SEP flow_map_item
+        """
+        key, value = p[3]
+        p[1][key] = value
+        p[0] = p[1]
+
+    def p_flow_map_item(self, p):
+        """
+        flow_map_item  : flow_map_item_key flow_map_item_value
+        """
+        p[0] = p[1].value, p[2].value
@@ -0,0 +1,31 @@
+# coding=utf-8
+"""Yaml grammar production rules, emitting each document as soon as it is parsed."""
+from __future__ import absolute_import
+
+from .productions import YAMLProductions
+
+
+# noinspection PyIncorrectDocstring,PyMethodMayBeStatic
+class StreamProductions(YAMLProductions):
+    """Emit documents one at a time, instead of collecting them into ``Docs``."""
+
+    # PARSER
+    # ===================================================================
+    def p_stream(self, p):
+        """
+        stream  : docs
+        """
+        p[0] = None
+
+    def p_docs__last(self, p):
+        """
+        docs    : doc
+                | doc DOC_END
+        """
+        p.emit(p[1])
+
+    def p_docs__init(self, p):
+        """
+        docs    : docs doc
+        """
+        p.emit(p[2])
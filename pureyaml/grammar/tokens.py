@@ -45,6 +45,10 @@ class YAMLTokens(TokenList):
     def __init__(self):
         self.indent_stack = [1]
 
+    def reset(self):
+        """Clear lexer state, ready for new input."""
+        self.indent_stack = [1]
+
     def get_indent_status(self, t):
         column = find_column(t)
         curr_depth, next_depth = self.indent_stack[-1], column
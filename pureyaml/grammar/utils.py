@@ -3,6 +3,7 @@
 from __future__ import absolute_import
 
 import re
+import types
 from functools import wraps
 
 from ..exceptions import YAMLStrictTypeError
@@ -19,11 +20,40 @@ def strict(*types):
                 raise YAMLStrictTypeError(p[0], types, func)
 
         wrapper.co_firstlineno = func.__code__.co_firstlineno
+        wrapper.__wrapped__ = func
         return wrapper
 
     return decorate
 
 
+def unwrap_strict(parser):
+    """Rebind yacc production actions to the raw functions, without ``strict`` type checks."""
+    for production in parser.productions:
+        action = production.callable
+        func = getattr(action, '__wrapped__', None)
+        if func is None:
+            continue
+
+        production.callable = types.MethodType(func, action.__self__)
+
+    return parser
+
+
+class CollectionBuilder(object):
+    """Accumulate collection items in place, build the node once."""
+
+    def __init__(self, node_cls, *items):
+        self.node_cls = node_cls
+        self.items = list(items)
+
+    def append(self, item):
+        self.items.append(item)
+        return self
+
+    def build(self):
+        return self.node_cls(*self.items)
+
+
 def find_column(t):
     """Get cursor position, based on previous newline"""
     pos = t.lexer.lexpos
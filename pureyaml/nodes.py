@@ -9,7 +9,7 @@ from base64 import standard_b64decode, standard_b64encode
 from functools import partial
 from math import isnan
 
-from future.utils import implements_iterator, binary_type, text_type
+from future.utils import binary_type, text_type
 
 from ._compat import collections_abc as abc, total_ordering
 from .exceptions import YAMLCastTypeError
@@ -18,19 +18,34 @@ from .exceptions import YAMLCastTypeError
 # noinspection PyMethodMayBeStatic
 @total_ordering
 class Node(object):
+    __slots__ = ('value',)
+
     def __init__(self, value, **kwargs):
-        self.raw_value = value
         self.value = self.init_value(self, value, **kwargs)
 
     def init_value(self, *values, **kwargs):
         return values[0]
 
+    @property
+    def raw_value(self):
+        # Only scalars keep their source text, everything else is the value as given.
+        return self.value
+
     def __eq__(self, other):
-        try:
-            return self.value == other.value and type(self) == type(other)
-        except AttributeError:
+        # Guard, same node, or structurally different
+        if self is other:
+            return True
+        if type(self) != type(other) or hash(self) != hash(other):
             return False
 
+        return self.value == other.value
+
+    def __hash__(self):
+        return self.compute_hash()
+
+    def compute_hash(self):
+        return hash((type(self), self.value))
+
     def __gt__(self, other):
         return self.value > other.value
 
@@ -51,14 +66,8 @@ class Node(object):
         return '<%s:%s>' % (cls_name, value)
 
 
-@implements_iterator
 class SequenceMixin(abc.Sequence):
-    value = NotImplemented
-
-    def __init__(self, *args, **kwargs):
-        # noinspection PyArgumentList
-        super(SequenceMixin, self).__init__(*args, **kwargs)
-        self._iter = iter(self.value)
+    __slots__ = ()
 
     def __getitem__(self, index):
         return self.value[index]
@@ -69,23 +78,32 @@ class SequenceMixin(abc.Sequence):
     def __contains__(self, x):
         return x in self.value
 
-    def __next__(self):
-        return next(self._iter)
-
     def __iter__(self):
-        return self
+        # Fresh iterator every call, nodes can be walked again and shared between threads.
+        return iter(self.value)
 
 
 class Collection(SequenceMixin, Node):
+    # Only collections cache their hash, scalars are cheap to hash again.
+    __slots__ = ('_hash',)
+
     # noinspection PyMissingConstructor
     def __init__(self, *values, **kwargs):
-        self.raw_value = values
         self.value = self.init_value(*values, **kwargs)
-        self._iter = iter(self.value)
 
     def init_value(self, *value, **kwargs):
         return value
 
+    def __hash__(self):
+        """Structural hash, computed once from the children's cached hashes."""
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+
+        self._hash = self.compute_hash()
+        return self._hash
+
     def __add__(self, other):
         _Collection = self.__class__
 
@@ -98,45 +116,60 @@ class Collection(SequenceMixin, Node):
 
 
 class Docs(Collection):
-    pass
+    __slots__ = ()
 
 
 class Doc(Collection):
-    pass
+    __slots__ = ()
 
 
 class Sequence(Collection):
-    pass
+    __slots__ = ()
 
 
-@implements_iterator
 class MappingMixin(abc.Mapping):
-    value = NotImplemented
+    __slots__ = ()
 
-    def __init__(self, *args, **kwargs):
-        # noinspection PyArgumentList
-        super(MappingMixin, self).__init__(*args, **kwargs)
-        self._iter = iter(self.value)
+    @property
+    def index(self):
+        """Key to position of its first pair, built on first lookup."""
+        try:
+            return self._index
+        except AttributeError:
+            pass
+
+        index = {}
+        for position, (key, _) in enumerate(self.value):
+            index.setdefault(key, position)
+
+        self._index = index
+        return index
+
+    def position(self, key):
+        """Position of the first pair with ``key``, ``-1`` if there's none."""
+        return self.index.get(key, -1)
 
     def __getitem__(self, key):
-        for k, v in self.value:
-            if k == key:
-                return v
+        position = self.position(key)
+        if position < 0:
+            raise KeyError('key %s not found in %r' % (key, self))
 
-        raise KeyError('key %s not found in %r' % (key, self))
+        return self.value[position][1]
+
+    def __contains__(self, key):
+        return self.position(key) >= 0
 
     def __len__(self):
         return len(self.value)
 
-    def __next__(self):
-        _next = next(self._iter)[0]
-        return _next
-
     def __iter__(self):
-        return self
+        # Fresh iterator every call, nodes can be walked again and shared between threads.
+        return (key for key, _ in self.value)
 
 
 class Map(MappingMixin, Collection):
+    __slots__ = ('_index',)
+
     def init_value(self, *values, **kwargs):
         for value in values:
             k, v = value
@@ -156,22 +189,36 @@ class Map(MappingMixin, Collection):
         return values
 
     def __eq__(self, other):  # noqa
-        if type(self) != type(other):
+        # Guard, same node, or structurally different
+        if self is other:
+            return True
+        if type(self) != type(other) or len(self) != len(other) or hash(self) != hash(other):
             return False
 
-        for (self_key, self_value), (other_key, other_value) in zip(sorted(self.value), sorted(other.value)):
-            if self_key != other_key:
-                return False
-            if self_value != other_value:
-                return False
+        # Guard, same order
+        if self.value == other.value:
+            return True
 
-        if len(self) != len(other):
-            return False
+        # Pair order doesn't matter, duplicate pairs do.
+        counts = {}
+        for pair in self.value:
+            counts[pair] = counts.get(pair, 0) + 1
+        for pair in other.value:
+            if not counts.get(pair):
+                return False
+            counts[pair] -= 1
 
         return True
 
+    __hash__ = Collection.__hash__
+
+    def compute_hash(self):
+        # Pair order doesn't matter, sort the pair hashes.
+        return hash((type(self), tuple(sorted(hash(pair) for pair in self.value))))
+
 
 class Scalar(Node):
+    __slots__ = ('raw_value',)
     type = NotImplemented
 
     # noinspection PyMissingConstructor
@@ -183,7 +230,17 @@ class Scalar(Node):
         return self.type(value)
 
     def __eq__(self, other):
-        return str(self.value) == str(other.value) and type(self) == type(other)
+        # Guard, same node, or structurally different
+        if self is other:
+            return True
+        if type(self) != type(other) or hash(self) != hash(other):
+            return False
+
+        return str(self.value) == str(other.value)
+
+    def __hash__(self):
+        # Cheap enough for leaves, not worth caching.
+        return hash((type(self), str(self.value)))
 
     def __gt__(self, other):
         return str(self.value) > str(other.value)
@@ -193,6 +250,7 @@ class Scalar(Node):
 
 
 class Null(Scalar):
+    __slots__ = ()
     type = None
 
     def init_value(self, *values, **kwargs):
@@ -200,6 +258,7 @@ class Null(Scalar):
 
 
 class Str(Scalar):
+    __slots__ = ()
     type = str
 
     def init_value(self, value, *args, **kwargs):
@@ -209,6 +268,7 @@ class Str(Scalar):
 
 
 class Int(Scalar):
+    __slots__ = ()
     type = int
 
     def init_value(self, value, base=None, *args, **kwargs):
@@ -219,6 +279,7 @@ class Int(Scalar):
 
 
 class Float(Scalar):
+    __slots__ = ()
     type = float
 
     def init_value(self, value, *args, **kwargs):
@@ -239,8 +300,11 @@ class Float(Scalar):
 
         return super(Float, self).__eq__(other)
 
+    __hash__ = Scalar.__hash__
+
 
 class Bool(Scalar):
+    __slots__ = ()
     type = bool
     TRUE_VALUES = ['TRUE', 'YES', '1']
     FALSE_VALUES = ['FALSE', 'NO', '0']
@@ -256,6 +320,7 @@ class Bool(Scalar):
 
 
 class Binary(Scalar):
+    __slots__ = ()
     type = 'binary'
 
     def init_value(self, value, *args, **kwargs):
@@ -266,7 +331,6 @@ class Binary(Scalar):
     @classmethod
     def from_decoded(cls, data):
         self = cls.__new__(cls)
-        self.raw_value = data
         self.raw_value = standard_b64encode(data).decode('ascii')
         self.value = standard_b64decode(self.raw_value)
         return self
@@ -303,6 +367,20 @@ class ScalarDispatch(object):
         | (?P<str> .+ $)
     """, re.X)
 
+    # First characters of anything but a plain string, see ``re_dispatch``, ``e5`` is a float.
+    typed_starts = frozenset('0123456789+-.~eEnNtTfFyY')
+    # First characters of null and bool words, values longer than the longest word are strings.
+    word_starts = frozenset('nNtTfFyY')
+    max_word_length = len('false')
+
+    # Cast per frequent short value.  Seeded with common literals, then filled as values show up, a full memo
+    # starts over from the seed so it follows the values a long running process currently sees.
+    memo = {}
+    memo_seed = ('~', 'null', 'Null', 'NULL', 'true', 'True', 'TRUE', 'false', 'False', 'FALSE', 'yes', 'Yes',
+                 'YES', 'no', 'No', 'NO', '0', '1')
+    memo_max_entries = 512
+    memo_max_length = 8
+
     def __new__(cls, value, cast=None):  # noqa
         # Guard, explicit casting
         if cast is not None:
@@ -321,44 +399,112 @@ class ScalarDispatch(object):
         if value == '':
             return Null(value)
 
+        # Fast path, can't be null, bool or a number.  Multi line values go to ``re_dispatch``, which rejects them.
+        first = value[0]
+        if '\n' not in value and (
+                first not in cls.typed_starts or (first in cls.word_starts and len(value) > cls.max_word_length)):
+            return cls.map['str'](value)
+
+        # Fast path, already classified
+        scalar_type = cls.memo.get(value)
+        if scalar_type is not None:
+            return scalar_type(value)
+
         match = cls.re_dispatch.match(value)
         try:
-            return cls.map[match.lastgroup](value)
+            scalar_type = cls.map[match.lastgroup]
         except AttributeError:
             message = 'Cannot cast data: {value}'.format(value=value)
             raise YAMLCastTypeError(message=message)
 
+        if len(value) <= cls.memo_max_length:
+            cls.remember(value, scalar_type)
+        return scalar_type(value)
+
+    @classmethod
+    def remember(cls, value, scalar_type):
+        if len(cls.memo) >= cls.memo_max_entries:
+            cls.reset_memo()
+        cls.memo[value] = scalar_type
+
+    @classmethod
+    def reset_memo(cls):
+        """Empty the memo down to ``memo_seed``."""
+        cls.memo.clear()
+        for value in cls.memo_seed:
+            cls.memo[value] = cls.map[cls.re_dispatch.match(value).lastgroup]
+
+
+ScalarDispatch.reset_memo()
+
 
 # noinspection PyMethodMayBeStatic
 class NodeVisitor(object):
     def __init__(self, *args, **kwargs):
         pass
 
+    @classmethod
+    def dispatch_table(cls):
+        """Visit method per node type, resolved once per visitor class, filled as types show up."""
+        # Guard, a subclass must not share its parent's table
+        table = cls.__dict__.get('_dispatch')
+        if table is None:
+            table = {}
+            setattr(cls, '_dispatch', table)
+        return table
+
+    @classmethod
+    def resolve(cls, node_type):
+        """
+        Find the visit method for ``node_type``, ``None`` if it isn't a node.
+
+        ``visit_<name>`` is looked up along the node's MRO, so a subclass of ``Scalar`` without its own
+        method falls back to ``visit_Scalar``, then to ``generic_visit``.
+        """
+        method = None
+        if issubclass(node_type, Node):
+            method = cls.generic_visit
+            # Only node classes, mixin ABCs like ``abc.Sequence`` share names with nodes.
+            for klass in (klass for klass in node_type.__mro__ if issubclass(klass, Node)):
+                candidate = getattr(cls, 'visit_%s' % klass.__name__, None)
+                if candidate is not None:
+                    method = candidate
+                    break
+
+        cls.dispatch_table()[node_type] = method
+        return method
+
+    @classmethod
+    def method_for(cls, dispatch, node_type):
+        """Visit method for ``node_type`` from ``dispatch``, resolved on first sight."""
+        try:
+            return dispatch[node_type]
+        except KeyError:
+            return cls.resolve(node_type)
+
     def visit(self, node):
+        dispatch = self.dispatch_table()
+        generator_type = types.GeneratorType
         stack = [node]
+        push, pop = stack.append, stack.pop
         last_result = None
         while stack:
-            try:
-                last = stack[-1]
-                if isinstance(last, types.GeneratorType):
-                    sent = last.send(last_result)
-                    stack.append(sent)
+            last = stack[-1]
+            last_type = type(last)
+            if last_type is generator_type:
+                try:
+                    push(last.send(last_result))
                     last_result = None
-                elif isinstance(last, Node):
-                    stack.append(self._visit(stack.pop()))
-                else:
-                    last_result = stack.pop()
-            except StopIteration:
-                stack.pop()
-        return last_result
-
-    def _visit(self, node):
-        method_name = 'visit_%s' % type(node).__name__
-        method = getattr(self, method_name, None)
+                except StopIteration:
+                    pop()
+                continue
 
-        if method is None:
-            method = self.generic_visit
-        return method(node)
+            method = self.method_for(dispatch, last_type)
+            if method is None:
+                last_result = pop()
+            else:
+                push(method(self, pop()))
+        return last_result
 
     def generic_visit(self, node):
         raise RuntimeError('No visit_%s method' % type(node).__name__)
@@ -2,16 +2,28 @@
 """Build yacc parser from lex tokens."""
 from __future__ import absolute_import
 
+import codecs
 import logging
+import mmap
+import re
+from copy import copy
+from io import BytesIO, IncrementalNewlineDecoder
 from os import environ
 
+from future.utils import iteritems, string_types
+
 from .exceptions import YAMLSyntaxError, YAMLUnknownSyntaxError
+from .grammar.event_productions import EventProductions
 from .grammar.productions import YAMLProductions
+from .grammar.python_productions import PythonProductions
+from .grammar.stream_productions import StreamProductions
 from .grammar.tokens import YAMLTokens
+from .grammar.utils import unwrap_strict
 from .ply.lex import lex
-from .ply.yacc import yacc
+from .ply.yacc import yacc, YaccProduction, YaccSymbol
 
 OPTIMIZE = environ.get('PUREYAML_OPTIMIZE', 'true').lower() == 'true'
+STRICT = environ.get('PUREYAML_STRICT', 'true').lower() == 'true'
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +33,8 @@ yacc_logger = logging.getLogger('pureyaml.ply.yacc')
 
 # noinspection PyMethodMayBeStatic
 class YAMLLexer(YAMLTokens):
+    _cache = {}
+
     @classmethod
     def build(cls, **kwargs):
         self = cls()
@@ -32,6 +46,44 @@ class YAMLLexer(YAMLTokens):
             kwargs.setdefault('optimize', True)
         return lex(**kwargs)
 
+    @classmethod
+    def cached(cls, optimize=False):
+        """Get a fresh lexer, cloned from a process wide prototype."""
+        key = cls, bool(OPTIMIZE or optimize)
+        try:
+            prototype = cls._cache[key]
+        except KeyError:
+            prototype = cls._cache[key] = cls.build(optimize=optimize)
+
+        return cls.clone_lexer(prototype)
+
+    @classmethod
+    def clone_lexer(cls, lexer):
+        """Copy lexer tables, bound to new lexer state."""
+        # note: ``ply.lex.Lexer.clone`` drops all but the last regex of each state, rebind here instead.
+        module = cls()
+
+        def rebind(func):
+            return func if func is None else getattr(module, func.__name__)
+
+        clone = copy(lexer)
+        clone.lexstatere = dict(  # :off
+            (state, [(regex, [(rebind(f[0]), f[1]) if f else f for f in findex]) for regex, findex in lexre])
+            for state, lexre in iteritems(lexer.lexstatere)
+        )  # :on
+        clone.lexstateerrorf = dict((state, rebind(f)) for state, f in iteritems(lexer.lexstateerrorf))
+        clone.lexmodule = module
+        return cls.reset_lexer(clone)
+
+    @staticmethod
+    def reset_lexer(lexer):
+        """Clear lexer state, ready for new input."""
+        lexer.lexmodule.reset()
+        lexer.lexstatestack = []
+        lexer.lineno = 1
+        lexer.begin('INITIAL')
+        return lexer
+
     @classmethod
     def tokenize(cls, data):
         lexer = cls.build()
@@ -46,25 +98,283 @@ class YAMLLexer(YAMLTokens):
         raise YAMLSyntaxError(t, t.value[0])
 
 
+class ChunkedLexer(object):
+    """
+    Lex a file like object through a sliding window, instead of reading it all into one string.
+
+    The window holds whole lines, plus the indent and first character of the next line, so
+    indent tokens are never cut short.  Tokens only start on whole lines, and quoted or flow
+    scalars are read ahead to their terminator.  Consumed lines are dropped, up to the line
+    the lexer is on, so ``find_column`` still works.
+    """
+    chunk_size = 64 * 1024
+
+    # A token in these states runs to the next terminator, possibly across lines.
+    terminators = {  # :off
+        'doublequote': re.compile(r'(?<!\\)"'),
+        'singlequote': re.compile(r"(?<!\\)'"),
+        'flowsequence': re.compile(r'[\[\],\#]'),
+        'flowmap': re.compile(r'[\{\}\:,\#]'),
+    }  # :on
+
+    def __init__(self, lexer, chunk_size=None):
+        self.lexer = lexer
+        self.chunk_size = chunk_size or self.chunk_size
+        self.fp = None
+        self.pending = ''
+        self.eof = False
+
+    def input(self, fp):
+        self.fp, self.pending, self.eof = fp, '', False
+        self.lexer.input(fp.read(0))
+        self.feed()
+
+    def token(self):
+        lexer = self.lexer
+        while True:
+            self.fill()
+            token = lexer.token()
+
+            # Guard, end of input
+            if token is not None or self.eof:
+                return token
+
+            # Window exhausted, undo ``ply``'s end of input step and read on.
+            lexer.lexpos -= 1
+            self.feed()
+
+    def fill(self):
+        """Read ahead while the next token could run past the window."""
+        lexer = self.lexer
+        terminator = self.terminators.get(lexer.lexstate)
+        while terminator and not self.eof:
+            match = terminator.search(lexer.lexdata, lexer.lexpos)
+            if match and match.end() < len(lexer.lexdata):
+                break
+            self.feed()
+
+    def feed(self):
+        lexer = self.lexer
+        chunk = self.fp.read(self.chunk_size)
+        if chunk:
+            self.pending += chunk
+            end = self.window_end(self.pending)
+        else:
+            self.eof, end = True, len(self.pending)
+
+        text, self.pending = self.pending[:end], self.pending[end:]
+
+        # Drop consumed lines, keep the newline before the current token.
+        start = max(0, lexer.lexdata.rfind('\n', 0, lexer.lexpos))
+        lexer.lexdata = lexer.lexdata[start:] + text
+        lexer.lexpos -= start
+
+        # Tokens may only start on whole lines.
+        lexer.lexlen = len(lexer.lexdata) if self.eof else lexer.lexdata.rfind('\n') + 1
+
+    @staticmethod
+    def window_end(text):
+        """End of the last whole line, plus the indent and first character of the line after it."""
+        last = len(text.rstrip()) - 1
+        newline = text.rfind('\n', 0, max(last, 0))
+
+        # Guard, no whole line yet
+        if newline < 0:
+            return 0
+
+        line = text[newline + 1:last + 1]
+        return newline + 1 + len(line) - len(line.lstrip()) + 1
+
+
+class MappedFile(object):
+    """
+    Read only text file, memory mapped instead of read.
+
+    Bytes are decoded a chunk at a time, as the lexer asks for them.  Pages are shared through
+    the OS page cache with every other process mapping the same file.
+    """
+
+    def __init__(self, path, encoding='utf-8'):
+        with open(path, 'rb') as f:
+            # Guard, empty files can't be mapped
+            try:
+                self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                self.mapping = BytesIO()
+
+        # Universal newlines, like ``io.open``
+        self.decoder = IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(), translate=True)
+
+    def read(self, size=-1):
+        # Guard, nothing asked for
+        if not size:
+            return u''
+
+        while True:
+            data = self.mapping.read() if size < 0 else self.mapping.read(size)
+            text = self.decoder.decode(data, final=not data or size < 0)
+
+            # Guard, only part of a character or a trailing ``\r`` read, an empty string would mean end of file
+            if text or not data:
+                return text
+
+    def close(self):
+        self.mapping.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class TableDriver(object):
+    """One LALR parse over cached tables, advanced a shift or reduce at a time."""
+
+    def __init__(self, parser, lexer, emit, error):
+        self.actions, self.goto, self.productions = parser.action, parser.goto, parser.productions
+        self.defaulted_states = parser.defaulted_states
+        self.lexer, self.error = lexer, error
+
+        self.end = YaccSymbol()
+        self.end.type = '$end'
+        self.statestack, self.symstack = [0], [self.end]
+        self.lookahead = None
+
+        self.pslice = YaccProduction(None, stack=self.symstack)
+        self.pslice.lexer, self.pslice.parser, self.pslice.emit = lexer, parser, emit
+
+    def step(self):
+        """Shift or reduce once, ``False`` once the input is accepted."""
+        action = self.next_action()
+
+        # Guard, syntax error
+        if action is None:
+            self.error(None if self.lookahead is self.end else self.lookahead)
+
+        # Guard, accept
+        if action == 0:
+            return False
+
+        if action > 0:
+            self.shift(action)
+        else:
+            self.reduce(self.productions[-action])
+        return True
+
+    def next_action(self):
+        state = self.statestack[-1]
+        if state in self.defaulted_states:
+            return self.defaulted_states[state]
+
+        if self.lookahead is None:
+            self.lookahead = self.lexer.token() or self.end
+        return self.actions[state].get(self.lookahead.type)
+
+    def shift(self, state):
+        self.statestack.append(state)
+        self.symstack.append(self.lookahead)
+        self.lookahead = None
+
+    def reduce(self, production):
+        symbol = YaccSymbol()
+        symbol.type, symbol.value = production.name, None
+        if production.len:
+            self.pslice.slice = [symbol] + self.symstack[-production.len:]
+            del self.symstack[-production.len:]
+            del self.statestack[-production.len:]
+        else:
+            self.pslice.slice = [symbol]
+
+        production.callable(self.pslice)
+        self.symstack.append(symbol)
+        self.statestack.append(self.goto[self.statestack[-1]][production.name])
+
+
 # noinspection PyMethodMayBeStatic
 class YAMLParser(YAMLProductions):
+    _cache = {}
+    tabmodule = 'pureyaml.grammar._parsetab'
+    debugfile = '_parser.out'
+
     # noinspection PyMissingConstructor
     def __init__(self, **kwargs):
         kwargs.setdefault('debug', False)
         self.debug = kwargs.get('debug')
         self.optimize = OPTIMIZE or kwargs.get('optimize')
+        self.strict = kwargs.pop('strict', STRICT)
 
-        kwargs.setdefault('module', self)
-        kwargs.setdefault('tabmodule', 'pureyaml.grammar._parsetab')
-        kwargs.setdefault('debugfile', '_parser.out')
+        kwargs.setdefault('tabmodule', self.tabmodule)
+        kwargs.setdefault('debugfile', self.debugfile)
         kwargs.setdefault('debuglog', yacc_logger)
         kwargs.setdefault('errorlog', yacc_logger)
-        self.parser = yacc(**kwargs)
+        self.parser = self.build(**kwargs)
+
+    def build(self, **kwargs):
+        """Build yacc tables once per parser class and options, reuse for every instance after."""
+        # Guard, explicit module
+        if 'module' in kwargs:
+            return self._build(**kwargs)
+
+        key = type(self), self.strict, tuple(sorted(kwargs.items()))
+        try:
+            return self._cache[key]
+        except KeyError:
+            parser = self._cache[key] = self._build(module=self, **kwargs)
+            return parser
+
+    def _build(self, **kwargs):
+        parser = yacc(**kwargs)
+
+        # Production mode, skip ``strict`` type checks on every reduction.
+        if not self.strict:
+            unwrap_strict(parser)
+        return parser
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget cached lexers and parsers, next use rebuilds them."""
+        cls._cache.clear()
+        YAMLLexer._cache.clear()
 
     def parse(self, data, **kwargs):
         kwargs.setdefault('debug', False)
-        kwargs.setdefault('lexer', YAMLLexer.build(optimize=self.optimize))
-        return self.parser.parse(data, **kwargs)
+        if 'lexer' not in kwargs:
+            kwargs['lexer'] = self.lexer_for(data)
+        try:
+            return self.parser.parse(data, **kwargs)
+        finally:
+            # Cached tables outlive the parse, don't keep its stacks, lexer and input alive with them.
+            self.parser.statestack = self.parser.symstack = self.parser.token = None
+
+    def lexer_for(self, data):
+        lexer = YAMLLexer.cached(optimize=self.optimize)
+
+        # File like object, lex it in chunks instead of reading it all.
+        if not isinstance(data, string_types):
+            return ChunkedLexer(lexer)
+        return lexer
+
+    def iterparse(self, data, lexer=None):
+        """
+        Drive the LALR tables one token at a time, yield values as productions ``p.emit`` them.
+
+        Same tables and actions as ``parse``, but control returns to the caller between tokens,
+        so consumers can stop early.
+        """
+        if lexer is None:
+            lexer = self.lexer_for(data)
+        lexer.input(data)
+
+        emitted = []
+        driver = TableDriver(self.parser, lexer, emitted.append, self.p_error)
+        while driver.step():
+            for value in emitted:
+                yield value
+            del emitted[:]
+
+        for value in emitted:
+            yield value
 
     def parsedebug(self, data, **kwargs):
         logger.info('\n'.join(repr(token) for token in self.tokenize(data)))
@@ -83,3 +393,86 @@ class YAMLParser(YAMLProductions):
             raise YAMLUnknownSyntaxError('Unknown origin %r' % p)
 
         raise YAMLSyntaxError(p)
+
+
+# noinspection PyMethodMayBeStatic
+class YAMLPythonParser(YAMLParser, PythonProductions):
+    """Build python objects directly, skipping the intermediate node tree."""
+    tabmodule = 'pureyaml.grammar._parsetab_python'
+    debugfile = '_parser_python.out'
+
+    def __init__(self, **kwargs):
+        # Python objects aren't nodes, ``strict`` type checks don't apply.
+        kwargs['strict'] = False
+        super(YAMLPythonParser, self).__init__(**kwargs)
+
+
+# noinspection PyMethodMayBeStatic
+class YAMLEventParser(YAMLParser, EventProductions):
+    """Emit parse events from ``iterparse``, without building a node tree."""
+    tabmodule = 'pureyaml.grammar._parsetab_events'
+    debugfile = '_parser_events.out'
+
+    def __init__(self, **kwargs):
+        # Events aren't nodes, ``strict`` type checks don't apply.
+        kwargs['strict'] = False
+        super(YAMLEventParser, self).__init__(**kwargs)
+
+
+# noinspection PyMethodMayBeStatic
+class YAMLStreamParser(StreamProductions, YAMLParser):
+    """Emit each ``Doc`` node from ``iterparse`` as soon as it is parsed."""
+    tabmodule = 'pureyaml.grammar._parsetab_stream'
+    debugfile = '_parser_stream.out'
+
+
+# noinspection PyMethodMayBeStatic
+class YAMLPythonStreamParser(StreamProductions, YAMLPythonParser):
+    """Emit each document, as python objects, from ``iterparse`` as soon as it is parsed."""
+    tabmodule = 'pureyaml.grammar._parsetab_python_stream'
+    debugfile = '_parser_python_stream.out'
+
+
+def iter_document_texts(lines):
+    """
+    Split yaml lines into one text per document, at ``---`` and ``...`` markers in column 0.
+
+    Only one document is held at a time.  Texts with nothing but blank lines and comments are
+    skipped.
+    """
+    for document in iter_document_lines(lines):
+        if any(is_content(line[3:] if document_marker(line) else line) for line in document):
+            yield ''.join(document)
+
+
+def iter_document_lines(lines):
+    """Lines of each document, a start marker opens the next one, an end marker closes this one."""
+    document = []
+    for line in lines:
+        marker = document_marker(line)
+        if marker == '---' and document:
+            yield document
+            document = []
+
+        document.append(line)
+
+        if marker == '...':
+            yield document
+            document = []
+
+    if document:
+        yield document
+
+
+def document_marker(line):
+    """``'---'`` or ``'...'`` for a document marker line, ``None`` for anything else."""
+    if line[3:4] not in ('', ' ', '\t', '\r', '\n'):
+        return None
+    if line.startswith(('---', '...')):
+        return line[:3]
+    return None
+
+
+def is_content(text):
+    """Anything but blank lines, comments and directives."""
+    return bool(text.strip()) and not text.lstrip().startswith(('#', '%'))
@@ -0,0 +1,110 @@
+# coding=utf-8
+"""Decode independent documents across a process pool."""
+from __future__ import absolute_import
+
+import atexit
+from itertools import islice
+from multiprocessing import Pool
+
+from .decoder import YAMLDecoder
+
+# Smaller batches are decoded in process, starting a pool costs more than it saves.
+MIN_POOL_BATCH = 64
+
+worker_decoder = None
+_pools = {}
+
+
+def init_worker(cls, kwargs):
+    """Create the worker's decoder, and build lexer and parser tables before the first document."""
+    global worker_decoder
+    worker_decoder = cls(**kwargs)
+
+    for _ in worker_decoder.iterdecode(u'~\n'):
+        pass
+
+
+def decode_all(text):
+    return list(worker_decoder.iterdecode(text))
+
+
+def decode_or_error(text, decoder=None):
+    """Decode like ``loads``, return the exception instead of raising it."""
+    try:
+        return (decoder or worker_decoder).decode(text)
+    except Exception as e:
+        return e
+
+
+def get_pool(workers, cls, kwargs):
+    """Get a worker pool, kept warm for the next batch with the same decoder options."""
+    key = workers, cls, tuple(sorted(kwargs.items()))
+    try:
+        return _pools[key]
+    except KeyError:
+        pool = _pools[key] = Pool(workers, init_worker, (cls, kwargs))
+        return pool
+
+
+@atexit.register
+def close_pools():
+    """Shut down warm worker pools, the next batch starts new ones."""
+    for pool in _pools.values():
+        pool.terminate()
+        pool.join()
+    _pools.clear()
+
+
+def map_documents(texts, workers=None, chunksize=1, cls=None, **kwargs):
+    """
+    Decode each yaml text like ``loads``, in warm worker processes.
+
+    :param texts: Iterable of yaml texts.
+    :param int workers: Number of worker processes, default decodes in process.
+    :param int chunksize: Texts sent to a worker per task.
+    :param cls: Decoder class, default ``YAMLDecoder``.
+    :return: List of python objects, or the exception raised decoding that text, in order.
+    """
+    cls = cls or YAMLDecoder
+    texts = list(texts)
+
+    # Guard, not worth a pool
+    if not workers or len(texts) < MIN_POOL_BATCH:
+        decoder = cls(**kwargs)
+        return [decode_or_error(text, decoder) for text in texts]
+
+    return get_pool(workers, cls, kwargs).map(decode_or_error, texts, chunksize)
+
+
+def imap_documents(texts, workers, chunksize=1, cls=None, **kwargs):
+    """
+    Decode yaml texts in worker processes, yield every document in the original order.
+
+    Texts are handed to the pool a batch at a time, so a long stream isn't read ahead all at once.
+
+    :param texts: Iterable of yaml texts.
+    :param int workers: Number of worker processes.
+    :param int chunksize: Texts sent to a worker per task.
+    :param cls: Decoder class, default ``YAMLDecoder``.
+    :return: Iterator of python objects.
+    """
+    texts = iter(texts)
+    batch_size = workers * chunksize * 4
+
+    pool = Pool(workers, init_worker, (cls or YAMLDecoder, kwargs))
+    try:
+        while True:
+            batch = list(islice(texts, batch_size))
+
+            # Guard, end of input
+            if not batch:
+                break
+
+            for docs in pool.imap(decode_all, batch, chunksize):
+                for doc in docs:
+                    yield doc
+
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,201 @@
+# coding=utf-8
+"""Path queries over the event stream, only the selected values are built."""
+from __future__ import absolute_import
+
+import re
+
+from future.utils import string_types, text_type
+
+from . import event
+
+re_path = re.compile(r"""
+      (?P<dot> \. )? (?P<key> [^.\[\]]+ )
+    | \[ (?P<index> [0-9]+ ) \]
+""", re.X)
+
+
+def parse_path(path):
+    """Split ``'a.b[0].c'`` into ``('a', 'b', 0, 'c')``."""
+    parts, pos = [], 0
+    while pos < len(path):
+        match = re_path.match(path, pos)
+
+        dot, key, index = match.group('dot', 'key', 'index') if match else (None, None, None)
+
+        # Guard, bad syntax, keys after the first need a dot
+        if match is None or key is not None and bool(dot) != bool(pos):
+            raise ValueError('Invalid path %r at %d' % (path, pos))
+
+        parts.append(key if index is None else int(index))
+        pos = match.end()
+
+    return tuple(parts)
+
+
+def path_key(key):
+    """Map keys are matched as text, ``'ports.80'`` finds the int key ``80``."""
+    return key if isinstance(key, string_types) else text_type(key)
+
+
+class Frame(object):
+    """An open collection on the way to a selected path."""
+    expect_key = object()
+
+    def __init__(self, path, is_map):
+        self.path = path
+        self.is_map = is_map
+        self.key = self.expect_key
+        self.index = 0
+
+    def child_path(self):
+        """Path of the next value, and step past it."""
+        if self.is_map:
+            key, self.key = self.key, self.expect_key
+            return self.path + (key,)
+
+        self.index += 1
+        return self.path + (self.index - 1,)
+
+
+class Builder(object):
+    """Build python objects for the events of one selected value."""
+
+    def __init__(self):
+        self.stack = []
+        self.value = None
+
+    def feed(self, item):
+        """Take an event, True once the value is complete."""
+        if isinstance(item, (event.MappingStart, event.SequenceStart)):
+            self.stack.append(([], isinstance(item, event.MappingStart)))
+            return False
+
+        if isinstance(item, (event.MappingEnd, event.SequenceEnd)):
+            items, is_map = self.stack.pop()
+            value = dict(zip(items[::2], items[1::2])) if is_map else items
+        else:
+            value = item.value
+
+        # Guard, nested value
+        if self.stack:
+            self.stack[-1][0].append(value)
+            return False
+
+        self.value = value
+        return True
+
+
+def lookup(value, parts):
+    """Value at ``parts`` under an already built value, ``LookupError`` if it isn't there."""
+    for part in parts:
+        if isinstance(value, list) and not isinstance(part, string_types):
+            value = value[part]
+        elif isinstance(value, dict):
+            keys = [key for key in value if path_key(key) == part]
+            if not keys:
+                raise KeyError(part)
+            value = value[keys[0]]
+        else:
+            raise KeyError(part)
+    return value
+
+
+class Selection(object):
+    """Walk the events of one document towards the selected paths, build only their values."""
+
+    def __init__(self, paths):
+        self.targets = dict((parse_path(path), path) for path in paths)
+        self.prefixes = set(target[:i] for target in self.targets for i in range(len(target)))
+        self.stack, self.builder, self.skip_depth, self.target = [], None, 0, None
+
+    @property
+    def done(self):
+        return not self.targets
+
+    def feed(self, item):
+        """Take an event, return ``(path, value)`` pairs it completes."""
+        if isinstance(item, event.DocumentStart):
+            return []
+        if self.builder is not None:
+            return self.build(item)
+        if self.skip_depth:
+            self.skip_depth += is_start(item) - is_end(item)
+            return []
+        return self.walk(item)
+
+    def walk(self, item):
+        if is_end(item):
+            self.stack.pop()
+            return []
+
+        # Guard, map key
+        if self.stack and self.stack[-1].is_map and self.stack[-1].key is Frame.expect_key:
+            self.take_key(item)
+            return []
+
+        path = self.stack[-1].child_path() if self.stack else ()
+        if path in self.targets:
+            self.target, self.builder = path, Builder()
+            return self.build(item)
+
+        if is_start(item) and path in self.prefixes:
+            self.stack.append(Frame(path, isinstance(item, event.MappingStart)))
+        elif is_start(item):
+            self.skip_depth = 1
+        return []
+
+    def take_key(self, item):
+        # Guard, collection as key, never on a path
+        if is_start(item):
+            self.stack[-1].key, self.skip_depth = None, 1
+        else:
+            self.stack[-1].key = path_key(item.value)
+
+    def build(self, item):
+        if not self.builder.feed(item):
+            return []
+
+        target, value = self.target, self.builder.value
+        self.target = self.builder = None
+        found = [(self.targets.pop(target), value)]
+
+        # Targets under this one are never walked, take them from the built value.
+        for nested in [other for other in self.targets if other[:len(target)] == target]:
+            path = self.targets.pop(nested)
+            try:
+                found.append((path, lookup(value, nested[len(target):])))
+            except LookupError:
+                pass
+        return found
+
+
+def is_start(item):
+    return isinstance(item, (event.MappingStart, event.SequenceStart))
+
+
+def is_end(item):
+    return isinstance(item, (event.MappingEnd, event.SequenceEnd))
+
+
+def iter_selected(events, paths):
+    """
+    Yield ``(path, value)`` for each path found in the first document, in document order.
+
+    Values outside the paths are skipped without being built.  A path under another selected
+    path is taken from that path's value.  Stops reading events once every path is found.  The
+    event parser buffers each item of a root collection until it's complete, so skipped values
+    are still parsed.
+
+    :param events: Iterator of ``pureyaml.event`` objects.
+    :param paths: Path strings, like ``'spec.containers[0].image'``.
+    """
+    selection = Selection(paths)
+    for item in events:
+        # Guard, first document only
+        if isinstance(item, event.DocumentEnd):
+            return
+
+        for found in selection.feed(item):
+            yield found
+        if selection.done:
+            return
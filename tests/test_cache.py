@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+import pickle
+import threading
+from copy import deepcopy
+from io import StringIO
+
+from pytest import raises
+
+import pureyaml
+from pureyaml._compat import OrderedDict
+from pureyaml.cache import ParseCache, PathCache, freeze
+from pureyaml.decoder import YAMLDecoder
+
+text = u'flags:\n  beta: true\n  regions: [us, eu]\n'
+expected = {'flags': {'beta': True, 'regions': ['us', 'eu']}}
+
+
+def test_cache_counts_hits_and_misses():
+    cache = ParseCache()
+
+    assert pureyaml.loads(text, cache=cache) == expected
+    assert pureyaml.loads(text, cache=cache) == expected
+    assert pureyaml.load(StringIO(text), cache=cache) == expected
+
+    assert (cache.hits, cache.misses, len(cache)) == (2, 1, 1)
+
+
+def test_cache_keys_include_decoder_options():
+    cache = ParseCache()
+
+    pureyaml.loads(text, cache=cache)
+    pureyaml.loads(text, cache=cache, build='python')
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 2)
+
+
+def test_cache_deepcopy_mode_hands_out_copies():
+    cache = ParseCache()
+
+    pureyaml.loads(text, cache=cache)['flags']['regions'].append('ap')
+
+    assert pureyaml.loads(text, cache=cache) == expected
+
+
+def test_cache_immutable_mode_shares_read_only_results():
+    cache = ParseCache(mode='immutable')
+
+    obj = pureyaml.loads(text, cache=cache)
+
+    assert obj is pureyaml.loads(text, cache=cache)
+    assert obj == expected
+    with raises(TypeError):
+        obj['flags']['beta'] = False
+    with raises(TypeError):
+        obj['flags']['regions'].append('ap')
+    with raises(TypeError):
+        obj['flags'] |= {'beta': False}
+
+
+def test_cache_immutable_mode_rejects_decoder_hooks():
+    cache = ParseCache(mode='immutable')
+
+    with raises(ValueError):
+        pureyaml.loads(u'- a: 1\n', cache=cache, sequence_hook=tuple)
+    with raises(ValueError):
+        pureyaml.loads(text, cache=cache, object_pairs_hook=OrderedDict)
+
+
+def test_cache_deepcopy_mode_hands_out_copies_of_hook_results():
+    cache = ParseCache()
+
+    pureyaml.loads(u'- a: 1\n', cache=cache, sequence_hook=tuple)[0]['a'] = 999
+
+    assert pureyaml.loads(u'- a: 1\n', cache=cache, sequence_hook=tuple) == ({'a': 1},)
+
+
+def test_frozen_results_copy_to_plain_objects():
+    obj = deepcopy(freeze(expected))
+    obj['flags']['regions'].append('ap')
+
+    assert type(obj) is dict
+    assert type(obj['flags']['regions']) is list
+
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = ParseCache(max_entries=2)
+
+    pureyaml.loads(u'a\n', cache=cache)
+    pureyaml.loads(u'b\n', cache=cache)
+    pureyaml.loads(u'a\n', cache=cache)
+    pureyaml.loads(u'c\n', cache=cache)
+    pureyaml.loads(u'a\n', cache=cache)
+
+    assert (cache.hits, cache.misses, len(cache)) == (2, 3, 2)
+
+
+def test_cache_counts_bytes_once_across_threads():
+    cache = ParseCache(max_bytes=len(text))
+    threads = [threading.Thread(target=pureyaml.loads, args=(text,), kwargs={'cache': cache}) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (cache.size, len(cache), cache.hits + cache.misses) == (len(text), 1, 8)
+
+
+def test_cache_evicts_past_max_bytes():
+    cache = ParseCache(max_entries=None, max_bytes=10)
+
+    for i in range(5):
+        pureyaml.loads(u'key: %d\n' % i, cache=cache)
+
+    assert (len(cache), cache.size) == (1, 7)
+
+
+def test_cache_rejects_unknown_modes():
+    with raises(ValueError):
+        ParseCache(mode='shared')
+
+
+def test_path_cache_skips_parsing_unchanged_files(tmpdir, monkeypatch):
+    path, cache_dir = tmpdir.join('flags.yaml'), tmpdir.join('cache')
+    path.write_binary(text.encode('utf-8'))
+
+    assert pureyaml.load_path(str(path), cache_dir=str(cache_dir)) == expected
+    assert len(cache_dir.listdir()) == 1
+
+    def fail(*_):
+        raise AssertionError('parsed a cached file')
+
+    monkeypatch.setattr(pureyaml.YAMLDecoder, 'decode', fail)
+
+    assert pureyaml.load_path(str(path), cache_dir=str(cache_dir)) == expected
+
+
+def test_path_cache_rebuilds_changed_files(tmpdir):
+    path, cache_dir = tmpdir.join('flags.yaml'), tmpdir.join('cache')
+    path.write_binary(text.encode('utf-8'))
+    pureyaml.load_path(str(path), cache_dir=str(cache_dir))
+
+    path.write_binary(b'flags: [off]\n')
+
+    assert pureyaml.load_path(str(path), cache_dir=str(cache_dir)) == {'flags': ['off']}
+
+
+def test_path_cache_rebuilds_corrupt_entries(tmpdir):
+    path, cache_dir = tmpdir.join('flags.yaml'), tmpdir.join('cache')
+    path.write_binary(text.encode('utf-8'))
+    pureyaml.load_path(str(path), cache_dir=str(cache_dir))
+
+    cache_dir.listdir()[0].write_binary(b'garbage')
+
+    assert pureyaml.load_path(str(path), cache_dir=str(cache_dir)) == expected
+
+
+def test_path_cache_rebuilds_entries_naming_missing_classes(tmpdir):
+    path, cache_dir = tmpdir.join('flags.yaml'), tmpdir.join('cache')
+    path.write_binary(text.encode('utf-8'))
+    pureyaml.load_path(str(path), cache_dir=str(cache_dir))
+
+    entry = cache_dir.listdir()[0]
+    with entry.open('rb') as f:
+        header = pickle.load(f)
+    entry.write_binary(pickle.dumps(header) + b'cmissing_module\nGone\n(tR.')
+
+    assert pureyaml.load_path(str(path), cache_dir=str(cache_dir)) == expected
+
+
+def test_path_cache_rejects_lazy_results(tmpdir):
+    path = tmpdir.join('flags.yaml')
+    path.write_binary(text.encode('utf-8'))
+
+    with raises(ValueError):
+        pureyaml.load_path(str(path), cache_dir=str(tmpdir.join('cache')), lazy=True)
+
+
+def test_path_cache_keys_include_decoder_options(tmpdir):
+    path, cache_dir = tmpdir.join('flags.yaml'), tmpdir.join('cache')
+    path.write_binary(text.encode('utf-8'))
+
+    pureyaml.load_path(str(path), cache_dir=str(cache_dir))
+    pureyaml.load_path(str(path), cache_dir=str(cache_dir), build='python')
+
+    assert len(cache_dir.listdir()) == 2
+
+
+def test_path_cache_names_hook_entries_by_qualified_name(tmpdir):
+    path, cache_dir = tmpdir.join('flags.yaml'), tmpdir.join('cache')
+    path.write_binary(text.encode('utf-8'))
+    cache = PathCache(str(cache_dir))
+
+    entry = cache.entry_path(str(path), YAMLDecoder, {'object_pairs_hook': OrderedDict, 'sequence_hook': tuple})
+    assert entry == cache.entry_path(str(path), YAMLDecoder, {'object_pairs_hook': OrderedDict, 'sequence_hook': tuple})
+
+    assert pureyaml.load_path(str(path), cache_dir=str(cache_dir), sequence_hook=tuple) == pureyaml.load_path(
+        str(path), cache_dir=str(cache_dir), sequence_hook=tuple)
+    assert len(cache_dir.listdir()) == 1
+
+
+def test_path_cache_skips_entries_for_unnamed_hooks(tmpdir):
+    path, cache_dir = tmpdir.join('flags.yaml'), tmpdir.join('cache')
+    path.write_binary(text.encode('utf-8'))
+
+    obj = pureyaml.load_path(str(path), cache_dir=str(cache_dir), sequence_hook=lambda items: tuple(items))
+
+    assert obj['flags']['regions'] == ('us', 'eu')
+    assert not cache_dir.check()
+
+
+def test_path_cache_skips_entries_for_local_decoders(tmpdir):
+    path, cache_dir = tmpdir.join('flags.yaml'), tmpdir.join('cache')
+    path.write_binary(u'a: 1\n'.encode('utf-8'))
+
+    def decoder(prefix):
+        class PrefixDecoder(YAMLDecoder):
+            def visit_Int(self, node):
+                return prefix + str(node.value)
+
+        return PrefixDecoder
+
+    assert pureyaml.load_path(str(path), cache_dir=str(cache_dir), cls=decoder('x')) == {'a': 'x1'}
+    assert pureyaml.load_path(str(path), cache_dir=str(cache_dir), cls=decoder('y')) == {'a': 'y1'}
+    assert not cache_dir.check()
+
+
+def test_path_cache_reads_universal_newlines(tmpdir):
+    path, cache_dir = tmpdir.join('flags.yaml'), tmpdir.join('cache')
+    path.write_binary(text.replace(u'\n', u'\r\n').encode('utf-8'))
+
+    assert pureyaml.load_path(str(path), cache_dir=str(cache_dir)) == expected
+    assert pureyaml.load_path(str(path), cache_dir=str(cache_dir)) == expected
+
+
+def test_path_cache_keeps_shared_results_read_only(tmpdir):
+    path, cache_dir = tmpdir.join('flags.yaml'), tmpdir.join('cache')
+    path.write_binary(u'- [us, eu]\n- [us, eu]\n'.encode('utf-8'))
+
+    cold = pureyaml.load_path(str(path), cache_dir=str(cache_dir), share_identical=True)
+    warm = pureyaml.load_path(str(path), cache_dir=str(cache_dir), share_identical=True)
+
+    assert warm == cold
+    assert type(warm) is type(cold)
+    assert warm[0] is warm[1]
+    with raises(TypeError):
+        warm[0].append('ap')
+
+
+def test_frozen_results_pickle_read_only():
+    obj = pickle.loads(pickle.dumps(freeze(expected), pickle.HIGHEST_PROTOCOL))
+
+    assert obj == expected
+    with raises(TypeError):
+        obj['flags']['regions'].append('ap')
@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 # coding=utf-8
+from io import StringIO
 from textwrap import dedent
 
 import yaml as pyyaml
-from pytest import mark
+from future.utils import PY2
+from pytest import mark, raises
 
 import pureyaml
+from pureyaml._compat import OrderedDict
 from pureyaml.nodes import *  # noqa
 from pureyaml.parser import YAMLParser
 from tests.utils import MultiTestCaseBase, serialize_nodes
@@ -1710,6 +1713,145 @@ def test_pureyaml_load(case):
     assert obj == expected
 
 
+@mark.parametrize('case', DecoderTestCase.keys('pureyaml'))
+def test_pureyaml_load_python_build(case):
+    text, expected = DecoderTestCase.get('pureyaml', case)
+    obj = pureyaml.load(text, build='python')
+
+    assert obj == expected
+
+
+@mark.parametrize('case', DecoderTestCase.keys('pureyaml'))
+def test_interned_loads_matches_loads(case):
+    text, expected = DecoderTestCase.get('pureyaml', case)
+
+    assert pureyaml.loads(text, intern_keys=True, intern_values=True) == expected
+
+
+@mark.parametrize('cls', [pureyaml.YAMLDecoder, pureyaml.FastDecoder])
+def test_interned_loads_shares_keys(cls):
+    text = ''.join('- name: item%d\n  kind: web\n' % i for i in range(3))
+    first, _, third = pureyaml.loads(text, cls=cls, intern_keys=True)
+
+    assert sorted(first)[1] is sorted(third)[1]
+
+
+def test_interned_loads_shares_short_values():
+    text = ''.join('- kind: web\n  note: %s\n' % ('x' * 40) for _ in range(2))
+    first, second = pureyaml.loads(text, intern_values=True)
+
+    assert first['kind'] is second['kind']
+    assert first['note'] is not second['note']
+
+
+def test_lazy_interned_loads_shares_keys():
+    first, second = pureyaml.loads('- name: a\n- name: b\n', lazy=True, intern_keys=True)
+
+    assert list(first)[0] is list(second)[0]
+
+
+def test_interned_loads_needs_node_tree():
+    with raises(ValueError):
+        pureyaml.loads('a: 1', intern_keys=True, build='python')
+
+
+@mark.parametrize('cls', [pureyaml.YAMLDecoder, pureyaml.FastDecoder])
+def test_loads_hooks_build_final_containers(cls):
+    text = dedent("""
+        b:
+          - 1
+          - [2, 3]
+        a:
+          d: x
+          c: y
+    """)[1:]
+
+    obj = pureyaml.loads(text, cls=cls, object_pairs_hook=OrderedDict, sequence_hook=tuple)
+
+    assert obj == OrderedDict([('b', (1, (2, 3))), ('a', OrderedDict([('d', 'x'), ('c', 'y')]))])
+    assert list(obj) == ['b', 'a']
+    assert list(obj['a']) == ['d', 'c']
+    assert isinstance(obj['a'], OrderedDict)
+
+
+@mark.parametrize('cls', [pureyaml.YAMLDecoder, pureyaml.FastDecoder])
+def test_loads_object_hook(cls):
+    obj = pureyaml.loads('- a: 1\n- b: {c: 2}\n', cls=cls, object_hook=lambda _map: sorted(_map.items()))
+
+    assert obj == [[('a', 1)], [('b', [('c', 2)])]]
+
+
+@mark.parametrize('cls', [pureyaml.YAMLDecoder, pureyaml.FastDecoder])
+def test_loads_pairs_hook_takes_precedence(cls):
+    obj = pureyaml.loads('a: 1\na: 2\n', cls=cls, object_hook=dict, object_pairs_hook=list)
+
+    assert obj == [('a', 1), ('a', 2)]
+
+
+def test_load_hooks_from_file_object():
+    obj = pureyaml.load(StringIO(u'a: [1, 2]\n'), object_pairs_hook=OrderedDict, sequence_hook=tuple)
+
+    assert obj == OrderedDict([('a', (1, 2))])
+
+
+@mark.parametrize('options', [{'lazy': True}, {'share_identical': True}, {'build': 'python'}])
+def test_loads_hooks_need_eager_node_tree(options):
+    with raises(ValueError):
+        pureyaml.loads('a: 1', sequence_hook=tuple, **options)
+
+
+@mark.parametrize('case', DecoderTestCase.keys('pureyaml'))
+def test_fast_decoder_load(case):
+    text, expected = DecoderTestCase.get('pureyaml', case)
+
+    assert pureyaml.load(text, cls=pureyaml.FastDecoder) == expected
+
+
+@mark.parametrize('case', DecoderTestCase.keys('sanity'))
+def test_fast_decoder_matches_decoder(case):
+    text, _ = DecoderTestCase.get('sanity', case)
+
+    assert pureyaml.load(text, cls=pureyaml.FastDecoder) == pureyaml.load(text)
+
+
+def test_fast_decoder_handles_deep_nesting():
+    node = Str('leaf')
+    for depth in range(5000):
+        node = Sequence(Map((Str('depth'), node)))
+
+    obj = pureyaml.FastDecoder().visit(Docs(Doc(node)))
+    for _ in range(5000):
+        obj = obj[0]['depth']
+
+    assert obj == 'leaf'
+
+
+def test_fast_decoder_keeps_visit_overrides():
+    class Tagged(pureyaml.FastDecoder):
+        def visit_Str(self, node):
+            return node.value.upper()
+
+        def visit_Sequence(self, node):
+            items = yield super(Tagged, self).visit_Sequence(node)
+            yield tuple(items)
+
+    assert pureyaml.loads('a: [b, c]\n', cls=Tagged) == {'A': ('B', 'C')}
+
+
+@mark.parametrize('options', [{'lazy': True}, {'share_identical': True}])
+def test_fast_decoder_falls_back_for_lazy_and_shared(options):
+    text = 'a: [1, 2]\nb: {c: d}\n'
+
+    assert pureyaml.loads(text, cls=pureyaml.FastDecoder, **options) == pureyaml.loads(text)
+
+
+@mark.parametrize('case', DecoderTestCase.keys('sanity'))
+def test_python_build_matches_nodes_build(case):
+    text, _ = DecoderTestCase.get('sanity', case)
+
+    assert pureyaml.load(text, build='python') == pureyaml.load(text, build='nodes')
+
+
 @mark.parametrize('case', DecoderTestCase.keys('pyyaml'))
 def test_pyyaml_load(case):
     text, expected = DecoderTestCase.get('pyyaml', case)
@@ -1752,3 +1894,108 @@ def test_sanity_sorted(case):
     obj2 = pureyaml.load(_text)
     # print(obj2)
     assert obj1 == obj2
+
+
+@mark.parametrize('mmap', [False, True])
+def test_pureyaml_load_path(tmpdir, mmap):
+    text = u'name: café\nitems: [1, 2.5, "three"]\n'
+    path = tmpdir.join('doc.yaml')
+    path.write_binary(text.encode('utf-8'))
+
+    assert pureyaml.load_path(str(path), mmap=mmap) == pureyaml.loads(text)
+
+
+@mark.parametrize('mmap', [False, True])
+@mark.parametrize('newline', [u'\r\n', u'\r'])
+def test_pureyaml_load_path_universal_newlines(tmpdir, mmap, newline):
+    text = u'name: café\nitems: [1, 2.5, "three"]\n'
+    path = tmpdir.join('doc.yaml')
+    path.write_binary(text.replace(u'\n', newline).encode('utf-8'))
+
+    assert pureyaml.load_path(str(path), mmap=mmap) == pureyaml.loads(text)
+
+
+@mark.parametrize('case', DecoderTestCase.keys('pureyaml'))
+def test_lazy_loads_matches_loads(case):
+    text, expected = DecoderTestCase.get('pureyaml', case)
+
+    assert pureyaml.loads(text, lazy=True) == expected
+
+
+def test_lazy_loads_decodes_on_access():
+    text = dedent("""
+        small: [1, 2]
+        large:
+          - a: 1
+          - b: 2
+    """)[1:]
+    obj = pureyaml.loads(text, lazy=True)
+
+    assert isinstance(obj, pureyaml.LazyMap)
+    assert sorted(obj) == ['large', 'small']
+    assert obj.values == {}
+
+    assert obj['small'][1] == 2
+    assert list(obj.values) == ['small']
+    assert obj['small'] is obj['small']
+
+    assert obj['large'][::-1] == [{'b': 2}, {'a': 1}]
+
+
+def test_lazy_loads_needs_node_tree():
+    with raises(ValueError):
+        pureyaml.loads('a: 1', lazy=True, build='python')
+
+
+@mark.parametrize('case', DecoderTestCase.keys('pureyaml'))
+def test_shared_loads_matches_loads(case):
+    text, expected = DecoderTestCase.get('pureyaml', case)
+
+    assert pureyaml.loads(text, share_identical=True) == expected
+
+
+def test_shared_loads_shares_identical_subtrees():
+    text = dedent("""
+        web1:
+          port: 80
+          tags: [a, b]
+        web2:
+          port: 80
+          tags: [a, b]
+        db:
+          port: 5432
+          tags: [a, b]
+    """)[1:]
+    obj = pureyaml.loads(text, share_identical=True)
+
+    assert obj['web1'] is obj['web2']
+    assert obj['web1'] is not obj['db']
+    assert obj['web1']['tags'] is obj['db']['tags']
+
+    with raises(TypeError):
+        obj['web1']['port'] = 8080
+
+
+@mark.skipif(PY2, reason='Python 2 dicts are unordered')
+def test_shared_loads_keeps_document_order():
+    text = dedent("""
+        a:
+          m: {x: 1, y: 2}
+        b:
+          m: {y: 2, x: 1}
+        c:
+          m: {x: 1, y: 2}
+    """)[1:]
+    obj = pureyaml.loads(text, share_identical=True)
+
+    assert list(obj['a']['m']) == ['x', 'y']
+    assert list(obj['b']['m']) == ['y', 'x']
+    assert obj['a'] is obj['c']
+    assert obj['a'] is not obj['b']
+
+
+def test_shared_loads_needs_eager_node_tree():
+    with raises(ValueError):
+        pureyaml.loads('a: 1', share_identical=True, build='python')
+    with raises(ValueError):
+        pureyaml.loads('a: 1', share_identical=True, lazy=True)
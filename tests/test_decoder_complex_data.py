@@ -7,16 +7,19 @@ from __future__ import absolute_import
 
 from textwrap import dedent
 
+from pytest import mark
+
 import pureyaml
 from tests.utils import test_dir
 
 
-def load(text):
-    obj = pureyaml.load(text)
+def load(text, cls=None):
+    obj = pureyaml.load(text, cls=cls)
     return obj
 
 
-def test_travis_yml():
+@mark.parametrize('cls', [None, pureyaml.FastDecoder])
+def test_travis_yml(cls):
     # noinspection SpellCheckingInspection
     secure_block = (  # :off
         'ndFpfTvPZN8SfvduvS4567k1TqYl7L7lRxxEPjmRzg3OgzMgCHRMO/uCrce5i8TkxTWL'
@@ -93,12 +96,12 @@ def test_travis_yml():
         }
     }  # :on
 
-    actual = load(text)
+    actual = load(text, cls)
     assert actual == expected
 
     travis_yml = test_dir('assets', '.travis.yml')
 
     with open(travis_yml) as f:
-        actual = pureyaml.load(f)
+        actual = pureyaml.load(f, cls=cls)
 
     assert actual == expected
@@ -346,6 +346,13 @@ def test_pureyaml_load(case):
     assert obj == expected
 
 
+@mark.parametrize('case', DecoderWikiSpecs.keys('pureyaml'))
+def test_fast_decoder_load(case):
+    text, expected = DecoderWikiSpecs.get('pureyaml', case)
+
+    assert pureyaml.load(text, cls=pureyaml.FastDecoder) == expected
+
+
 @mark.parametrize('case', DecoderWikiSpecs.keys('pyyaml'))
 def test_pyyaml_load(case):
     text, expected = DecoderWikiSpecs.get('pyyaml', case)
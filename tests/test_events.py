@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from io import StringIO
+from itertools import islice
+from textwrap import dedent
+
+from pytest import mark, raises
+
+import pureyaml
+from pureyaml.event import *  # noqa
+from pureyaml.exceptions import YAMLUnknownSyntaxError
+from tests.test_decoder import DecoderTestCase
+
+
+def build(events):
+    """Rebuild python objects from events, last document wins like ``loads``."""
+    stack, doc = [], None
+    for event in events:
+        if isinstance(event, DocumentEnd):
+            doc, stack = stack.pop(), []
+        elif not isinstance(event, DocumentStart):
+            take(stack, event)
+
+    return doc
+
+
+def take(stack, event):
+    """Open a collection, or add a value to the innermost one."""
+    if isinstance(event, (MappingStart, SequenceStart)):
+        stack.append(([], isinstance(event, MappingStart)))
+        return
+
+    value = close(stack) if isinstance(event, (MappingEnd, SequenceEnd)) else event.value
+    if stack:
+        stack[-1][0].append(value)
+    else:
+        stack.append(value)
+
+
+def close(stack):
+    items, is_map = stack.pop()
+    return dict(zip(items[::2], items[1::2])) if is_map else items
+
+
+@mark.parametrize('case', DecoderTestCase.keys('pureyaml'))
+def test_events_agree_with_loads(case):
+    text, expected = DecoderTestCase.get('pureyaml', case)
+
+    assert build(pureyaml.events(text)) == expected
+
+
+@mark.parametrize('case', DecoderTestCase.keys('sanity'))
+def test_events_agree_with_loads_sanity(case):
+    text, _ = DecoderTestCase.get('sanity', case)
+
+    assert build(pureyaml.events(text)) == pureyaml.loads(text)
+
+
+def test_events_for_documents():
+    text = dedent("""
+        ---
+        a: 1
+        b: [x, 2.5]
+        ...
+        ---
+        - !!str 1
+        - ~
+    """)[1:]
+
+    assert list(pureyaml.events(text)) == [  # :off
+        DocumentStart(),
+        MappingStart(),
+        Scalar('a', 'str'), Scalar(1, 'int'),
+        Scalar('b', 'str'), SequenceStart(), Scalar('x', 'str'), Scalar(2.5, 'float'), SequenceEnd(),
+        MappingEnd(),
+        DocumentEnd(),
+        DocumentStart(),
+        SequenceStart(),
+        Scalar('1', 'str'),
+        Scalar(None, 'null'),
+        SequenceEnd(),
+        DocumentEnd(),
+    ]  # :on
+
+
+def test_events_from_file_object():
+    events = pureyaml.events(StringIO(u'- a\n- b\n'))
+
+    assert list(events) == [  # :off
+        DocumentStart(), SequenceStart(), Scalar('a', 'str'), Scalar('b', 'str'), SequenceEnd(), DocumentEnd()
+    ]  # :on
+
+
+def test_root_collection_items_stream_before_the_end():
+    text = ''.join('- name: item%d\n  port: %d\n' % (i, i) for i in range(100)) + '- [unclosed, flow\n'
+
+    first_item = list(islice(pureyaml.events(text), 8))
+
+    assert first_item == [  # :off
+        DocumentStart(),
+        SequenceStart(),
+        MappingStart(), Scalar('name', 'str'), Scalar('item0', 'str'), Scalar('port', 'str'), Scalar(0, 'int'),
+        MappingEnd(),
+    ]  # :on
+
+    with raises(YAMLUnknownSyntaxError):
+        list(pureyaml.events(text))
+
+
+def test_documents_stream_before_the_end():
+    text = '---\nfirst\n...\n---\n- [unclosed, flow\n'
+
+    assert list(islice(pureyaml.events(text), 3)) == [DocumentStart(), Scalar('first', 'str'), DocumentEnd()]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from io import StringIO
+from itertools import islice
+from textwrap import dedent
+
+from pytest import mark, raises
+
+import pureyaml
+from pureyaml.decoder import YAMLDecoder
+from pureyaml.exceptions import YAMLSyntaxError, YAMLUnknownSyntaxError
+from pureyaml.parser import iter_document_texts
+from pureyaml.pool import MIN_POOL_BATCH, close_pools, get_pool
+
+text = dedent("""
+    # leading comment
+    ---
+    a: 1
+    b: [x, 2.5]
+    ...
+    ---
+    - !!str 1
+    - ~
+    --- scalar
+    ---
+    c:
+      d: true
+""")[1:]
+
+expected = [{'a': 1, 'b': ['x', 2.5]}, ['1', None], 'scalar', {'c': {'d': True}}]
+
+
+@mark.parametrize('build', ['nodes', 'python'])
+def test_loads_all(build):
+    assert list(pureyaml.loads_all(text, build=build)) == expected
+
+
+@mark.parametrize('build', ['nodes', 'python'])
+def test_load_all_from_file_object(build):
+    assert list(pureyaml.load_all(StringIO(text), build=build)) == expected
+
+
+def test_loads_all_last_document_matches_loads():
+    assert list(pureyaml.loads_all(text))[-1] == pureyaml.loads(text)
+
+
+def test_loads_all_rejects_non_strings():
+    with raises(TypeError):
+        pureyaml.loads_all(StringIO(text))
+
+
+def test_load_all_yields_before_reading_the_rest():
+    def lines():
+        yield u'---\n'
+        yield u'first\n'
+        yield u'---\n'
+        raise AssertionError('read past the first document')
+
+    assert next(pureyaml.load_all(lines())) == 'first'
+
+
+def test_loads_all_yields_before_the_end():
+    broken = '---\nfirst\n...\n---\n- [unclosed, flow\n'
+
+    assert list(islice(pureyaml.loads_all(broken), 1)) == ['first']
+
+    with raises(YAMLUnknownSyntaxError):
+        list(pureyaml.loads_all(broken))
+
+
+def test_iter_document_texts():
+    documents = list(iter_document_texts(StringIO(text)))
+
+    assert documents == [  # :off
+        '---\na: 1\nb: [x, 2.5]\n...\n',
+        '---\n- !!str 1\n- ~\n',
+        '--- scalar\n',
+        '---\nc:\n  d: true\n',
+    ]  # :on
+
+
+def test_iter_document_texts_skips_empty_documents():
+    assert list(iter_document_texts(['---\n', '---\n', 'a\n'])) == ['---\na\n']
+    assert list(iter_document_texts(['# only\n', '\n', '...\n', '# comments\n'])) == []
+
+
+@mark.parametrize('build', ['nodes', 'python'])
+def test_load_all_with_workers(build):
+    documents = u''.join(u'---\nid: %d\nitems: [a, %d]\n' % (i, i) for i in range(50))
+
+    assert list(pureyaml.load_all(StringIO(documents), workers=2, build=build)) == \
+        list(pureyaml.load_all(StringIO(documents), build=build))
+
+
+def test_load_all_with_workers_raises_syntax_errors():
+    with raises(YAMLUnknownSyntaxError):
+        list(pureyaml.load_all(StringIO(u'---\nfirst\n---\n- [unclosed, flow\n'), workers=2))
+
+
+def test_load_all_with_workers_raises_pickled_syntax_errors():
+    with raises(YAMLSyntaxError) as excinfo:
+        list(pureyaml.load_all(StringIO(u'a: b\n  c: d\n'), workers=1))
+
+    assert 'unexpected' in str(excinfo.value)
+
+
+class UpperDecoder(YAMLDecoder):
+    def visit_Str(self, node):
+        return node.value.upper()
+
+
+@mark.parametrize('workers', [None, 2])
+def test_loads_many(workers):
+    texts = [u'id: %d\nname: item%d\n' % (i, i) for i in range(MIN_POOL_BATCH)]
+
+    assert pureyaml.loads_many(texts, workers=workers, chunksize=8) == [pureyaml.loads(text) for text in texts]
+
+
+@mark.parametrize('workers', [None, 2])
+def test_loads_many_returns_errors_in_place(workers):
+    texts = [u'- ok\n', u'a: b\n  c: d\n'] * (MIN_POOL_BATCH // 2)
+
+    results = pureyaml.loads_many(texts, workers=workers)
+
+    assert results[::2] == [['ok']] * (MIN_POOL_BATCH // 2)
+    assert all(isinstance(result, YAMLSyntaxError) for result in results[1::2])
+
+
+@mark.parametrize('workers', [None, 2])
+def test_loads_many_uses_decoder_class(workers):
+    texts = [u'- a\n- b\n'] * MIN_POOL_BATCH
+
+    assert pureyaml.loads_many(texts, workers=workers, cls=UpperDecoder) == [['A', 'B']] * MIN_POOL_BATCH
+
+
+def test_loads_many_keeps_pools_warm():
+    texts = [u'- a\n'] * MIN_POOL_BATCH
+    pureyaml.loads_many(texts, workers=2)
+
+    assert get_pool(2, YAMLDecoder, {}) is get_pool(2, YAMLDecoder, {})
+
+    close_pools()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from future.utils import PY2
+from pytest import mark, raises
+
+from pureyaml.exceptions import YAMLCastTypeError
+from pureyaml.nodes import *  # noqa
+
+
+@mark.parametrize('node', [Null(None), Str('a'), Int('1'), Float('1.5'), Bool('yes'), Binary(b'YQ==')])
+def test_scalars_have_no_instance_dict(node):
+    assert not hasattr(node, '__dict__')
+
+
+@mark.parametrize('node', [Null(None), Str('a'), Int('1'), Float('1.5'), Bool('yes'), Binary(b'YQ==')])
+def test_scalars_have_no_hash_slot(node):
+    hash(node)
+
+    assert not hasattr(node, '_hash')
+
+
+# note: Python 2 collection ABCs don't define ``__slots__``, instances get a ``__dict__`` anyway.
+@mark.skipif(PY2, reason='Python 2 collection ABCs have no __slots__')
+@mark.parametrize('node', [Sequence(Str('a')), Map((Str('a'), Int(1))), Doc(Str('a')), Docs(Doc(Str('a')))])
+def test_collections_have_no_instance_dict(node):
+    assert not hasattr(node, '__dict__')
+
+
+def test_scalars_keep_raw_value():
+    assert Int('0x1F', base=16).raw_value == '0x1F'
+    assert Int('0x1F', base=16).value == 31
+
+
+def test_collection_raw_value_is_value():
+    node = Sequence(Str('a'), Str('b'))
+
+    assert node.raw_value is node.value
+
+
+def test_collections_iterate_more_than_once():
+    node = Sequence(Str('a'), Str('b'))
+
+    assert list(node) == list(node) == [Str('a'), Str('b')]
+
+
+def test_collection_iterators_are_independent():
+    node = Sequence(Str('a'), Str('b'), Str('c'))
+    outer, inner = iter(node), iter(node)
+
+    assert [(a, list(inner)) for a in outer][0] == (Str('a'), [Str('a'), Str('b'), Str('c')])
+    assert [(a, b) for a in node for b in node][-1] == (Str('c'), Str('c'))
+
+
+def test_maps_iterate_keys_more_than_once():
+    node = Map((Str('a'), Int(1)), (Str('b'), Int(2)))
+
+    assert list(node) == list(node) == [Str('a'), Str('b')]
+    assert [(k, node[k]) for k in node] == [(Str('a'), Int(1)), (Str('b'), Int(2))]
+    assert list(node.items()) == list(node.items())
+
+
+def test_map_lookup_by_key():
+    node = Map(*[(Str('key%d' % i), Int(i)) for i in range(1000)])
+
+    assert node[Str('key999')] == Int(999)
+    assert Str('key0') in node
+    assert Str('missing') not in node
+    assert Int(0) not in node
+    with raises(KeyError):
+        node[Str('missing')]
+
+
+def test_map_lookup_keeps_first_duplicate():
+    node = Map((Str('a'), Int(1)), (Str('b'), Int(2)), (Str('a'), Int(3)))
+
+    assert node[Str('a')] == Int(1)
+    assert list(node) == [Str('a'), Str('b'), Str('a')]
+
+
+def test_map_lookup_of_complex_keys():
+    key = Sequence(Str('a'), Str('b'))
+    node = Map((Str('a'), Int(1)), (key, Int(2)))
+
+    assert node[Sequence(Str('a'), Str('b'))] == Int(2)
+    assert Sequence(Str('a')) not in node
+
+
+def test_equal_trees_hash_equal():
+    def tree():
+        return Docs(Doc(Map((Str('a'), Sequence(Int('1'), Float('2.5'))), (Str('b'), Null(None)))))
+
+    assert tree() == tree()
+    assert hash(tree()) == hash(tree())
+    assert len({tree(), tree()}) == 1
+
+
+def test_map_hash_ignores_pair_order():
+    a = Map((Str('a'), Int(1)), (Str('b'), Int(2)))
+    b = Map((Str('b'), Int(2)), (Str('a'), Int(1)))
+
+    assert a == b
+    assert hash(a) == hash(b)
+
+
+def test_map_equality_counts_duplicate_pairs():
+    a = Map((Str('a'), Int(1)), (Str('a'), Int(1)), (Str('b'), Int(2)))
+    b = Map((Str('a'), Int(1)), (Str('b'), Int(2)), (Str('b'), Int(2)))
+
+    assert a != b
+
+
+def test_hash_is_cached():
+    node = Sequence(*[Map((Str('key'), Int(i))) for i in range(100)])
+    hash(node)
+
+    assert all(hasattr(child, '_hash') for child in node)
+    assert node._hash == hash(node)
+
+
+def test_nodes_of_different_types_are_not_equal():
+    assert Str('1') != Int('1')
+    assert Sequence(Str('a')) != Doc(Str('a'))
+    assert Str('a') != 'a'
+
+
+def test_nan_nodes_are_equal():
+    assert Float('nan') == Float('.NaN')
+    assert hash(Float('nan')) == hash(Float('.NaN'))
+
+
+def test_nodes_as_dict_keys():
+    lookup = {Map((Str('a'), Int(1))): 'map', Sequence(Str('a')): 'sequence', Str('a'): 'str'}
+
+    assert lookup[Map((Str('a'), Int(1)))] == 'map'
+    assert lookup[Sequence(Str('a'))] == 'sequence'
+    assert lookup[Str('a')] == 'str'
+
+
+class ScalarCounter(NodeVisitor):
+    def visit_Sequence(self, node):
+        total = 0
+        for item in node.value:
+            total += (yield item)
+        yield total
+
+    def visit_Scalar(self, node):
+        return 1
+
+    def visit_Str(self, node):
+        return 10
+
+
+class Upper(Str):
+    __slots__ = ()
+
+
+def test_visitor_falls_back_along_node_mro():
+    node = Sequence(Str('a'), Upper('b'), Int(1), Null(None))
+
+    assert ScalarCounter().visit(node) == 22
+
+
+def test_visitor_subclasses_get_their_own_dispatch_table():
+    class StrCounter(ScalarCounter):
+        def visit_Str(self, node):
+            return 100
+
+    ScalarCounter().visit(Sequence(Str('a')))
+
+    assert StrCounter().visit(Sequence(Str('a'))) == 100
+    assert ScalarCounter.dispatch_table() is not StrCounter.dispatch_table()
+
+
+def test_visitor_without_method_uses_generic_visit():
+    with raises(RuntimeError):
+        ScalarCounter().visit(Map((Str('a'), Int(1))))
+
+
+@mark.parametrize('value', [  # :off
+    'nginx', 'name', 'e', 'eth0', '~', 'null', 'Null', 'nullable', 'n', 'no', 'No', 'nope', 'yes', 'yesterday',
+    'true', 'True', 'truest', 'false', 'falsey', 'f', '0', '-', '-1', '+1', '1.5', '.5', '.inf', '-.Inf', '.nan',
+    '0x1F', '0o17', '1e3', '1.0.0', '-name', 'ñ', '10.0.0.1', 'foo\n bar: invalid', '? foo\n bar : baz',
+    'nginx server\nname', '1.5\nx', 'null\n',
+])  # :on
+def test_scalar_dispatch_fast_paths_agree_with_regex(value):
+    ScalarDispatch.reset_memo()
+    match = ScalarDispatch.re_dispatch.match(value.strip())
+
+    # Guard, the regex rejects it
+    if match is None:
+        with raises(YAMLCastTypeError):
+            ScalarDispatch(value)
+        return
+
+    expected = ScalarDispatch.map[match.lastgroup](value)
+
+    assert ScalarDispatch(value) == expected
+    assert ScalarDispatch(value) == expected
+
+
+def test_scalar_dispatch_memo_is_bounded():
+    ScalarDispatch.reset_memo()
+    for i in range(ScalarDispatch.memo_max_entries * 2):
+        ScalarDispatch(str(i))
+
+    assert len(ScalarDispatch.memo) <= ScalarDispatch.memo_max_entries
+    assert ScalarDispatch('123456789') == Int(123456789)
+    assert '123456789' not in ScalarDispatch.memo
+
+
+def test_scalar_dispatch_memo_keeps_seed_and_recent_values():
+    ScalarDispatch.reset_memo()
+    for i in range(ScalarDispatch.memo_max_entries * 2):
+        ScalarDispatch(str(i))
+
+    assert all(value in ScalarDispatch.memo for value in ScalarDispatch.memo_seed)
+    assert str(ScalarDispatch.memo_max_entries * 2 - 1) in ScalarDispatch.memo
+    assert ScalarDispatch('~') == Null('~')
+    assert ScalarDispatch('Yes') == Bool('Yes')
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from io import StringIO
+from textwrap import dedent
+
+from pytest import mark
+
+import pureyaml
+from pureyaml.nodes import *  # noqa
+from pureyaml.parser import ChunkedLexer, MappedFile, YAMLLexer, YAMLParser
+from tests.utils import yaml_org_examples
+
+
+def test_parser_tables_are_built_once():
+    assert YAMLParser().parser is YAMLParser().parser
+
+
+def test_parser_tables_are_cached_per_options():
+    assert YAMLParser().parser is not YAMLParser(debug=True).parser
+
+
+def test_clear_cache_rebuilds_parser():
+    parser = YAMLParser().parser
+    YAMLParser.clear_cache()
+
+    assert YAMLParser().parser is not parser
+
+
+def test_cached_lexer_is_a_fresh_clone():
+    lexer_a, lexer_b = YAMLLexer.cached(), YAMLLexer.cached()
+
+    assert lexer_a is not lexer_b
+    assert lexer_a.lexmodule is not lexer_b.lexmodule
+    assert lexer_a.lexmodule.indent_stack == [1]
+
+
+def test_reset_lexer_clears_state():
+    lexer = YAMLLexer.cached()
+    lexer.input('a:\n  b:\n    c')
+    while lexer.token():
+        pass
+
+    YAMLLexer.reset_lexer(lexer)
+
+    assert lexer.lexmodule.indent_stack == [1]
+    assert lexer.lexstatestack == []
+    assert lexer.current_state() == 'INITIAL'
+
+
+def test_cached_parser_handles_consecutive_documents():
+    text = dedent("""
+        a:
+          b:
+            c: 1
+    """)[1:]
+    expected = Docs(Doc(Map((Str('a'), Map((Str('b'), Map((Str('c'), Int(1)))))))))
+
+    assert YAMLParser().parse(text) == expected
+    assert YAMLParser().parse(text) == expected
+
+
+def test_cached_lexer_matches_built_lexer():
+    text = '- !!float 123\n- "quoted"\n- [a, b]\n'
+
+    def tokens(lexer):
+        lexer.input(text)
+        return [(token.type, token.value) for token in iter(lexer.token, None)]
+
+    assert tokens(YAMLLexer.cached()) == tokens(YAMLLexer.build())
+
+
+def test_long_collections_keep_document_order():
+    size = 1000
+    sequence_text = ''.join('- item%d\n' % i for i in range(size))
+    map_text = ''.join('key%d: %d\n' % (i, i) for i in range(size))
+    flow_text = '[%s]\n' % ', '.join('item%d' % i for i in range(size))
+
+    expected_sequence = Sequence(*[Str('item%d' % i) for i in range(size)])
+    expected_map = Map(*[(Str('key%d' % i), Int(i)) for i in range(size)])
+
+    assert YAMLParser().parse(sequence_text) == Docs(Doc(expected_sequence))
+    assert YAMLParser().parse(map_text) == Docs(Doc(expected_map))
+    assert YAMLParser().parse(flow_text) == Docs(Doc(expected_sequence))
+
+
+def test_long_block_scalars():
+    size = 1000
+    lines = ['line %d' % i for i in range(size)]
+    block = ''.join('  %s\n' % line for line in lines)
+
+    literal = YAMLParser().parse('block: |\n%safter: value\n' % block)
+    folded = YAMLParser().parse('block: >\n%safter: value\n' % block)
+
+    assert literal == Docs(Doc(Map((Str('block'), Str('\n'.join(lines) + '\n')), (Str('after'), Str('value')))))
+    assert folded == Docs(Doc(Map((Str('block'), Str(' '.join(lines) + '\n')), (Str('after'), Str('value')))))
+
+
+@mark.parametrize('name,text', list(yaml_org_examples()))
+def test_strict_and_production_parsers_agree(name, text):
+    def parse(parser):
+        try:
+            return parser.parse(text)
+        except Exception as e:
+            return type(e)
+
+    assert parse(YAMLParser(strict=False)) == parse(YAMLParser(strict=True))
+
+
+def test_production_parser_skips_strict_wrappers():
+    strict_parser, production_parser = YAMLParser(strict=True).parser, YAMLParser(strict=False).parser
+
+    strict_actions = [production.callable for production in strict_parser.productions if production.callable]
+    production_actions = [production.callable for production in production_parser.productions if production.callable]
+
+    assert any(hasattr(action, '__wrapped__') for action in strict_actions)
+    assert not any(hasattr(action, '__wrapped__') for action in production_actions)
+
+
+@mark.parametrize('chunk_size', [1, 2, 7, 64])
+@mark.parametrize('name,text', list(yaml_org_examples()))
+def test_chunked_lexer_matches_string_lexer(name, text, chunk_size):
+    def tokens(lexer, data):
+        lexer.input(data)
+        try:
+            return [(token.type, token.value) for token in iter(lexer.token, None)]
+        except Exception as e:
+            return type(e)
+
+    chunked_lexer = ChunkedLexer(YAMLLexer.cached(), chunk_size=chunk_size)
+
+    assert tokens(chunked_lexer, StringIO(text)) == tokens(YAMLLexer.cached(), text)
+
+
+def test_chunked_lexer_keeps_a_bounded_window():
+    text = u''.join(u'- name: item%d\n  tags: [a, "b c"]\n  note: |\n    line %d\n' % (i, i) for i in range(500))
+    lexer = ChunkedLexer(YAMLLexer.cached(), chunk_size=64)
+    lexer.input(StringIO(text))
+
+    window_sizes = [len(lexer.lexer.lexdata) for _ in iter(lexer.token, None)]
+
+    assert max(window_sizes) < 256
+    assert pureyaml.load(StringIO(text)) == pureyaml.loads(text)
+
+
+def test_chunked_lexer_reads_quoted_scalars_across_chunks():
+    text = u'key: "first line\n  second line"\nflow: [a,\n  b]\n'
+
+    assert YAMLParser().parse(StringIO(text), lexer=ChunkedLexer(YAMLLexer.cached(), chunk_size=3)) == \
+        YAMLParser().parse(text)
+
+
+def test_mapped_file_decodes_split_characters(tmpdir):
+    text = u'key: café ☃\n'
+    path = tmpdir.join('doc.yaml')
+    path.write_binary(text.encode('utf-8'))
+
+    with MappedFile(str(path)) as fp:
+        chunks = list(iter(lambda: fp.read(1), u''))
+
+    assert u''.join(chunks) == text
+
+
+def test_mapped_file_translates_split_newlines(tmpdir):
+    path = tmpdir.join('doc.yaml')
+    path.write_binary(b'a: 1\r\nb: 2\rc: 3\r')
+
+    with MappedFile(str(path)) as fp:
+        chunks = list(iter(lambda: fp.read(1), u''))
+
+    assert u''.join(chunks) == u'a: 1\nb: 2\nc: 3\n'
+
+
+def test_mapped_file_reads_empty_files(tmpdir):
+    path = tmpdir.join('empty.yaml')
+    path.write_binary(b'')
+
+    with MappedFile(str(path)) as fp:
+        assert fp.read() == u''
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+from io import StringIO
+from textwrap import dedent
+
+from pytest import mark, raises
+
+import pureyaml
+from pureyaml.exceptions import YAMLUnknownSyntaxError
+from pureyaml.query import parse_path
+
+manifest = dedent("""
+    apiVersion: v1
+    kind: Pod
+    metadata:
+      name: web
+      labels: {app: web, tier: frontend}
+    spec:
+      ports:
+        80: http
+      containers:
+        - name: app
+          image: nginx:1.9
+          args: [--port, 8080]
+        - name: sidecar
+          image: envoy
+    ---
+    kind: Service
+""")[1:]
+
+
+@mark.parametrize('path,expected', [  # :off
+    ('kind', 'Pod'),
+    ('metadata.name', 'web'),
+    ('metadata.labels.tier', 'frontend'),
+    ('spec.containers[0].image', 'nginx:1.9'),
+    ('spec.containers[0].args[1]', 8080),
+    ('spec.containers[1]', {'name': 'sidecar', 'image': 'envoy'}),
+    ('spec.ports.80', 'http'),
+])  # :on
+def test_select(path, expected):
+    assert pureyaml.select(manifest, path) == expected
+
+
+def test_select_from_file_object():
+    assert pureyaml.select(StringIO(manifest), 'metadata.labels') == {'app': 'web', 'tier': 'frontend'}
+
+
+@mark.parametrize('path', ['spec.containers[2].image', 'metadata.missing', 'kind.name', 'metadata[0]'])
+def test_select_missing_path(path):
+    with raises(KeyError):
+        pureyaml.select(manifest, path)
+
+
+def test_select_many():
+    paths = ['kind', 'spec.containers[1].name', 'metadata.missing', 'metadata.name']
+
+    assert pureyaml.select_many(manifest, paths) == {  # :off
+        'kind': 'Pod',
+        'spec.containers[1].name': 'sidecar',
+        'metadata.name': 'web',
+    }  # :on
+
+
+@mark.parametrize('paths,expected', [  # :off
+    (['b', 'b.c'], {'b': {'c': [1, 2]}, 'b.c': [1, 2]}),
+    (['b.c', 'b.c[1]'], {'b.c': [1, 2], 'b.c[1]': 2}),
+    (['b.c[1]', 'b'], {'b': {'c': [1, 2]}, 'b.c[1]': 2}),
+    (['b', 'b.missing', 'b.c[5]', 'b.c.d'], {'b': {'c': [1, 2]}}),
+])  # :on
+def test_select_many_nested_paths(paths, expected):
+    assert pureyaml.select_many('b:\n  c: [1, 2]\n', paths) == expected
+
+
+def test_select_stops_parsing_once_found():
+    text = 'name: first\nitems:\n  - [unclosed, flow\n'
+
+    assert pureyaml.select_many(text, ['name']) == {'name': 'first'}
+
+    with raises(YAMLUnknownSyntaxError):
+        pureyaml.select_many(text, ['name', 'missing'])
+
+
+@mark.parametrize('path,expected', [  # :off
+    ('', ()),
+    ('a', ('a',)),
+    ('a.b[0].c', ('a', 'b', 0, 'c')),
+    ('[1][2].x', (1, 2, 'x')),
+])  # :on
+def test_parse_path(path, expected):
+    assert parse_path(path) == expected
+
+
+@mark.parametrize('path', ['.a', 'a..b', 'a[x]', 'a[0]b'])
+def test_parse_path_rejects_bad_syntax(path):
+    with raises(ValueError):
+        parse_path(path)
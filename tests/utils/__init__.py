@@ -30,6 +30,7 @@ from .multi_test_case import MultiTestCaseBase  # noqa
 from .node_diff import get_node_diff  # noqa
 from .parametrized_tests_data import ParametrizedTestData  # noqa
 from .serialize_nodes import serialize_nodes  # noqa
+from .yaml_org_corpus import yaml_org_examples  # noqa
 
 __all__ = [  # :off
         'test_dir',
@@ -46,5 +47,6 @@ __all__ = [  # :off
         'get_node_diff',
         'ParametrizedTestData',
         'serialize_nodes',
-        'MultiTestCaseBase'
+        'MultiTestCaseBase',
+        'yaml_org_examples'
     ]  # :on
@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# coding=utf-8
+from __future__ import absolute_import
+
+import ast
+from textwrap import dedent
+
+from tests.utils import test_dir
+
+
+def yaml_org_examples():
+    """Yield ``(name, text)`` for every example used by ``test_yaml_org_examples.py``."""
+    filename = test_dir('test_yaml_org_examples.py')
+    with open(filename) as f:
+        module = ast.parse(f.read(), filename)
+
+    for function in module.body:
+        if not isinstance(function, ast.FunctionDef):
+            continue
+
+        for statement in function.body:
+            # Guard, only ``text = ...`` assignments
+            if not isinstance(statement, ast.Assign):
+                continue
+            if [getattr(target, 'id', None) for target in statement.targets] != ['text']:
+                continue
+
+            expression = compile(ast.Expression(statement.value), filename, 'eval')
+            yield function.name, eval(expression, {'dedent': dedent})